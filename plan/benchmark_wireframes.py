@@ -0,0 +1,160 @@
+"""Benchmark wireframe generation
+
+For every page spec and for synthetic pages of 10k-1M elements this
+reports plan build time, serialization time, peak traced memory and output
+size. Results can be saved as a baseline JSON, and later runs compared
+against it; any regression beyond the tolerance exits non-zero.
+
+    python benchmark_wireframes.py --save-baseline benchmark-baseline.json
+    python benchmark_wireframes.py --baseline benchmark-baseline.json
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from wireframe_engine import compile_page, write_plan
+from wireframe_specs import PAGE_SPECS
+
+DEFAULT_SIZES = '10000,100000,1000000'
+
+# Metrics compared against the baseline; sizes must not grow at all
+TIMED_METRICS = ('build_ms', 'serialize_ms', 'peak_kib')
+EXACT_METRICS = ('output_bytes',)
+
+
+class CountingSink:
+    """Writable that only counts what is written to it"""
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, text):
+        self.size += len(text.encode('utf-8'))
+
+
+def synthetic_spec(elements):
+    """A dashboard-like page with roughly ``elements`` SVG elements
+
+    Rows of ten buttons (a rect and a label each) are stacked down an
+    ever-taller canvas.
+    """
+    per_row = 10
+    rows = max(elements // (2 * per_row), 1)
+    return {
+        'name': f'synthetic-{elements}',
+        'width': 1200,
+        'height': 60 * rows + 100,
+        'components': [
+            {'type': 'button_row', 'x': 20, 'y': 40 + 60 * row, 'step': 115,
+             'width': 100, 'height': 40, 'buttons': [
+                 {'label': f'Bug {row * per_row + i}', 'color': '#007bff' if i % 2 else '#28a745'}
+                 for i in range(per_row)
+             ]}
+            for row in range(rows)
+        ]
+    }
+
+
+def measure(spec, repeat=3, instanced=False):
+    """Best-of-``repeat`` timings plus peak memory and output size"""
+    build = serial = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        plan = compile_page(spec, instanced)
+        build = min(build, time.perf_counter() - start)
+        elements = len(plan[2]) + len(plan[3])
+        sink = CountingSink()
+        start = time.perf_counter()
+        write_plan(plan, sink)
+        serial = min(serial, time.perf_counter() - start)
+        del plan
+
+    # Memory is traced in a separate pass because tracing slows everything down
+    gc.collect()
+    tracemalloc.start()
+    write_plan(compile_page(spec, instanced), CountingSink())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'elements': elements,
+        'build_ms': round(build * 1000, 3),
+        'serialize_ms': round(serial * 1000, 3),
+        'peak_kib': round(peak / 1024, 1),
+        'output_bytes': sink.size,
+    }
+
+
+def run(sizes, repeat=3, instanced=False):
+    results = {}
+    cases = [(spec['name'], spec, repeat) for spec in PAGE_SPECS]
+    for size in sizes:
+        # Fewer repeats for the largest pages keeps the suite a few seconds long
+        cases.append((f'synthetic-{size}', synthetic_spec(size), max(1, repeat * 10000 // size)))
+    for name, spec, times in cases:
+        results[name] = result = measure(spec, times, instanced)
+        print(f"{name:28} {result['elements']:>9,} el  build {result['build_ms']:>10.3f} ms  "
+              f"serialize {result['serialize_ms']:>10.3f} ms  peak {result['peak_kib']:>10.1f} KiB  "
+              f"{result['output_bytes']:>12,} B")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Messages for every metric that regressed against ``baseline``"""
+    regressions = []
+    for name, old in baseline.items():
+        new = results.get(name)
+        if new is None:
+            continue
+        for metric in TIMED_METRICS:
+            if new[metric] > old[metric] * (1 + tolerance):
+                regressions.append(f'{name}: {metric} {old[metric]} -> {new[metric]} '
+                                   f'(+{(new[metric] / old[metric] - 1):.0%})')
+        for metric in EXACT_METRICS:
+            if new[metric] > old[metric]:
+                regressions.append(f'{name}: {metric} {old[metric]} -> {new[metric]}')
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark wireframe generation')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help='comma separated element counts for synthetic pages')
+    parser.add_argument('--repeat', type=int, default=3, help='timing runs per page (best is kept)')
+    parser.add_argument('--instanced', action='store_true', help='benchmark <defs>/<use> output')
+    parser.add_argument('--baseline', metavar='FILE', help='fail if results regress against this baseline')
+    parser.add_argument('--save-baseline', metavar='FILE', help='write the results as a new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown/memory growth as a fraction (default 0.25)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the benchmarks and compare against a baseline"""
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    results = run(sizes, args.repeat, args.instanced)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}:", file=sys.stderr)
+            for message in regressions:
+                print(f"  REGRESSION {message}", file=sys.stderr)
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""A small bitmap font for the rasterizer
+
+Glyphs are drawn on a grid seven cells tall from the cap height down to
+the baseline, with two more rows for descenders; lowercase letters are
+five cells tall. Widths vary from one to seven cells. The rasterizer
+scales a cell to the font size and centres each glyph in the character's
+Helvetica advance width, so labels line up exactly where the generator's
+text metrics put them. Being bundled, the font renders the same on every
+machine, and no font library is needed.
+"""
+
+CAP_ROWS = 7
+
+# Rows from the cap height down, '#' for an inked cell
+_GLYPHS = {
+    'A': '.###. #...# #...# ##### #...# #...# #...#',
+    'B': '####. #...# #...# ####. #...# #...# ####.',
+    'C': '.###. #...# #.... #.... #.... #...# .###.',
+    'D': '####. #...# #...# #...# #...# #...# ####.',
+    'E': '##### #.... #.... ####. #.... #.... #####',
+    'F': '##### #.... #.... ####. #.... #.... #....',
+    'G': '.###. #...# #.... #.### #...# #...# .####',
+    'H': '#...# #...# #...# ##### #...# #...# #...#',
+    'I': '### .#. .#. .#. .#. .#. ###',
+    'J': '..### ...#. ...#. ...#. ...#. #..#. .##..',
+    'K': '#...# #..#. #.#.. ##... #.#.. #..#. #...#',
+    'L': '#.... #.... #.... #.... #.... #.... #####',
+    'M': '#...# ##.## #.#.# #.#.# #...# #...# #...#',
+    'N': '#...# #...# ##..# #.#.# #..## #...# #...#',
+    'O': '.###. #...# #...# #...# #...# #...# .###.',
+    'P': '####. #...# #...# ####. #.... #.... #....',
+    'Q': '.###. #...# #...# #...# #.#.# #..#. .##.#',
+    'R': '####. #...# #...# ####. #.#.. #..#. #...#',
+    'S': '.#### #.... #.... .###. ....# ....# ####.',
+    'T': '##### ..#.. ..#.. ..#.. ..#.. ..#.. ..#..',
+    'U': '#...# #...# #...# #...# #...# #...# .###.',
+    'V': '#...# #...# #...# #...# #...# .#.#. ..#..',
+    'W': '#...# #...# #...# #.#.# #.#.# #.#.# .#.#.',
+    'X': '#...# #...# .#.#. ..#.. .#.#. #...# #...#',
+    'Y': '#...# #...# .#.#. ..#.. ..#.. ..#.. ..#..',
+    'Z': '##### ....# ...#. ..#.. .#... #.... #####',
+    'a': '..... ..... .###. ....# .#### #...# .####',
+    'b': '#.... #.... #.##. ##..# #...# #...# ####.',
+    'c': '..... ..... .###. #.... #.... #...# .###.',
+    'd': '....# ....# .##.# #..## #...# #...# .####',
+    'e': '..... ..... .###. #...# ##### #.... .###.',
+    'f': '..## .#.. .#.. ###. .#.. .#.. .#..',
+    'g': '..... ..... .#### #...# #...# #...# .#### ....# .###.',
+    'h': '#.... #.... #.##. ##..# #...# #...# #...#',
+    'i': '# . # # # # #',
+    'j': '..# ... ..# ..# ..# ..# ..# #.# .#.',
+    'k': '#... #... #..# #.#. ##.. #.#. #..#',
+    'l': '# # # # # # #',
+    'm': '..... ..... ##.#. #.#.# #.#.# #.#.# #.#.#',
+    'n': '..... ..... #.##. ##..# #...# #...# #...#',
+    'o': '..... ..... .###. #...# #...# #...# .###.',
+    'p': '..... ..... ####. #...# #...# #...# ####. #.... #....',
+    'q': '..... ..... .#### #...# #...# #...# .#### ....# ....#',
+    'r': '..... ..... #.##. ##..# #.... #.... #....',
+    's': '..... ..... .#### #.... .###. ....# ####.',
+    't': '.#.. .#.. ###. .#.. .#.. .#.# ..#.',
+    'u': '..... ..... #...# #...# #...# #..## .##.#',
+    'v': '..... ..... #...# #...# #...# .#.#. ..#..',
+    'w': '..... ..... #...# #...# #.#.# #.#.# .#.#.',
+    'x': '..... ..... #...# .#.#. ..#.. .#.#. #...#',
+    'y': '..... ..... #...# #...# #...# #...# .#### ....# .###.',
+    'z': '..... ..... ##### ...#. ..#.. .#... #####',
+    '0': '.###. #...# #..## #.#.# ##..# #...# .###.',
+    '1': '.#. ##. .#. .#. .#. .#. ###',
+    '2': '.###. #...# ....# ...#. ..#.. .#... #####',
+    '3': '####. ....# ....# .###. ....# ....# ####.',
+    '4': '...#. ..##. .#.#. #..#. ##### ...#. ...#.',
+    '5': '##### #.... ####. ....# ....# #...# .###.',
+    '6': '..##. .#... #.... ####. #...# #...# .###.',
+    '7': '##### ....# ...#. ..#.. .#... .#... .#...',
+    '8': '.###. #...# #...# .###. #...# #...# .###.',
+    '9': '.###. #...# #...# .#### ....# ...#. .##..',
+    '!': '# # # # # . #',
+    '"': '#.# #.# ... ... ... ... ...',
+    '#': '.#.#. .#.#. ##### .#.#. ##### .#.#. .#.#.',
+    '$': '..#.. .#### #.#.. .###. ..#.# ####. ..#..',
+    '%': '##..# ##..# ...#. ..#.. .#... #..## #..##',
+    '&': '.##.. #..#. #.#.. .#... #.#.# #..#. .##.#',
+    "'": '# # . . . . .',
+    '(': '..# .#. #.. #.. #.. .#. ..#',
+    ')': '#.. .#. ..# ..# ..# .#. #..',
+    '*': '..... ..#.. #.#.# .###. #.#.# ..#.. .....',
+    '+': '..... ..#.. ..#.. ##### ..#.. ..#.. .....',
+    ',': '.. .. .. .. .. .# .# #.',
+    '-': '.... .... .... #### .... .... ....',
+    '.': '. . . . . . #',
+    '/': '....# ....# ...#. ..#.. .#... #.... #....',
+    ':': '. . # . . # .',
+    ';': '.. .. .# .. .. .# #.',
+    '<': '...# ..#. .#.. #... .#.. ..#. ...#',
+    '=': '..... ..... ##### ..... ##### ..... .....',
+    '>': '#... .#.. ..#. ...# ..#. .#.. #...',
+    '?': '.###. #...# ....# ...#. ..#.. ..... ..#..',
+    '@': '.###. #...# #.### #.#.# #.### #.... .####',
+    '[': '### #.. #.. #.. #.. #.. ###',
+    '\\': '#.... #.... .#... ..#.. ...#. ....# ....#',
+    ']': '### ..# ..# ..# ..# ..# ###',
+    '^': '..#.. .#.#. #...# ..... ..... ..... .....',
+    '_': '..... ..... ..... ..... ..... ..... #####',
+    '`': '#. .# .. .. .. .. ..',
+    '{': '..# .#. .#. #.. .#. .#. ..#',
+    '|': '# # # # # # # # #',
+    '}': '#.. .#. .#. ..# .#. .#. #..',
+    '~': '..... ..... .#... #.#.# ...#. ..... .....',
+    '©': '.#####. #.....# #..##.# #.#...# #..##.# #.....# .#####.',
+    '←': '..... ..#.. .#... ##### .#... ..#.. .....',
+    '→': '..... ..#.. ...#. ##### ...#. ..#.. .....',
+    '•': '... ... .#. ### .#. ... ...',
+    '…': '..... ..... ..... ..... ..... ..... #.#.#',
+    # Icons of the public site pages
+    '☰': '..... ##### ..... ##### ..... ##### .....',
+    '✓': '....# ...#. ...#. #.#.. #.#.. .#... .....',
+    '○': '..... .###. #...# #...# #...# .###. .....',
+    '\U0001f441': '....... ..###.. .#...#. #..#..# .#...#. ..###.. .......',
+    '\U0001f512': '.###. #...# #...# ##### ##.## ##.## #####',
+    '\U0001f41e': '#...# .###. ##### #.#.# ##### #.#.# .###.',
+    '\U0001f465': '.#...#. #.#.#.# .#...#. ....... ###.### ###.### .......',
+    '\U0001f4ca': '......# ......# ...#..# ...#..# #..#..# #..#..# #######',
+    '\U0001f50d': '.###.. #...#. #...#. #...#. .###.. ....#. .....#',
+    '\U0001f4bb': '####### #.....# #.....# #.....# ####### ....... #######',
+}
+
+# Drawn for characters the font does not cover
+_MISSING = '##### #...# #...# #...# #...# #...# #####'
+
+
+def _runs(rows):
+    """(width, [(row, first column, last column + 1)]) of a glyph's ink"""
+    rows = rows.split()
+    runs = []
+    for y, row in enumerate(rows):
+        start = None
+        for x, cell in enumerate(row + '.'):
+            if cell == '#' and start is None:
+                start = x
+            elif cell != '#' and start is not None:
+                runs.append((y, start, x))
+                start = None
+    return len(rows[0]), runs
+
+
+GLYPHS = {char: _runs(rows) for char, rows in _GLYPHS.items()}
+MISSING = _runs(_MISSING)
+
+
+def glyph(char):
+    """(width in cells, horizontal runs of ink) for ``char``; None for whitespace"""
+    if char.isspace():
+        return None
+    return GLYPHS.get(char, MISSING)
@@ -0,0 +1,93 @@
+"""Paginated bug-list wireframes
+
+Bug records are streamed from their file and turned into table rows one
+at a time; only the current window of rows is held while its page is
+rendered, so a 500k-bug report becomes many small SVGs instead of one
+giant document.
+"""
+import copy
+import os
+import time
+from contextlib import nullcontext
+from itertools import islice
+
+from dashboard_data import find_data_files, iter_records
+from output_writer import FileWriter
+from wireframe_engine import spool_page
+
+ROWS_PER_PAGE = 18
+TABLES_DIR = 'tables'
+
+
+def user_names(records):
+    """Map user ids to display names"""
+    names = {}
+    for user in records:
+        full_name = f"{user.get('firstName', '')} {user.get('lastName', '')}".strip()
+        names[user.get('_id')] = full_name or user.get('username') or user.get('_id')
+    return names
+
+
+def table_rows(bugs, names=None, assigned_only=False):
+    """Yield one table row per bug record"""
+    names = names or {}
+    for index, bug in enumerate(bugs, 1):
+        assigned_to = bug.get('assignedTo')
+        if assigned_only and not assigned_to:
+            continue
+        yield {
+            'id': f'#{index:03d}',
+            'title': bug.get('title', ''),
+            'status': bug.get('status', 'open'),
+            'priority': bug.get('priority', 'medium'),
+            'assignedTo': names.get(assigned_to, assigned_to) or 'Unassigned',
+            'created': (bug.get('createdAt') or '')[:10],
+        }
+
+
+def paginate(rows, per_page=ROWS_PER_PAGE):
+    """Yield successive lists of at most ``per_page`` rows from an iterator"""
+    rows = iter(rows)
+    while True:
+        window = list(islice(rows, per_page))
+        if not window:
+            return
+        yield window
+
+
+def table_page(spec, window, page_number, first_row):
+    """Copy of ``spec`` whose table shows ``window``"""
+    page = copy.copy(spec)
+    page['components'] = [copy.copy(c) for c in spec['components']]
+    for c in page['components']:
+        if c['type'] == 'bug_table':
+            c['rows'] = window
+            c['caption'] = f'Page {page_number} | Bugs {first_row}-{first_row + len(window) - 1}'
+    return page
+
+
+def write_table_pages(spec, rows, per_page=ROWS_PER_PAGE, writer=None, out_dir=TABLES_DIR, **options):
+    """Write one SVG per window of rows into ``out_dir``, yielding (filename, seconds)
+
+    Each page streams into a spool file that ``writer`` (by default a
+    FileWriter of its own) commits, so the next window is rendered while
+    the last one is written.
+    """
+    first_row = 1
+    with FileWriter() if writer is None else nullcontext(writer) as out:
+        directory = out.spool_dir(os.path.join(out_dir, spec['name']))
+        for page_number, window in enumerate(paginate(rows, per_page), 1):
+            filename = os.path.join(out_dir, f"{spec['name']}-wireframe-p{page_number:05d}.svg")
+            start = time.perf_counter()
+            page = table_page(spec, window, page_number, first_row)
+            out.commit(spool_page(page, filename, directory, cached=False, **options))
+            yield filename, time.perf_counter() - start
+            first_row += len(window)
+
+
+def rows_for(spec, data_dir):
+    """Stream the table rows a table spec shows from a data directory"""
+    files = find_data_files(data_dir)
+    names = user_names(iter_records(files['users'])) if 'users' in files else {}
+    assigned_only = any(c.get('assigned_only') for c in spec['components'] if c['type'] == 'bug_table')
+    return table_rows(iter_records(files['bugs']), names, assigned_only)
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+
+MANIFEST_FILE = '.wireframes-manifest.json'
+
+# Where a page's bytes come from: the engine, the output filters and the
+# data binding. These and every plan module they import, directly or not,
+# make up the generator code hashed into each page, together with the two
+# modules that drive a build
+RENDER_MODULES = ('wireframe_engine', 'svg_minify', 'dashboard_data')
+BUILD_MODULES = ('create_wireframes', 'build_manifest')
+
+# Page specs are hashed as data, so editing one only invalidates that page
+DATA_MODULES = ('wireframe_specs',)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_RE = re.compile(r'^[ \t]*(?:from[ \t]+(\w+)[\w.]*[ \t]+import|import[ \t]+(\w+))', re.MULTILINE)
+
+
+@lru_cache(maxsize=None)
+def file_digest(path):
+    """SHA-256 of a file's contents"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def module_imports(path):
+    """Top-level names of the modules a source file imports
+
+    A line scan rather than a parse, so imports inside functions count and
+    a file that does not parse yet still has its imports found.
+    """
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return {match.group(1) or match.group(2) for match in IMPORT_RE.finditer(f.read())}
+
+
+@lru_cache(maxsize=None)
+def generator_sources():
+    """File names of the generator code, sorted (see RENDER_MODULES)"""
+    local = {name[:-3] for name in os.listdir(HERE) if name.endswith('.py')}
+    found = set()
+    pending = list(RENDER_MODULES)
+    while pending:
+        name = pending.pop()
+        if name in found or name in DATA_MODULES:
+            continue
+        found.add(name)
+        pending.extend(module_imports(os.path.join(HERE, name + '.py')) & local)
+    return tuple(sorted(name + '.py' for name in found.union(BUILD_MODULES)))
+
+
+def source_digest():
+    """Digest of the generator code shared by all pages"""
+    h = hashlib.sha256()
+    for name in generator_sources():
+        h.update(name.encode())
+        h.update(file_digest(os.path.join(HERE, name)).encode())
+    return h.hexdigest()
+
+
+def page_digest(spec, options=None, theme=None, inputs=()):
+    """Content hash of everything that determines one page's output
+
+    Covers the generator source, the page spec, render options, the theme
+    and the contents of any data files the page is built from.
+    """
+    h = hashlib.sha256()
+    h.update(source_digest().encode())
+    h.update(json.dumps(spec).encode())
+    for part in (options or {}, theme or {}):
+        h.update(json.dumps(part, sort_keys=True).encode())
+    for path in inputs:
+        h.update(os.path.abspath(path).encode())
+        h.update(file_digest(path).encode())
+    return h.hexdigest()
+
+
+class Manifest:
+    """Output filename -> digest of the inputs it was last built from
+
+    Each entry also keeps the size of the file and of its precompressed
+    siblings, so a file that was deleted or replaced is rebuilt.
+    """
+
+    def __init__(self, path=MANIFEST_FILE):
+        # With no path the manifest lives in memory only
+        self.path = path
+        self.entries = {}
+        if path is not None and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def is_current(self, filename, digest):
+        """True if ``filename`` and its siblings exist and were built from ``digest``"""
+        entry = self.entries.get(filename)
+        if entry is None or entry['digest'] != digest:
+            return False
+        sizes = dict(entry.get('siblings', {}), **{filename: entry['size']})
+        try:
+            return all(os.path.getsize(name) == size for name, size in sizes.items())
+        except OSError:
+            return False
+
+    def record(self, filename, digest, size=None, siblings=None):
+        """Record ``filename`` as built from ``digest``
+
+        ``siblings`` maps the names of files written along with it, such
+        as precompressed copies, to their sizes.
+        """
+        if size is None:
+            size = os.path.getsize(filename)
+        self.entries[filename] = {'digest': digest, 'size': size}
+        if siblings:
+            self.entries[filename]['siblings'] = siblings
+
+    def save(self):
+        if self.path is None:
+            return
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
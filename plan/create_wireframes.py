@@ -1,1123 +1,372 @@
-import xml.etree.ElementTree as ET
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 
-def create_admin_wireframe():
+from bug_table import ROWS_PER_PAGE, TABLES_DIR, rows_for, write_table_pages
+from build_manifest import Manifest, page_digest
+from dashboard_data import bind_data, data_inputs, has_metrics, load_stats
+from output_writer import FileWriter, archive_mode, discard, open_writer
+from pdf_export import export_pdf
+from profiling import enable as enable_profiling
+from rasterize import FORMATS, THUMBNAIL_WIDTH, check_formats, rasterize_files
+from svg_minify import COMPRESSIONS, check_compressions
+from text_metrics import cache_report
+from variants import build as build_variants
+from variants import expand, variant_filename, write_index
+from watch import run as watch_pages
+from wireframe_engine import load_spec, render_page, spool_page
+from wireframe_specs import (
+    ADMIN_DASHBOARD,
+    DEVELOPER_DASHBOARD,
+    HOMEPAGE,
+    LOGIN,
+    LOGIN_ERROR,
+    PUBLIC_BUG_REPORT,
+    ROLE_SPECS,
+    SIGNUP,
+    SIGNUP_ERROR,
+    TABLE_SPECS,
+    TESTER_DASHBOARD,
+    THEMES,
+    VIEWPORTS,
+)
+
+
+def create_admin_wireframe(out=None, instanced=None):
     """Create Admin Dashboard Wireframe"""
-    svg = ET.Element('svg', {
-        'width': '1200',
-        'height': '800',
-        'xmlns': 'http://www.w3.org/2000/svg'
-    })
-    
-    # Background
-    ET.SubElement(svg, 'rect', {
-        'width': '1200',
-        'height': '800',
-        'fill': 'white',
-        'stroke': 'none'
-    })
-    
-    # Header
-    ET.SubElement(svg, 'rect', {
-        'x': '0', 'y': '0',
-        'width': '1200', 'height': '60',
-        'fill': '#f8f9fa',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Header Title
-    title = ET.SubElement(svg, 'text', {
-        'x': '20', 'y': '35',
-        'font-family': 'Arial',
-        'font-size': '16',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    title.text = 'Bug Tracker - Admin Dashboard'
-    
-    # User Info Button
-    ET.SubElement(svg, 'rect', {
-        'x': '1050', 'y': '15',
-        'width': '80', 'height': '30',
-        'fill': '#e9ecef',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    user_info = ET.SubElement(svg, 'text', {
-        'x': '1070', 'y': '33',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': 'black'
-    })
-    user_info.text = 'User Info'
-    
-    # Logout Button
-    ET.SubElement(svg, 'rect', {
-        'x': '1140', 'y': '15',
-        'width': '50', 'height': '30',
-        'fill': '#dc3545',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    logout = ET.SubElement(svg, 'text', {
-        'x': '1155', 'y': '33',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': 'white'
-    })
-    logout.text = 'Logout'
-    
-    # Sidebar Navigation
-    ET.SubElement(svg, 'rect', {
-        'x': '0', 'y': '60',
-        'width': '250', 'height': '740',
-        'fill': '#f1f3f4',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    nav_title = ET.SubElement(svg, 'text', {
-        'x': '20', 'y': '90',
-        'font-family': 'Arial',
-        'font-size': '16',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    nav_title.text = 'Navigation'
-    
-    # Navigation Menu Items
-    nav_items = ['Dashboard', 'Bug Management', 'User Management', 'Project Management']
-    for i, item in enumerate(nav_items):
-        y_pos = str(110 + i * 50)
-        fill_color = '#007bff' if i == 0 else '#ffffff'
-        text_color = 'white' if i == 0 else 'black'
-        
-        ET.SubElement(svg, 'rect', {
-            'x': '20', 'y': y_pos,
-            'width': '210', 'height': '40',
-            'fill': fill_color,
-            'stroke': 'black',
-            'stroke-width': '1'
-        })
-        
-        nav_text = ET.SubElement(svg, 'text', {
-            'x': '30', 'y': str(int(y_pos) + 25),
-            'font-family': 'Arial',
-            'font-size': '14',
-            'fill': text_color
-        })
-        nav_text.text = item
-    
-    # Main Content Area
-    ET.SubElement(svg, 'rect', {
-        'x': '250', 'y': '60',
-        'width': '950', 'height': '740',
-        'fill': '#ffffff',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Breadcrumb
-    ET.SubElement(svg, 'rect', {
-        'x': '270', 'y': '80',
-        'width': '910', 'height': '30',
-        'fill': '#f8f9fa',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    breadcrumb = ET.SubElement(svg, 'text', {
-        'x': '280', 'y': '98',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': 'black'
-    })
-    breadcrumb.text = 'Home > Dashboard'
-    
-    # Statistics Overview Title
-    stats_title = ET.SubElement(svg, 'text', {
-        'x': '280', 'y': '140',
-        'font-family': 'Arial',
-        'font-size': '18',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    stats_title.text = 'Statistics Overview'
-    
-    # Statistics Cards
-    card_data = [
-        {'title': 'Total Bugs Count', 'color': '#e3f2fd'},
-        {'title': 'Active Users Count', 'color': '#e8f5e8'},
-        {'title': 'Active Projects Count', 'color': '#fff3e0'}
-    ]
-    
-    for i, card in enumerate(card_data):
-        x_pos = str(280 + i * 300)
-        
-        # Card background
-        ET.SubElement(svg, 'rect', {
-            'x': x_pos, 'y': '160',
-            'width': '280', 'height': '120',
-            'fill': card['color'],
-            'stroke': 'black',
-            'stroke-width': '2'
-        })
-        
-        # Card title
-        card_title = ET.SubElement(svg, 'text', {
-            'x': str(int(x_pos) + 20), 'y': '185',
-            'font-family': 'Arial',
-            'font-size': '14',
-            'font-weight': 'bold',
-            'fill': 'black'
-        })
-        card_title.text = card['title']
-        
-        # Card content area
-        ET.SubElement(svg, 'rect', {
-            'x': str(int(x_pos) + 20), 'y': '200',
-            'width': '240', 'height': '60',
-            'fill': 'white',
-            'stroke': '#ccc',
-            'stroke-width': '1'
-        })
-    
-    # Quick Actions Section Title
-    actions_title = ET.SubElement(svg, 'text', {
-        'x': '280', 'y': '310',
-        'font-family': 'Arial',
-        'font-size': '18',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    actions_title.text = 'Quick Actions'
-    
-    # Quick Actions Container
-    ET.SubElement(svg, 'rect', {
-        'x': '280', 'y': '320',
-        'width': '880', 'height': '200',
-        'fill': '#f8f9fa',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Quick Action Buttons
-    action_buttons = ['Create New User', 'Create New Project', 'View All Bugs']
-    button_colors = ['#28a745', '#17a2b8', '#6f42c1']
-    
-    for i, button in enumerate(action_buttons):
-        x_pos = str(320 + i * 280)
-        
-        ET.SubElement(svg, 'rect', {
-            'x': x_pos, 'y': '380',
-            'width': '200', 'height': '50',
-            'fill': button_colors[i],
-            'stroke': 'black',
-            'stroke-width': '1'
-        })
-        
-        button_text = ET.SubElement(svg, 'text', {
-            'x': str(int(x_pos) + 100), 'y': '408',
-            'font-family': 'Arial',
-            'font-size': '12',
-            'font-weight': 'bold',
-            'fill': 'white',
-            'text-anchor': 'middle'
-        })
-        button_text.text = button
-    
-    return ET.tostring(svg, encoding='unicode')
+    return render_page(ADMIN_DASHBOARD, out, instanced)
+
 
-def create_tester_wireframe():
+def create_tester_wireframe(out=None, instanced=None):
     """Create Tester Dashboard Wireframe"""
-    svg = ET.Element('svg', {
-        'width': '1200',
-        'height': '800',
-        'xmlns': 'http://www.w3.org/2000/svg'
-    })
-    
-    # Background
-    ET.SubElement(svg, 'rect', {
-        'width': '1200',
-        'height': '800',
-        'fill': 'white',
-        'stroke': 'none'
-    })
-    
-    # Header
-    ET.SubElement(svg, 'rect', {
-        'x': '0', 'y': '0',
-        'width': '1200', 'height': '60',
-        'fill': '#f8f9fa',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Header Title
-    title = ET.SubElement(svg, 'text', {
-        'x': '20', 'y': '35',
-        'font-family': 'Arial',
-        'font-size': '16',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    title.text = 'Bug Tracker - Tester Dashboard'
-    
-    # User Info Button
-    ET.SubElement(svg, 'rect', {
-        'x': '1050', 'y': '15',
-        'width': '80', 'height': '30',
-        'fill': '#e9ecef',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    user_info = ET.SubElement(svg, 'text', {
-        'x': '1070', 'y': '33',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': 'black'
-    })
-    user_info.text = 'User Info'
-    
-    # Logout Button
-    ET.SubElement(svg, 'rect', {
-        'x': '1140', 'y': '15',
-        'width': '50', 'height': '30',
-        'fill': '#dc3545',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    logout = ET.SubElement(svg, 'text', {
-        'x': '1155', 'y': '33',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': 'white'
-    })
-    logout.text = 'Logout'
-    
-    # Sidebar Navigation
-    ET.SubElement(svg, 'rect', {
-        'x': '0', 'y': '60',
-        'width': '250', 'height': '740',
-        'fill': '#f1f3f4',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    nav_title = ET.SubElement(svg, 'text', {
-        'x': '20', 'y': '90',
-        'font-family': 'Arial',
-        'font-size': '16',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    nav_title.text = 'Navigation'
-    
-    # Navigation Menu Items
-    nav_items = ['Dashboard', 'Report Bug', 'My Bugs']
-    for i, item in enumerate(nav_items):
-        y_pos = str(110 + i * 50)
-        fill_color = '#007bff' if i == 0 else '#ffffff'
-        text_color = 'white' if i == 0 else 'black'
-        
-        ET.SubElement(svg, 'rect', {
-            'x': '20', 'y': y_pos,
-            'width': '210', 'height': '40',
-            'fill': fill_color,
-            'stroke': 'black',
-            'stroke-width': '1'
-        })
-        
-        nav_text = ET.SubElement(svg, 'text', {
-            'x': '30', 'y': str(int(y_pos) + 25),
-            'font-family': 'Arial',
-            'font-size': '14',
-            'fill': text_color
-        })
-        nav_text.text = item
-    
-    # Main Content Area
-    ET.SubElement(svg, 'rect', {
-        'x': '250', 'y': '60',
-        'width': '950', 'height': '740',
-        'fill': '#ffffff',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Breadcrumb
-    ET.SubElement(svg, 'rect', {
-        'x': '270', 'y': '80',
-        'width': '910', 'height': '30',
-        'fill': '#f8f9fa',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    breadcrumb = ET.SubElement(svg, 'text', {
-        'x': '280', 'y': '98',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': 'black'
-    })
-    breadcrumb.text = 'Home > Dashboard'
-    
-    # Personal Statistics Title
-    stats_title = ET.SubElement(svg, 'text', {
-        'x': '280', 'y': '140',
-        'font-family': 'Arial',
-        'font-size': '18',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    stats_title.text = 'Personal Statistics'
-    
-    # Personal Statistics Cards
-    card_data = [
-        {'title': 'Bugs Reported by Me', 'color': '#e8f5e8'},
-        {'title': 'Bug Status Breakdown', 'color': '#fff3e0'}
-    ]
-    
-    for i, card in enumerate(card_data):
-        x_pos = str(280 + i * 440)
-        
-        # Card background
-        ET.SubElement(svg, 'rect', {
-            'x': x_pos, 'y': '160',
-            'width': '400', 'height': '120',
-            'fill': card['color'],
-            'stroke': 'black',
-            'stroke-width': '2'
-        })
-        
-        # Card title
-        card_title = ET.SubElement(svg, 'text', {
-            'x': str(int(x_pos) + 20), 'y': '185',
-            'font-family': 'Arial',
-            'font-size': '14',
-            'font-weight': 'bold',
-            'fill': 'black'
-        })
-        card_title.text = card['title']
-        
-        # Card content area
-        ET.SubElement(svg, 'rect', {
-            'x': str(int(x_pos) + 20), 'y': '200',
-            'width': '360', 'height': '60',
-            'fill': 'white',
-            'stroke': '#ccc',
-            'stroke-width': '1'
-        })
-    
-    # Quick Actions Section Title
-    actions_title = ET.SubElement(svg, 'text', {
-        'x': '280', 'y': '310',
-        'font-family': 'Arial',
-        'font-size': '18',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    actions_title.text = 'Quick Actions'
-    
-    # Quick Actions Container
-    ET.SubElement(svg, 'rect', {
-        'x': '280', 'y': '320',
-        'width': '880', 'height': '200',
-        'fill': '#f8f9fa',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Quick Action Buttons
-    action_buttons = ['Report New Bug', 'View My Bugs']
-    button_colors = ['#28a745', '#17a2b8']
-    
-    for i, button in enumerate(action_buttons):
-        x_pos = str(400 + i * 300)
-        
-        ET.SubElement(svg, 'rect', {
-            'x': x_pos, 'y': '380',
-            'width': '200', 'height': '50',
-            'fill': button_colors[i],
-            'stroke': 'black',
-            'stroke-width': '1'
-        })
-        
-        button_text = ET.SubElement(svg, 'text', {
-            'x': str(int(x_pos) + 100), 'y': '408',
-            'font-family': 'Arial',
-            'font-size': '12',
-            'font-weight': 'bold',
-            'fill': 'white',
-            'text-anchor': 'middle'
-        })
-        button_text.text = button
-    
-    return ET.tostring(svg, encoding='unicode')
+    return render_page(TESTER_DASHBOARD, out, instanced)
 
-def create_developer_wireframe():
+
+def create_developer_wireframe(out=None, instanced=None):
     """Create Developer Dashboard Wireframe"""
-    svg = ET.Element('svg', {
-        'width': '1200',
-        'height': '800',
-        'xmlns': 'http://www.w3.org/2000/svg'
-    })
-    
-    # Background
-    ET.SubElement(svg, 'rect', {
-        'width': '1200',
-        'height': '800',
-        'fill': 'white',
-        'stroke': 'none'
-    })
-    
-    # Header
-    ET.SubElement(svg, 'rect', {
-        'x': '0', 'y': '0',
-        'width': '1200', 'height': '60',
-        'fill': '#f8f9fa',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Header Title
-    title = ET.SubElement(svg, 'text', {
-        'x': '20', 'y': '35',
-        'font-family': 'Arial',
-        'font-size': '16',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    title.text = 'Bug Tracker - Developer Dashboard'
-    
-    # User Info Button
-    ET.SubElement(svg, 'rect', {
-        'x': '1050', 'y': '15',
-        'width': '80', 'height': '30',
-        'fill': '#e9ecef',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    user_info = ET.SubElement(svg, 'text', {
-        'x': '1070', 'y': '33',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': 'black'
-    })
-    user_info.text = 'User Info'
-    
-    # Logout Button
-    ET.SubElement(svg, 'rect', {
-        'x': '1140', 'y': '15',
-        'width': '50', 'height': '30',
-        'fill': '#dc3545',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    logout = ET.SubElement(svg, 'text', {
-        'x': '1155', 'y': '33',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': 'white'
-    })
-    logout.text = 'Logout'
-    
-    # Sidebar Navigation
-    ET.SubElement(svg, 'rect', {
-        'x': '0', 'y': '60',
-        'width': '250', 'height': '740',
-        'fill': '#f1f3f4',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    nav_title = ET.SubElement(svg, 'text', {
-        'x': '20', 'y': '90',
-        'font-family': 'Arial',
-        'font-size': '16',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    nav_title.text = 'Navigation'
-    
-    # Navigation Menu Items
-    nav_items = ['Dashboard', 'Assigned Bugs', 'Work History']
-    for i, item in enumerate(nav_items):
-        y_pos = str(110 + i * 50)
-        fill_color = '#007bff' if i == 0 else '#ffffff'
-        text_color = 'white' if i == 0 else 'black'
-        
-        ET.SubElement(svg, 'rect', {
-            'x': '20', 'y': y_pos,
-            'width': '210', 'height': '40',
-            'fill': fill_color,
-            'stroke': 'black',
-            'stroke-width': '1'
-        })
-        
-        nav_text = ET.SubElement(svg, 'text', {
-            'x': '30', 'y': str(int(y_pos) + 25),
-            'font-family': 'Arial',
-            'font-size': '14',
-            'fill': text_color
-        })
-        nav_text.text = item
-    
-    # Main Content Area
-    ET.SubElement(svg, 'rect', {
-        'x': '250', 'y': '60',
-        'width': '950', 'height': '740',
-        'fill': '#ffffff',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Breadcrumb
-    ET.SubElement(svg, 'rect', {
-        'x': '270', 'y': '80',
-        'width': '910', 'height': '30',
-        'fill': '#f8f9fa',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    breadcrumb = ET.SubElement(svg, 'text', {
-        'x': '280', 'y': '98',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': 'black'
-    })
-    breadcrumb.text = 'Home > Dashboard'
-    
-    # Work Queue Statistics Title
-    stats_title = ET.SubElement(svg, 'text', {
-        'x': '280', 'y': '140',
-        'font-family': 'Arial',
-        'font-size': '18',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    stats_title.text = 'Work Queue Statistics'
-    
-    # Work Queue Statistics Cards
-    card_data = [
-        {'title': 'Assigned Bugs Count', 'color': '#ffe6e6'},
-        {'title': 'Priority Breakdown', 'color': '#e6f3ff'}
-    ]
-    
-    for i, card in enumerate(card_data):
-        x_pos = str(280 + i * 440)
-        
-        # Card background
-        ET.SubElement(svg, 'rect', {
-            'x': x_pos, 'y': '160',
-            'width': '400', 'height': '120',
-            'fill': card['color'],
-            'stroke': 'black',
-            'stroke-width': '2'
-        })
-        
-        # Card title
-        card_title = ET.SubElement(svg, 'text', {
-            'x': str(int(x_pos) + 20), 'y': '185',
-            'font-family': 'Arial',
-            'font-size': '14',
-            'font-weight': 'bold',
-            'fill': 'black'
-        })
-        card_title.text = card['title']
-        
-        # Card content area
-        ET.SubElement(svg, 'rect', {
-            'x': str(int(x_pos) + 20), 'y': '200',
-            'width': '360', 'height': '60',
-            'fill': 'white',
-            'stroke': '#ccc',
-            'stroke-width': '1'
-        })
-    
-    # Quick Actions Section Title
-    actions_title = ET.SubElement(svg, 'text', {
-        'x': '280', 'y': '310',
-        'font-family': 'Arial',
-        'font-size': '18',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    actions_title.text = 'Quick Actions'
-    
-    # Quick Actions Container
-    ET.SubElement(svg, 'rect', {
-        'x': '280', 'y': '320',
-        'width': '880', 'height': '200',
-        'fill': '#f8f9fa',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Quick Action Buttons
-    action_buttons = ['View Assigned Bugs', 'Update Bug Status']
-    button_colors = ['#fd7e14', '#6f42c1']
-    
-    for i, button in enumerate(action_buttons):
-        x_pos = str(400 + i * 300)
-        
-        ET.SubElement(svg, 'rect', {
-            'x': x_pos, 'y': '380',
-            'width': '200', 'height': '50',
-            'fill': button_colors[i],
-            'stroke': 'black',
-            'stroke-width': '1'
-        })
-        
-        button_text = ET.SubElement(svg, 'text', {
-            'x': str(int(x_pos) + 100), 'y': '408',
-            'font-family': 'Arial',
-            'font-size': '12',
-            'font-weight': 'bold',
-            'fill': 'white',
-            'text-anchor': 'middle'
-        })
-        button_text.text = button
-    
-    # Additional section for current work
-    current_work_title = ET.SubElement(svg, 'text', {
-        'x': '280', 'y': '570',
-        'font-family': 'Arial',
-        'font-size': '18',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    current_work_title.text = 'Current Work'
-    
-    # Current work container
-    ET.SubElement(svg, 'rect', {
-        'x': '280', 'y': '580',
-        'width': '880', 'height': '180',
-        'fill': '#f0f8ff',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Priority indicators
-    priority_colors = ['#dc3545', '#fd7e14', '#ffc107', '#007bff']
-    priority_labels = ['Critical', 'High', 'Medium', 'Low']
-    
-    for i, (color, label) in enumerate(zip(priority_colors, priority_labels)):
-        x_pos = str(320 + i * 200)
-        
-        # Priority indicator
-        ET.SubElement(svg, 'rect', {
-            'x': x_pos, 'y': '620',
-            'width': '150', 'height': '30',
-            'fill': color,
-            'stroke': 'black',
-            'stroke-width': '1'
-        })
-        
-        priority_text = ET.SubElement(svg, 'text', {
-            'x': str(int(x_pos) + 75), 'y': '638',
-            'font-family': 'Arial',
-            'font-size': '12',
-            'font-weight': 'bold',
-            'fill': 'white',
-            'text-anchor': 'middle'
-        })
-        priority_text.text = f'{label} Priority'
-    
-    return ET.tostring(svg, encoding='unicode')
+    return render_page(DEVELOPER_DASHBOARD, out, instanced)
 
-def create_public_bug_report_wireframe():
+
+def create_public_bug_report_wireframe(out=None, instanced=None):
     """Create Public Bug Report Page Wireframe"""
-    svg = ET.Element('svg', {
-        'width': '1200',
-        'height': '900',
-        'xmlns': 'http://www.w3.org/2000/svg'
-    })
-    
-    # Background
-    ET.SubElement(svg, 'rect', {
-        'width': '1200',
-        'height': '900',
-        'fill': 'white',
-        'stroke': 'none'
-    })
-    
-    # Header
-    ET.SubElement(svg, 'rect', {
-        'x': '0', 'y': '0',
-        'width': '1200', 'height': '80',
-        'fill': '#f8f9fa',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Header Title
-    title = ET.SubElement(svg, 'text', {
-        'x': '20', 'y': '35',
-        'font-family': 'Arial',
-        'font-size': '20',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    title.text = 'XYZ Corp Bug Tracker'
-    
-    # Subtitle
-    subtitle = ET.SubElement(svg, 'text', {
-        'x': '20', 'y': '55',
-        'font-family': 'Arial',
-        'font-size': '14',
-        'fill': '#666'
-    })
-    subtitle.text = 'Public Bug Report Form'
-    
-    # Back to Home Button
-    ET.SubElement(svg, 'rect', {
-        'x': '1050', 'y': '25',
-        'width': '120', 'height': '30',
-        'fill': '#6c757d',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    back_btn = ET.SubElement(svg, 'text', {
-        'x': '1110', 'y': '43',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'font-weight': 'bold',
-        'fill': 'white',
-        'text-anchor': 'middle'
-    })
-    back_btn.text = 'Back to Home'
-    
-    # Main Container
-    ET.SubElement(svg, 'rect', {
-        'x': '100', 'y': '120',
-        'width': '1000', 'height': '720',
-        'fill': '#ffffff',
-        'stroke': 'black',
-        'stroke-width': '2'
-    })
-    
-    # Form Title
-    form_title = ET.SubElement(svg, 'text', {
-        'x': '120', 'y': '160',
-        'font-family': 'Arial',
-        'font-size': '24',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    form_title.text = 'Report a Bug'
-    
-    # Form Description
-    form_desc = ET.SubElement(svg, 'text', {
-        'x': '120', 'y': '185',
-        'font-family': 'Arial',
-        'font-size': '14',
-        'fill': '#666'
-    })
-    form_desc.text = 'Help us improve our software by reporting bugs you encounter'
-    
-    # Form Fields Container
-    ET.SubElement(svg, 'rect', {
-        'x': '120', 'y': '210',
-        'width': '960', 'height': '500',
-        'fill': '#f8f9fa',
-        'stroke': '#ddd',
-        'stroke-width': '1'
-    })
-    
-    # Project Selection
-    project_label = ET.SubElement(svg, 'text', {
-        'x': '140', 'y': '240',
-        'font-family': 'Arial',
-        'font-size': '14',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    project_label.text = 'Project *'
-    
-    ET.SubElement(svg, 'rect', {
-        'x': '140', 'y': '250',
-        'width': '400', 'height': '35',
-        'fill': 'white',
-        'stroke': '#ccc',
-        'stroke-width': '1'
-    })
-    
-    project_placeholder = ET.SubElement(svg, 'text', {
-        'x': '150', 'y': '270',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': '#999'
-    })
-    project_placeholder.text = 'Select a project...'
-    
-    # Bug Title
-    title_label = ET.SubElement(svg, 'text', {
-        'x': '580', 'y': '240',
-        'font-family': 'Arial',
-        'font-size': '14',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    title_label.text = 'Bug Title *'
-    
-    ET.SubElement(svg, 'rect', {
-        'x': '580', 'y': '250',
-        'width': '480', 'height': '35',
-        'fill': 'white',
-        'stroke': '#ccc',
-        'stroke-width': '1'
-    })
-    
-    title_placeholder = ET.SubElement(svg, 'text', {
-        'x': '590', 'y': '270',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': '#999'
-    })
-    title_placeholder.text = 'Brief description of the bug...'
-    
-    # Bug Description
-    desc_label = ET.SubElement(svg, 'text', {
-        'x': '140', 'y': '320',
-        'font-family': 'Arial',
-        'font-size': '14',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    desc_label.text = 'Bug Description *'
-    
-    ET.SubElement(svg, 'rect', {
-        'x': '140', 'y': '330',
-        'width': '920', 'height': '100',
-        'fill': 'white',
-        'stroke': '#ccc',
-        'stroke-width': '1'
-    })
-    
-    desc_placeholder = ET.SubElement(svg, 'text', {
-        'x': '150', 'y': '350',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': '#999'
-    })
-    desc_placeholder.text = 'Detailed description of the bug, steps to reproduce, expected vs actual behavior...'
-    
-    # Priority Selection
-    priority_label = ET.SubElement(svg, 'text', {
-        'x': '140', 'y': '470',
-        'font-family': 'Arial',
-        'font-size': '14',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    priority_label.text = 'Priority Level'
-    
-    # Priority Options
-    priority_options = [
-        {'label': 'Low', 'color': '#007bff'},
-        {'label': 'Medium', 'color': '#ffc107'},
-        {'label': 'High', 'color': '#fd7e14'},
-        {'label': 'Critical', 'color': '#dc3545'}
-    ]
-    
-    for i, option in enumerate(priority_options):
-        x_pos = str(140 + i * 220)
-        
-        # Radio button
-        ET.SubElement(svg, 'circle', {
-            'cx': str(int(x_pos) + 10),
-            'cy': '495',
-            'r': '8',
-            'fill': 'white',
-            'stroke': option['color'],
-            'stroke-width': '2'
-        })
+    return render_page(PUBLIC_BUG_REPORT, out, instanced)
+
+
+def create_homepage_wireframe(out=None, instanced=None):
+    """Create Homepage Wireframe"""
+    return render_page(HOMEPAGE, out, instanced)
+
+
+def create_login_wireframe(out=None, instanced=None):
+    """Create Login Page Wireframe"""
+    return render_page(LOGIN, out, instanced)
+
+
+def create_signup_wireframe(out=None, instanced=None):
+    """Create Signup Page Wireframe"""
+    return render_page(SIGNUP, out, instanced)
+
+
+def create_login_error_wireframe(out=None, instanced=None):
+    """Create Login Page Wireframe with its validation error shown"""
+    return render_page(LOGIN_ERROR, out, instanced)
+
+
+def create_signup_error_wireframe(out=None, instanced=None):
+    """Create Signup Page Wireframe with its validation error shown"""
+    return render_page(SIGNUP_ERROR, out, instanced)
+
+
+# Output file and page spec for every generated page, in output order
+PAGES = [
+    ('admin-dashboard-wireframe.svg', ADMIN_DASHBOARD),
+    ('tester-dashboard-wireframe.svg', TESTER_DASHBOARD),
+    ('developer-dashboard-wireframe.svg', DEVELOPER_DASHBOARD),
+    ('public-bug-report-wireframe.svg', PUBLIC_BUG_REPORT),
+    ('homepage-wireframe-complete.svg', HOMEPAGE),
+    ('login-wireframe.svg', LOGIN),
+    ('signup-wireframe.svg', SIGNUP),
+    ('login-error-wireframe.svg', LOGIN_ERROR),
+    ('signup-error-wireframe.svg', SIGNUP_ERROR),
+]
+
+
+def render_files(page, directory='.', **options):
+    """Render one page; return (filename, [(name, path, size)], seconds)
+
+    The page and, with ``compress``, its precompressed siblings are
+    spooled into ``directory`` (see wireframe_engine.spool_page) for a
+    writer to commit, so a worker hands back paths, not documents.
+    """
+    filename, spec = page
+    start = time.perf_counter()
+    files = spool_page(spec, filename, directory, **options)
+    return filename, files, time.perf_counter() - start
+
+
+def sibling_sizes(files):
+    """Name -> size of the precompressed siblings among a page's spooled files"""
+    return {name: size for name, path, size in files[1:]}
+
+
+def generate(pages, writer, jobs=1, **options):
+    """Render every page for ``writer``, spreading them over a process pool when jobs > 1
+
+    Results are yielded in the order of ``pages`` regardless of which
+    worker finishes first. Files of results that are never taken are
+    removed.
+    """
+    directories = [writer.spool_dir(filename) for filename, spec in pages]
+    if jobs <= 1:
+        for page, directory in zip(pages, directories):
+            yield render_files(page, directory, **options)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(partial(render_files, **options), pages, directories)
+        try:
+            yield from results
+        finally:
+            for filename, files, elapsed in results:
+                discard(files)
+
+
+def page_list(spec_paths=()):
+    """(filename, spec) for the built-in pages and every extra spec file"""
+    pages = list(PAGES)
+    for path in spec_paths:
+        spec = load_spec(path)
+        pages.append((f"{spec['name']}-wireframe.svg", spec))
+    return pages
+
+
+def build_pages(pages, manifest, options, output, data=None, columnar=False, force=False, jobs=1,
+                writer=None):
+    """Write the pages whose inputs changed; return (filenames, data inputs, stats)
+
+    A page is rebuilt only if its spec, options, data or the generator code
+    differ from what ``manifest`` recorded for it. ``stats`` is None unless
+    a rebuilt page needed the ``data`` statistics. Files go through
+    ``writer`` (see output_writer), by default atomic writes on a
+    background thread; they are all on disk when this returns.
+    """
+    inputs = data_inputs(data) if data else []
+    digests = {filename: page_digest(spec, {**options, **output}, inputs=inputs if has_metrics(spec) else ())
+               for filename, spec in pages}
+    stale = [page for page in pages
+             if force or not manifest.is_current(page[0], digests[page[0]])]
+    stats = None
+    if data and any(has_metrics(spec) for filename, spec in stale):
+        stats = load_stats(data, columnar=columnar)
+        stale = [(filename, bind_data(spec, stats)) for filename, spec in stale]
+    
+    built = []
+    with FileWriter() if writer is None else nullcontext(writer) as out:
+        for filename, files, elapsed in generate(stale, out, jobs, **options, **output):
+            out.commit(files)
+            manifest.record(filename, digests[filename], files[0][2], sibling_sizes(files))
+            built.append(filename)
+            print(f"Created {filename} ({elapsed * 1000:.1f} ms)")
+        out.flush()
+    manifest.save()
+    return built, inputs, stats
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate the bug tracker wireframes')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes (0 = one per CPU)')
+    parser.add_argument('--instanced', action='store_true',
+                        help='write repeated shapes once in <defs> and reference them with <use>')
+    parser.add_argument('--spec', action='append', default=[], metavar='FILE',
+                        help='also render a page spec from a JSON or YAML file')
+    parser.add_argument('--data', metavar='PATH',
+                        help='fill dashboard statistics from mockStats.js or a directory of '
+                             'bug/user/project records (mock*.js, *.json or *.jsonl)')
+    parser.add_argument('--columnar', action='store_true',
+                        help='aggregate --data records with the NumPy columnar engine')
+    parser.add_argument('--tables', action='store_true',
+                        help='also write paginated bug-list pages from the --data records')
+    parser.add_argument('--rows-per-page', type=int, default=ROWS_PER_PAGE,
+                        help='table rows per bug-list page')
+    parser.add_argument('--tables-dir', default=TABLES_DIR, metavar='DIR',
+                        help='output directory for --tables')
+    parser.add_argument('--raster', action='append', default=[], choices=FORMATS, metavar='FORMAT',
+                        help='also write full-size and thumbnail images (png or webp; may be repeated)')
+    parser.add_argument('--thumbnail-width', type=int, default=THUMBNAIL_WIDTH,
+                        help='thumbnail width in pixels for --raster (0 = no thumbnails)')
+    parser.add_argument('--minify', action='store_true',
+                        help='minify each page (shorter colours, no redundant attributes)')
+    parser.add_argument('--compress', action='append', default=[], choices=COMPRESSIONS,
+                        help='also write a precompressed sibling: gz, svgz or br (may be repeated)')
+    parser.add_argument('--variants', action='store_true',
+                        help='also write every role page at every viewport in every theme')
+    parser.add_argument('--roles', default=','.join(ROLE_SPECS),
+                        help='comma separated roles for --variants (default: all)')
+    parser.add_argument('--viewports', default=','.join(VIEWPORTS),
+                        help='comma separated viewport names or pixel widths for --variants')
+    parser.add_argument('--themes', default=','.join(THEMES),
+                        help='comma separated themes for --variants (default: all)')
+    parser.add_argument('--variants-dir', default='variants', metavar='DIR',
+                        help='output directory for --variants')
+    parser.add_argument('--pdf', metavar='FILE',
+                        help='also export every page (and --variants) as one paginated PDF')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='time every page and component and write a Chrome trace (or a speedscope '
+                             'profile for *.speedscope.json); runs in one process, use with --force')
+    parser.add_argument('--archive', metavar='FILE',
+                        help='pack every output into one .zip or .tar(.gz/.bz2/.xz) archive instead of files')
+    parser.add_argument('--fsync', action='store_true',
+                        help='make outputs durable: fsync each file before its rename and each directory once')
+    parser.add_argument('--force', action='store_true',
+                        help='rebuild every page even if its inputs are unchanged')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running and rebuild pages whenever their sources change')
+    parser.add_argument('--poll', action='store_true',
+                        help='with --watch, poll file times instead of using inotify')
+    args = parser.parse_args(argv)
+    # Missing codecs are reported before anything is written
+    try:
+        check_compressions(args.compress)
+        check_formats(args.raster)
+    except RuntimeError as exc:
+        parser.error(str(exc))
+    return args
+
+
+def main(argv=None):
+    """Generate all wireframes"""
+    args = parse_args(argv)
+    jobs = args.jobs or os.cpu_count() or 1
+    tracer = None
+    if args.trace:
+        # Spans are recorded in this process only
+        jobs = 1
+        tracer = enable_profiling()
+    if args.tables and not (args.data and os.path.isdir(args.data)):
+        sys.exit('--tables needs --data pointing at a directory of bug records')
+    options = {'instanced': True} if args.instanced else {}
+    output = {}
+    if args.minify:
+        output['minify_output'] = True
+    if args.compress:
+        output['compress'] = args.compress
+    
+    if args.archive:
+        try:
+            archive_mode(args.archive)
+        except ValueError as exc:
+            sys.exit(str(exc))
+        if args.pdf or args.raster or args.watch:
+            sys.exit('--archive cannot be combined with --pdf, --raster or --watch, which read the SVG files')
+    
+    writer = open_writer(args.archive, args.fsync)
+    with writer:
+        pages = page_list(args.spec)
+        force = args.force
+        manifest = Manifest()
+        if args.archive:
+            # The archive is rewritten whole, so every page goes into it
+            force = True
+            manifest = Manifest(None)
+        start = time.perf_counter()
+        built, inputs, stats = build_pages(pages, manifest, options, output, args.data, args.columnar,
+                                           force, jobs, writer)
+        print(f"Generated {len(built)} wireframes in {(time.perf_counter() - start) * 1000:.1f} ms, "
+              f"skipped {len(pages) - len(built)} unchanged")
         
-        # Priority label with color
-        ET.SubElement(svg, 'rect', {
-            'x': str(int(x_pos) + 25),
-            'y': '485',
-            'width': '80',
-            'height': '20',
-            'fill': option['color'],
-            'stroke': 'none'
-        })
+        if args.variants:
+            roles = [role for role in args.roles.split(',') if role]
+            themes = [theme for theme in args.themes.split(',') if theme]
+            unknown = [name for name in roles if name not in ROLE_SPECS] + [name for name in themes if name not in THEMES]
+            if unknown:
+                sys.exit(f"Unknown role or theme: {', '.join(unknown)}")
+            try:
+                matrix = expand(roles, [v for v in args.viewports.split(',') if v], themes)
+            except ValueError as exc:
+                sys.exit(str(exc))
+            
+            # Each (role, viewport) job keeps only the themes whose output is stale;
+            # variants are minified and compressed like the pages
+            variant_options = {**options, **output}
+            variant_digests = {}
+            stale_jobs = []
+            for role, viewport, spec, job_themes in matrix:
+                spec_inputs = inputs if has_metrics(spec) else ()
+                stale_themes = []
+                for theme in job_themes:
+                    path = os.path.join(args.variants_dir, variant_filename(role, viewport, theme))
+                    variant_digests[path] = page_digest(spec, variant_options, THEMES[theme], spec_inputs)
+                    if force or not manifest.is_current(path, variant_digests[path]):
+                        stale_themes.append(theme)
+                if stale_themes:
+                    stale_jobs.append((role, viewport, spec, stale_themes))
+            if args.data and any(has_metrics(job[2]) for job in stale_jobs):
+                if stats is None:
+                    stats = load_stats(args.data, columnar=args.columnar)
+                stale_jobs = [(role, viewport, bind_data(spec, stats), job_themes)
+                              for role, viewport, spec, job_themes in stale_jobs]
+            
+            start = time.perf_counter()
+            count = 0
+            sizes = {}
+            for path, files, elapsed in build_variants(stale_jobs, args.variants_dir, jobs, writer,
+                                                        **variant_options):
+                manifest.record(path, variant_digests[path], files[0][2], sibling_sizes(files))
+                sizes[path] = files[0][2]
+                count += 1
+            writer.flush()
+            manifest.save()
+            write_index(matrix, themes, args.variants_dir, sizes, writer)
+            print(f"Generated {count} variants in {(time.perf_counter() - start) * 1000:.1f} ms, "
+                  f"skipped {len(variant_digests) - count} unchanged; index in {args.variants_dir}")
         
-        priority_text = ET.SubElement(svg, 'text', {
-            'x': str(int(x_pos) + 65),
-            'y': '497',
-            'font-family': 'Arial',
-            'font-size': '12',
-            'font-weight': 'bold',
-            'fill': 'white',
-            'text-anchor': 'middle'
-        })
-        priority_text.text = option['label']
-    
-    # Reporter Information Section
-    reporter_title = ET.SubElement(svg, 'text', {
-        'x': '140', 'y': '550',
-        'font-family': 'Arial',
-        'font-size': '16',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    reporter_title.text = 'Reporter Information (Optional)'
-    
-    # Reporter Name
-    name_label = ET.SubElement(svg, 'text', {
-        'x': '140', 'y': '580',
-        'font-family': 'Arial',
-        'font-size': '14',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    name_label.text = 'Your Name'
-    
-    ET.SubElement(svg, 'rect', {
-        'x': '140', 'y': '590',
-        'width': '400', 'height': '35',
-        'fill': 'white',
-        'stroke': '#ccc',
-        'stroke-width': '1'
-    })
-    
-    name_placeholder = ET.SubElement(svg, 'text', {
-        'x': '150', 'y': '610',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': '#999'
-    })
-    name_placeholder.text = 'Enter your name (optional)...'
-    
-    # Reporter Email
-    email_label = ET.SubElement(svg, 'text', {
-        'x': '580', 'y': '580',
-        'font-family': 'Arial',
-        'font-size': '14',
-        'font-weight': 'bold',
-        'fill': 'black'
-    })
-    email_label.text = 'Your Email'
-    
-    ET.SubElement(svg, 'rect', {
-        'x': '580', 'y': '590',
-        'width': '480', 'height': '35',
-        'fill': 'white',
-        'stroke': '#ccc',
-        'stroke-width': '1'
-    })
-    
-    email_placeholder = ET.SubElement(svg, 'text', {
-        'x': '590', 'y': '610',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': '#999'
-    })
-    email_placeholder.text = 'Enter your email for updates (optional)...'
-    
-    # Form Validation Note
-    validation_note = ET.SubElement(svg, 'text', {
-        'x': '140', 'y': '660',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': '#dc3545'
-    })
-    validation_note.text = '* Required fields'
-    
-    # Action Buttons
-    # Submit Button
-    ET.SubElement(svg, 'rect', {
-        'x': '140', 'y': '680',
-        'width': '150', 'height': '45',
-        'fill': '#28a745',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    
-    submit_text = ET.SubElement(svg, 'text', {
-        'x': '215', 'y': '706',
-        'font-family': 'Arial',
-        'font-size': '14',
-        'font-weight': 'bold',
-        'fill': 'white',
-        'text-anchor': 'middle'
-    })
-    submit_text.text = 'Submit Bug Report'
-    
-    # Clear Form Button
-    ET.SubElement(svg, 'rect', {
-        'x': '310', 'y': '680',
-        'width': '120', 'height': '45',
-        'fill': '#6c757d',
-        'stroke': 'black',
-        'stroke-width': '1'
-    })
-    
-    clear_text = ET.SubElement(svg, 'text', {
-        'x': '370', 'y': '706',
-        'font-family': 'Arial',
-        'font-size': '14',
-        'font-weight': 'bold',
-        'fill': 'white',
-        'text-anchor': 'middle'
-    })
-    clear_text.text = 'Clear Form'
-    
-    # Success Message Area (placeholder)
-    ET.SubElement(svg, 'rect', {
-        'x': '120', 'y': '750',
-        'width': '960', 'height': '60',
-        'fill': '#d4edda',
-        'stroke': '#c3e6cb',
-        'stroke-width': '1',
-        'stroke-dasharray': '5,5'
-    })
-    
-    success_title = ET.SubElement(svg, 'text', {
-        'x': '140', 'y': '775',
-        'font-family': 'Arial',
-        'font-size': '14',
-        'font-weight': 'bold',
-        'fill': '#155724'
-    })
-    success_title.text = 'Success Confirmation Area'
-    
-    success_desc = ET.SubElement(svg, 'text', {
-        'x': '140', 'y': '795',
-        'font-family': 'Arial',
-        'font-size': '12',
-        'fill': '#155724'
-    })
-    success_desc.text = 'Bug report submitted successfully! Bug ID: #12345 | Option to report another bug'
-    
-    return ET.tostring(svg, encoding='unicode')
+        if args.tables:
+            for spec in TABLE_SPECS:
+                start = time.perf_counter()
+                count = 0
+                for filename, elapsed in write_table_pages(spec, rows_for(spec, args.data), args.rows_per_page,
+                                                           writer, args.tables_dir, **options):
+                    count += 1
+                print(f"Created {count} {spec['name']} pages in {(time.perf_counter() - start) * 1000:.1f} ms "
+                      f"in {args.tables_dir}")
+    
+    if args.archive:
+        print(f"Packed {writer.written} files into {args.archive}")
+    
+    if args.pdf:
+        start = time.perf_counter()
+        paths = [filename for filename, spec in pages]
+        if args.variants:
+            paths += list(variant_digests)
+        count = export_pdf(paths, args.pdf)
+        print(f"Exported {count} pages to {args.pdf} in {(time.perf_counter() - start) * 1000:.1f} ms")
+    
+    # Images are cached by SVG content, so unchanged pages cost a file copy
+    if args.raster:
+        start = time.perf_counter()
+        rendered = 0
+        for filename, elapsed in rasterize_files([filename for filename, spec in pages], args.raster,
+                                                 args.thumbnail_width, jobs):
+            rendered += elapsed is not None
+        print(f"Rasterized {rendered} images in {(time.perf_counter() - start) * 1000:.1f} ms, "
+              f"reused {len(pages) * len(args.raster) * (2 if args.thumbnail_width else 1) - rendered} cached")
+    
+    # Workers keep their own caches, so only a single-process run can report
+    if jobs == 1:
+        print(cache_report())
+    
+    if tracer is not None:
+        tracer.write(args.trace)
+        print(tracer.summary())
+        print(f"Wrote {len(tracer.events)} spans to {args.trace}")
+    
+    if args.watch:
+        watch_pages(args, manifest, options, output)
 
-def main():
-    """Generate all wireframes"""
-    
-    # Create Admin Dashboard Wireframe
-    admin_svg = create_admin_wireframe()
-    with open('admin-dashboard-wireframe.svg', 'w', encoding='utf-8') as f:
-        f.write(admin_svg)
-    print("Created admin-dashboard-wireframe.svg")
-    
-    # Create Tester Dashboard Wireframe
-    tester_svg = create_tester_wireframe()
-    with open('tester-dashboard-wireframe.svg', 'w', encoding='utf-8') as f:
-        f.write(tester_svg)
-    print("Created tester-dashboard-wireframe.svg")
-    
-    # Create Developer Dashboard Wireframe
-    developer_svg = create_developer_wireframe()
-    with open('developer-dashboard-wireframe.svg', 'w', encoding='utf-8') as f:
-        f.write(developer_svg)
-    print("Created developer-dashboard-wireframe.svg")
-    
-    # Create Public Bug Report Wireframe
-    public_bug_report_svg = create_public_bug_report_wireframe()
-    with open('public-bug-report-wireframe.svg', 'w', encoding='utf-8') as f:
-        f.write(public_bug_report_svg)
-    print("Created public-bug-report-wireframe.svg")
 
 if __name__ == "__main__":
     main()
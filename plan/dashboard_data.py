@@ -0,0 +1,332 @@
+"""Dashboard statistics from the mock datasets or a JSON export
+
+Records are read one at a time and folded into counters in a single pass,
+so aggregating a million-bug JSONL export needs no more memory than the
+handful of mock records in ``frontend/src/data``. A data directory may
+also hold synthetic_data's npz output: a ``bugs``, ``users`` or
+``projects`` directory of part-NNNNN.npz shards.
+"""
+import ast
+import copy
+import glob
+import json
+import os
+import re
+
+from layout import iter_components
+
+PRIORITIES = ('critical', 'high', 'medium', 'low')
+STATUSES = ('open', 'in-progress', 'closed')
+
+# Record files looked up in a data directory, in order of preference; a
+# name without an extension is a directory of npz shards
+DATA_FILES = {
+    'bugs': ('bugs.jsonl', 'bugs.json', 'mockBugs.js', 'bugs'),
+    'users': ('users.jsonl', 'users.json', 'mockUsers.js', 'users'),
+    'projects': ('projects.jsonl', 'projects.json', 'mockProjects.js', 'projects'),
+}
+
+_JS_TOKEN = re.compile(r'''
+    (?P<string>'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*")
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<word>[A-Za-z_$][\w$]*)
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<punct>[{}\[\]:,])
+  | (?P<space>\s+)
+''', re.S | re.X)
+
+
+def js_literal(source, name):
+    """Evaluate the object/array literal following ``name`` in JS source
+
+    Handles what the mock files use: unquoted keys, single-quoted strings,
+    comments and trailing commas.
+    """
+    match = re.search(rf'\b{re.escape(name)}\b[^\[{{]*', source)
+    if match is None:
+        raise ValueError(f'{name} not found')
+    parts = []
+    depth = 0
+    pos = match.end()
+    while True:
+        token = _JS_TOKEN.match(source, pos)
+        if token is None:
+            raise ValueError(f'Unsupported JS syntax near {source[pos:pos + 30]!r}')
+        pos = token.end()
+        kind, value = token.lastgroup, token.group()
+        if kind in ('comment', 'space'):
+            continue
+        if kind == 'string':
+            parts.append(json.dumps(ast.literal_eval(value)))
+        elif kind == 'word':
+            is_key = source[pos:pos + 64].lstrip().startswith(':')
+            parts.append(json.dumps(value) if is_key or value not in ('true', 'false', 'null') else value)
+        elif kind == 'punct':
+            if value in ']}':
+                if parts and parts[-1] == ',':
+                    parts.pop()
+                depth -= 1
+            elif value in '[{':
+                depth += 1
+            parts.append(value)
+            if depth == 0:
+                break
+        else:
+            parts.append(value)
+    return json.loads(''.join(parts))
+
+
+def _iter_json_array(f, chunk_size=1 << 16):
+    decoder = json.JSONDecoder()
+    buf = f.read(chunk_size).lstrip()
+    if not buf.startswith('['):
+        raise ValueError('Expected a JSON array of records')
+    pos = 1
+    eof = False
+    while True:
+        while pos < len(buf) and buf[pos] in ' \t\r\n,':
+            pos += 1
+        if pos < len(buf) and buf[pos] == ']':
+            return
+        try:
+            record, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf = buf[pos:] + chunk
+            pos = 0
+            continue
+        yield record
+        pos = end
+
+
+def shard_files(path):
+    """The npz shards of a shard directory, in order; ``[path]`` for a file"""
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, 'part-*.npz')))
+    return [path]
+
+
+def iter_records(path):
+    """Yield records from a .jsonl, .json (array) or mock .js file, or npz shards"""
+    if os.path.isdir(path):
+        from synthetic_data import npz_batches, records
+        kind = os.path.basename(os.path.normpath(path))
+        for columns in npz_batches(path):
+            yield from records(kind, columns)
+        return
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.js':
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+        name = re.search(r'export const (mock\w+)\s*=\s*\[', source).group(1)
+        yield from js_literal(source, name)
+        return
+    with open(path, encoding='utf-8') as f:
+        if ext == '.jsonl':
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from _iter_json_array(f)
+
+
+def find_data_files(data_dir):
+    """Map 'bugs'/'users'/'projects' to the record file for each in ``data_dir``"""
+    files = {}
+    for kind, names in DATA_FILES.items():
+        for name in names:
+            path = os.path.join(data_dir, name)
+            if os.path.isfile(path) or os.path.isdir(path) and shard_files(path):
+                files[kind] = path
+                break
+    if 'bugs' not in files:
+        raise FileNotFoundError(f'No bug records found in {data_dir}')
+    return files
+
+
+def aggregate_bugs(bugs):
+    """Fold bug records into the bug-derived dashboard statistics"""
+    priority = dict.fromkeys(PRIORITIES, 0)
+    status = dict.fromkeys(STATUSES, 0)
+    assigned_priority = dict.fromkeys(PRIORITIES, 0)
+    per_project = {}
+    months = {}
+    total = assigned = reported = 0
+    for bug in bugs:
+        total += 1
+        bug_priority = bug.get('priority', 'medium')
+        bug_status = bug.get('status', 'open')
+        priority[bug_priority] = priority.get(bug_priority, 0) + 1
+        status[bug_status] = status.get(bug_status, 0) + 1
+        project = bug.get('project')
+        if project is not None:
+            per_project[project] = per_project.get(project, 0) + 1
+        if bug.get('assignedTo') and bug_status != 'closed':
+            assigned += 1
+            assigned_priority[bug_priority] = assigned_priority.get(bug_priority, 0) + 1
+        reporter = bug.get('reporter') or {}
+        if reporter.get('type') == 'internal' or bug.get('reportedBy'):
+            reported += 1
+        created = bug.get('createdAt')
+        if created:
+            month = created[:7]
+            months[month] = months.get(month, 0) + 1
+
+    return {
+        'totalBugs': total,
+        'assignedBugs': assigned,
+        'priorityBreakdown': assigned_priority,
+        'bugsReported': reported,
+        'statusBreakdown': {
+            'open': status.get('open', 0),
+            'inProgress': status.get('in-progress', 0),
+            'closed': status.get('closed', 0),
+        },
+        'priorityCounts': priority,
+        'bugsPerProject': per_project,
+        'bugsPerMonth': month_series(months),
+    }
+
+
+def month_series(counts):
+    """{'YYYY-MM': count} for every month from the first to the last of ``counts``"""
+    if not counts:
+        return {}
+    year, month = int(min(counts)[:4]), int(min(counts)[5:7])
+    last = max(counts)
+    series = {}
+    while True:
+        key = f'{year:04d}-{month:02d}'
+        series[key] = counts.get(key, 0)
+        if key >= last:
+            return series
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def aggregate(bugs, users=(), projects=(), summarize_bugs=aggregate_bugs):
+    """Fold bug, user and project records into dashboard statistics
+
+    Each iterable is consumed exactly once. Keys follow the frontend's
+    mockStats.js so either source can drive the wireframes.
+    ``summarize_bugs`` turns the bug records into their statistics; pass
+    bug_columns.summarize to use the vectorized engine.
+    """
+    stats = summarize_bugs(bugs)
+    stats['activeUsers'] = sum(1 for user in users if user.get('isActive', True))
+    names = {}
+    active_projects = 0
+    for project in projects:
+        names[project.get('_id')] = project.get('name')
+        if project.get('status', 'active') == 'active':
+            active_projects += 1
+    stats['activeProjects'] = active_projects
+    stats['bugsByProject'] = {names.get(project) or project: count
+                              for project, count in stats['bugsPerProject'].items()}
+    return stats
+
+
+def load_mock_stats(path):
+    """Read the precomputed dashboard figures from mockStats.js"""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    stats = {}
+    for name in ('getAdminDashboardStats', 'getDeveloperDashboardStats', 'getTesterDashboardStats'):
+        stats.update(js_literal(source, name))
+    return stats
+
+
+def load_stats(path, columnar=False):
+    """Dashboard statistics from mockStats.js or a directory of records
+
+    With ``columnar`` the bug records are packed into NumPy arrays and
+    summarized by bug_columns instead of the pure-Python single pass.
+    Bugs stored as npz shards always go to bug_columns, column by column,
+    without being turned into records.
+    """
+    if os.path.isfile(path):
+        return load_mock_stats(path)
+    files = find_data_files(path)
+    records = {kind: iter_records(p) for kind, p in files.items()}
+    options = {}
+    if os.path.isdir(files['bugs']):
+        from bug_columns import summarize_npz
+        records['bugs'] = shard_files(files['bugs'])
+        options['summarize_bugs'] = summarize_npz
+    elif columnar:
+        from bug_columns import summarize
+        options['summarize_bugs'] = summarize
+    return aggregate(records['bugs'], records.get('users', ()), records.get('projects', ()), **options)
+
+
+def data_inputs(path):
+    """Files whose contents determine the statistics for ``path``"""
+    if os.path.isfile(path):
+        return [path]
+    return sorted(shard for files in find_data_files(path).values() for shard in shard_files(files))
+
+
+def format_label(key):
+    words = re.sub(r'([a-z])([A-Z])', r'\1 \2', key).replace('-', ' ')
+    return words.title()
+
+
+def format_value(value):
+    if isinstance(value, dict):
+        return ' | '.join(f'{format_label(k)} {v:,}' for k, v in value.items())
+    return f'{value:,}'
+
+
+def lookup(stats, metric):
+    value = stats
+    for part in metric.split('.'):
+        value = value[part]
+    return value
+
+
+def has_metrics(spec):
+    """True if any component of the page is bound to a statistic"""
+    for c in iter_components(spec):
+        if 'metric' in c:
+            return True
+        for item in c.get('cards', []) + c.get('buttons', []):
+            if 'metric' in item:
+                return True
+    return False
+
+
+def bind_data(spec, stats):
+    """Return a copy of ``spec`` with its metric placeholders filled in
+
+    Stat cards bound to a metric show its value in their content area,
+    buttons bound to a metric get the count appended to their label and
+    charts receive the counts to draw. Metrics missing from ``stats``
+    (mockStats.js has no per-project figures, for instance) are left
+    unbound.
+    """
+    if not has_metrics(spec):
+        return spec
+    spec = copy.deepcopy(spec)
+    for c in iter_components(spec):
+        if 'metric' in c and _has(stats, c['metric']):
+            c['data'] = lookup(stats, c['metric'])
+        for card in c.get('cards', []):
+            if 'metric' in card and _has(stats, card['metric']):
+                value = lookup(stats, card['metric'])
+                card['value'] = format_value(value)
+                if isinstance(value, dict):
+                    card['value_size'] = 14
+        for item in c.get('buttons', []):
+            if 'metric' in item and _has(stats, item['metric']):
+                item['label'] = f"{item['label']} ({format_value(lookup(stats, item['metric']))})"
+    return spec
+
+
+def _has(stats, metric):
+    try:
+        lookup(stats, metric)
+    except KeyError:
+        return False
+    return True
@@ -0,0 +1,324 @@
+"""Box/flex layout for page specs
+
+A page spec may carry a ``layout`` tree next to (or instead of) its
+absolutely positioned ``components``. Every node of the tree is a box:
+
+    direction   'column' (default) stacks children, 'row' puts them side by side
+    width       fixed width; otherwise a box stretches across its column or
+                takes its share of a row
+    height      minimum height; a box always grows to fit its children
+    grow        weight for sharing the free space along the parent's
+                direction
+    min_width   narrowest a row child may become before the row wraps
+    max_width   widest a growing row child may become
+    padding     one number or [top, right, bottom, left]
+    gap         space between children
+    line_gap    rows only: space between wrapped lines (default: gap)
+    wrap        rows only: move children that don't fit onto new lines
+    justify     'start', 'center' or 'end' for leftover space along the
+                direction when no child grows
+    align       rows only: 'stretch' (default), 'start', 'center' or 'end'
+    hide_below  drop the box on canvases narrower than this
+    component   component drawn in the box, underneath its children; a
+                box with no children and no height is as tall as a
+                paragraph or bullet list component needs
+    each        box template for every item of a card, button or radio
+                list component, which then gets one box per item
+
+Sizes flow down the tree and content heights flow back up in a single
+pass that visits every box once; boxes are placed relative to their
+parent and absolute coordinates are summed while the components are
+emitted. Solutions are memoized per (tree, canvas size), so rendering a
+page at many viewport widths lays out each width only once.
+"""
+import json
+from functools import lru_cache
+
+from text_metrics import wrap
+
+# List components that can be split into one box per item, and their item key
+ITEM_KEYS = {'stat_cards': 'cards', 'button_row': 'buttons', 'radio_group': 'options'}
+
+# Room a chart title and a form label take at the top of their box; text
+# components put their baseline on the bottom edge of the box instead
+CHART_TITLE_HEIGHT = 20
+FORM_LABEL_HEIGHT = 14
+FORM_LABEL_GAP = 10
+
+
+def _place_box(c, x, y, width, height):
+    return dict(c, x=x, y=y, width=width, height=height)
+
+
+def _place_text(c, x, y, width, height):
+    if c.get('anchor') == 'middle':
+        x += width // 2
+    elif c.get('anchor') == 'end':
+        x += width
+    return dict(c, x=x, y=y + height, max_width=width)
+
+
+def _place_item(c, x, y, width, height):
+    return dict(c, x=x, y=y, width=width, height=height, step=width)
+
+
+def _place_chart(c, x, y, width, height):
+    return dict(c, x=x, y=y + CHART_TITLE_HEIGHT, width=width, height=height - CHART_TITLE_HEIGHT)
+
+
+def _place_form_field(c, x, y, width, height):
+    return dict(c, x=x, y=y + FORM_LABEL_HEIGHT, width=width,
+                height=height - FORM_LABEL_HEIGHT - FORM_LABEL_GAP)
+
+
+# Component type -> function(component, x, y, width, height) giving the
+# component the geometry fields it draws from
+PLACEMENT = {
+    'background': lambda c, x, y, width, height: c,
+    'user_menu': lambda c, x, y, width, height: c,
+    'navbar': lambda c, x, y, width, height: c,
+    'header': lambda c, x, y, width, height: dict(c, height=height),
+    'sidebar': lambda c, x, y, width, height: dict(c, top=y, width=width),
+    'main_area': lambda c, x, y, width, height: dict(c, x=x, top=y),
+    'breadcrumb': lambda c, x, y, width, height: dict(c, x=x, y=y, width=width),
+    'section_title': _place_text,
+    'text': _place_text,
+    'stat_cards': _place_item,
+    'button_row': _place_item,
+    'radio_group': _place_item,
+    'form_field': _place_form_field,
+    'bar_chart': _place_chart,
+    'donut_chart': _place_chart,
+    'bug_table': lambda c, x, y, width, height: dict(c, x=x, y=y),
+}
+
+
+def line_height(c):
+    """Baseline spacing of a paragraph component"""
+    return c.get('line_height', round(c.get('size', 14) * 1.5))
+
+
+def _paragraph_height(c, width):
+    size = c.get('size', 14)
+    lines = wrap(c['text'], width, size=size, weight='bold' if c.get('bold') else 'normal')
+    return size + (len(lines) - 1) * line_height(c) if lines else 0
+
+
+# Component type -> function(component, width) giving the height its content
+# needs; a box holding one of these and no height of its own is that tall
+MEASURE = {
+    'paragraph': _paragraph_height,
+    'bullets': lambda c, width: len(c['items']) * c.get('step', 30),
+}
+
+
+def place(c, x, y, width, height):
+    """Copy of component ``c`` positioned in the given box"""
+    return PLACEMENT.get(c['type'], _place_box)(c, x, y, width, height)
+
+
+def _padding(box):
+    padding = box.get('padding', 0)
+    if isinstance(padding, (int, float)):
+        return padding, padding, padding, padding
+    return tuple(padding)
+
+
+def _children(box, viewport):
+    """Visible child boxes, with list components split into item boxes"""
+    if 'each' in box:
+        c = box['component']
+        key = ITEM_KEYS[c['type']]
+        return [dict(box['each'], component=dict(c, **{key: [item]})) for item in c[key]]
+    return [child for child in box.get('children', ()) if viewport >= child.get('hide_below', 0)]
+
+
+def _shares(sizes, grows, free):
+    """Add ``free`` space to ``sizes`` in proportion to the grow weights"""
+    total = sum(grows)
+    if free <= 0 or not total:
+        return sizes
+    shares = []
+    given = 0
+    weight = 0
+    for size, grow in zip(sizes, grows):
+        # Rounding the running total keeps the shares summing to ``free``
+        weight += grow
+        share = round(free * weight / total) - given
+        given += share
+        shares.append(size + share)
+    return shares
+
+
+def solve(box, width, height, viewport):
+    """Lay out ``box`` in a ``width`` wide space; return (height, node)
+
+    ``height`` is the height the parent assigns, or None to size the box
+    to its content. Nodes are (dx, dy, width, height, component, children)
+    with positions relative to the parent node.
+    """
+    top, right, bottom, left = _padding(box)
+    inner_width = width - left - right
+    inner_height = None if height is None else height - top - bottom
+    children = _children(box, viewport)
+    if not children:
+        nodes, content = [], 0
+        measure = MEASURE.get(box['component']['type']) if 'component' in box else None
+        if measure is not None:
+            content = measure(box['component'], width)
+    elif box.get('direction', 'column') == 'row':
+        nodes, content = _solve_row(box, children, inner_width, inner_height, viewport)
+    else:
+        nodes, content = _solve_column(box, children, inner_width, inner_height, viewport)
+    outer = max(height or 0, box.get('height', 0), content + top + bottom)
+    nodes = [(dx + left, dy + top, w, h, c, sub) for dx, dy, w, h, c, sub in nodes]
+    component = None if 'each' in box else box.get('component')
+    return outer, (0, 0, width, outer, component, nodes)
+
+
+def _solve_column(box, children, width, height, viewport):
+    gap = box.get('gap', 0)
+    solved = [None] * len(children)
+    used = gap * (len(children) - 1)
+    for i, child in enumerate(children):
+        if not child.get('grow'):
+            solved[i] = solve(child, child.get('width', width), child.get('height'), viewport)
+            used += solved[i][0]
+
+    grows = [child.get('grow', 0) for child in children]
+    free = 0 if height is None else height - used
+    if any(grows):
+        sizes = _shares([child.get('height', 0) for child in children], grows, free - sum(
+            child.get('height', 0) for child in children if child.get('grow')))
+        for i, child in enumerate(children):
+            if grows[i]:
+                solved[i] = solve(child, child.get('width', width), sizes[i] or None, viewport)
+                used += solved[i][0]
+        free = 0
+    y = _offset(box.get('justify'), free)
+
+    nodes = []
+    for child_height, (_, _, w, h, c, sub) in solved:
+        nodes.append((0, y, w, h, c, sub))
+        y += child_height + gap
+    return nodes, used
+
+
+def _solve_row(box, children, width, height, viewport):
+    gap = box.get('gap', 0)
+    line_gap = box.get('line_gap', gap)
+    lines = [[]]
+    used = 0
+    for child in children:
+        basis = child.get('width', child.get('min_width', 0))
+        if box.get('wrap') and lines[-1] and used + gap + basis > width:
+            lines.append([])
+            used = 0
+        used += (gap if lines[-1] else 0) + basis
+        lines[-1].append((child, basis))
+
+    align = box.get('align', 'stretch')
+    stretch = height if len(lines) == 1 and align == 'stretch' else None
+    nodes = []
+    y = 0
+    for line in lines:
+        sizes, free = _line_sizes(line, width - gap * (len(line) - 1))
+        x = _offset(box.get('justify'), free)
+        solved = []
+        for (child, basis), size in zip(line, sizes):
+            solved.append((x, solve(child, size, child.get('height', stretch), viewport)))
+            x += size + gap
+        line_height = max(child_height for x, (child_height, node) in solved)
+        if len(lines) == 1 and height is not None:
+            line_height = max(line_height, height)
+        for x, (child_height, (_, _, w, h, c, sub)) in solved:
+            nodes.append((x, y + _offset(align, line_height - child_height), w, h, c, sub))
+        y += line_height + line_gap
+    return nodes, y - line_gap
+
+
+def _line_sizes(line, width):
+    """Widths of one row line and the space left over
+
+    Growing children share the width by weight but stay within their
+    ``min_width`` and ``max_width``: a child that would not is held at
+    that bound and the rest is shared again among the others. No child
+    is wider than the line itself.
+    """
+    sizes = [min(basis, width) if 'width' in child or not child.get('grow') else None
+             for child, basis in line]
+    while True:
+        free = width - sum(size for size in sizes if size is not None)
+        growing = [i for i, size in enumerate(sizes) if size is None]
+        if not growing:
+            return sizes, free
+        shares = _shares([0] * len(growing), [line[i][0]['grow'] for i in growing], max(free, 0))
+        held = False
+        for i, share in zip(growing, shares):
+            child = line[i][0]
+            bound = min(max(share, child.get('min_width', 0)), child.get('max_width', share), width)
+            if bound != share:
+                sizes[i] = bound
+                held = True
+        if not held:
+            for i, share in zip(growing, shares):
+                sizes[i] = share
+            return sizes, 0
+
+
+def _offset(mode, free):
+    if free <= 0:
+        return 0
+    if mode == 'center':
+        return free // 2
+    if mode == 'end':
+        return free
+    return 0
+
+
+def _emit(node, x, y, out):
+    dx, dy, width, height, c, children = node
+    x += dx
+    y += dy
+    if c is not None:
+        out.append(place(c, x, y, width, height))
+    for child in children:
+        _emit(child, x, y, out)
+
+
+@lru_cache(maxsize=1024)
+def _solve_cached(tree, width, height):
+    root = json.loads(tree)
+    content, node = solve(root, width, height, width)
+    components = []
+    _emit(node, 0, 0, components)
+    return tuple(components), max(content, height)
+
+
+def resolve(page):
+    """Page spec with its layout tree solved into positioned components
+
+    Components of the tree follow the page's own ``components``. The page
+    height is a minimum: it grows when narrow canvases stack content
+    deeper than the spec's height. Pages without a layout are returned
+    unchanged.
+    """
+    if 'layout' not in page:
+        return page
+    components, height = _solve_cached(json.dumps(page['layout']), page['width'], page['height'])
+    resolved = {key: value for key, value in page.items() if key != 'layout'}
+    resolved['components'] = list(page.get('components', ())) + list(components)
+    resolved['height'] = height
+    return resolved
+
+
+def iter_components(spec):
+    """Every component of a spec, including those inside its layout tree"""
+    yield from spec.get('components', ())
+    if 'layout' in spec:
+        stack = [spec['layout']]
+        while stack:
+            box = stack.pop()
+            if 'component' in box:
+                yield box['component']
+            stack.extend(reversed(box.get('children', ())))
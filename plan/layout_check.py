@@ -0,0 +1,246 @@
+"""Layout checker: overlapping shapes and text spilling out of its container
+
+    python layout_check.py [SVG ...] [-j 0] [--tolerance 0.5]
+
+Without arguments every SVG in plan/ is checked, one file per worker
+process. Each document is flattened by the rasterizer's tree walker (the
+same one wireframe_diff uses), so every drawn shape has a bounding box in
+page coordinates, and the boxes go into a uniform grid index.
+
+Two kinds of issue are reported:
+
+- overflow: a text whose box runs past the edge of its container, the
+  smallest rect or circle containing the text's anchor point;
+- overlap: two rects, circles or texts that partly cover each other,
+  neither containing the other. A text and its own container are left to
+  the overflow check.
+
+Lines and translucent shapes are decoration (grid lines, tinted halos)
+and take part in neither check. Text boxes are estimated from the font
+metrics, so overlaps thinner than ``--tolerance`` pixels are ignored.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from statistics import median
+
+from wireframe_diff import BoxWalker, _num
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TOLERANCE = 0.5
+
+# Boxes covering more cells than this are kept out of the grid and checked
+# against every box instead
+MAX_CELLS = 64
+MIN_CELL = 16.0
+
+# Glyph extent around the baseline, in ems (Arial's cap height and descender)
+ASCENT = 0.72
+DESCENT = 0.21
+
+
+class Shapes(BoxWalker):
+    """Collect (tag, box, label, anchor point) of every opaque shape
+
+    Text boxes are trimmed to the glyphs' vertical extent; the anchor point
+    sits on the text's anchor, halfway up its lowercase letters.
+    """
+
+    def add(self, tag, el, style, opacity, box, label=None):
+        if tag == 'line' or opacity < 1:
+            return
+        point = None
+        if tag == 'text':
+            # From the cap height above the baseline to the descenders below it
+            x, top, width, size = box
+            box = (x, top + size * (1 - ASCENT), width, size * (ASCENT + DESCENT))
+            anchor = style.get('text-anchor', 'start')
+            point = (x + width / 2 if anchor == 'middle' else x + width if anchor == 'end' else x,
+                     top + size * 0.65)
+        self.canvas.append((tag, box, label, point))
+
+
+class GridIndex:
+    """Uniform grid of box ids; cells are about the size of a typical box
+
+    Only boxes sharing a cell are compared, so for pages of similarly sized
+    shapes finding every intersecting pair is about linear in the number
+    of shapes rather than quadratic. The few boxes that span many cells
+    (backgrounds, panels) are kept in ``large`` and compared with all.
+    """
+
+    def __init__(self, boxes):
+        self.boxes = boxes
+        sizes = [max(box[2], box[3]) for box in boxes]
+        self.cell = max(median(sizes) if sizes else MIN_CELL, MIN_CELL)
+        self.cells = {}
+        self.large = []
+        for i, box in enumerate(boxes):
+            self.insert(i, box)
+
+    def span(self, box):
+        cell = self.cell
+        return (int(box[0] // cell), int((box[0] + box[2]) // cell),
+                int(box[1] // cell), int((box[1] + box[3]) // cell))
+
+    def insert(self, i, box):
+        x0, x1, y0, y1 = self.span(box)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > MAX_CELLS:
+            self.large.append(i)
+            return
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cells.setdefault((cx, cy), []).append(i)
+
+    def pairs(self):
+        """(i, j, overlap width, overlap height) for every intersecting pair, i < j
+
+        Pairs sharing several cells are reported once, by the cell holding
+        the top-left corner of their intersection.
+        """
+        boxes = self.boxes
+        cell = self.cell
+        for (cx, cy), ids in self.cells.items():
+            if len(ids) < 2:
+                continue
+            for n, i in enumerate(ids):
+                ax, ay, aw, ah = boxes[i]
+                ar, ab = ax + aw, ay + ah
+                for j in ids[n + 1:]:
+                    bx, by, bw, bh = boxes[j]
+                    if bx >= ar or by >= ab or bx + bw <= ax or by + bh <= ay:
+                        continue
+                    left, top = (ax if ax > bx else bx), (ay if ay > by else by)
+                    if int(left // cell) == cx and int(top // cell) == cy:
+                        yield i, j, min(ar, bx + bw) - left, min(ab, by + bh) - top
+        large = set(self.large)
+        for i in self.large:
+            a = boxes[i]
+            for j, b in enumerate(boxes):
+                if j == i or (j in large and j < i):
+                    continue
+                width, height = overlap(a, b)
+                if width > 0 and height > 0:
+                    yield min(i, j), max(i, j), width, height
+
+    def point(self, x, y):
+        """Ids of the boxes that may contain the point (x, y)"""
+        return self.cells.get((int(x // self.cell), int(y // self.cell)), []) + self.large
+
+
+def contains(outer, inner, tolerance=0.0):
+    return (inner[0] >= outer[0] - tolerance and inner[1] >= outer[1] - tolerance
+            and inner[0] + inner[2] <= outer[0] + outer[2] + tolerance
+            and inner[1] + inner[3] <= outer[1] + outer[3] + tolerance)
+
+
+def overlap(a, b):
+    """(width, height) of the intersection of two boxes; either may be <= 0"""
+    return (min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0]),
+            min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1]))
+
+
+def check(shapes, tolerance=TOLERANCE):
+    """Issues of one page: ('overflow', text, container) and ('overlap', a, b)
+
+    Shapes are (tag, box, label, anchor point); issues refer to them by
+    index, in document order.
+    """
+    boxes = [shape[1] for shape in shapes]
+    index = GridIndex(boxes)
+    issues = []
+
+    containers = {}
+    for i, (tag, box, label, point) in enumerate(shapes):
+        if tag != 'text':
+            continue
+        best = None
+        for j in index.point(*point):
+            other = shapes[j]
+            if other[0] == 'text':
+                continue
+            ob = other[1]
+            if ob[0] <= point[0] <= ob[0] + ob[2] and ob[1] <= point[1] <= ob[1] + ob[3]:
+                if best is None or ob[2] * ob[3] < boxes[best][2] * boxes[best][3]:
+                    best = j
+        if best is None:
+            continue
+        containers[i] = best
+        if not contains(boxes[best], box, tolerance):
+            issues.append(('overflow', i, best))
+
+    for i, j, width, height in index.pairs():
+        if width > tolerance and height > tolerance and containers.get(i) != j and containers.get(j) != i:
+            if not (contains(boxes[i], boxes[j], tolerance) or contains(boxes[j], boxes[i], tolerance)):
+                issues.append(('overlap', i, j))
+    issues.sort(key=lambda issue: issue[1:])
+    return issues
+
+
+def describe(shape):
+    tag, box, label = shape[:3]
+    name = f"{tag} '{label}'" if label else tag
+    return name + ' ({},{} {}x{})'.format(*map(_num, box))
+
+
+def check_file(path, tolerance=TOLERANCE):
+    """(path, [issue description], shape count, seconds) for one SVG"""
+    start = time.perf_counter()
+    shapes = Shapes(ET.parse(path).getroot()).render()
+    lines = []
+    for kind, i, j in check(shapes, tolerance):
+        a, b = shapes[i], shapes[j]
+        if kind == 'overflow':
+            width, height = overlap(a[1], b[1])
+            spill = max(a[1][2] - width, a[1][3] - height)
+            lines.append(f"overflow {describe(a)} spills {_num(spill)}px out of {describe(b)}")
+        else:
+            lines.append(f"overlap  {describe(a)} and {describe(b)}")
+    return path, lines, len(shapes), time.perf_counter() - start
+
+
+def check_files(paths, jobs=1, tolerance=TOLERANCE):
+    """check_file for every path, in order, spread over ``jobs`` processes"""
+    run = partial(check_file, tolerance=tolerance)
+    if jobs <= 1 or len(paths) <= 1:
+        yield from map(run, paths)
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        yield from pool.map(run, paths)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Report overlapping shapes and overflowing text in wireframe SVGs')
+    parser.add_argument('svgs', nargs='*', metavar='SVG', help='files to check (default: every SVG in plan/)')
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='number of worker processes (0 = one per CPU)')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help='ignore overlaps and overflows of at most this many pixels')
+    parser.add_argument('--limit', type=int, default=50, help='issues listed per file (0 = all)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Check the SVGs; exit 1 if any issue is found"""
+    args = parse_args(argv)
+    paths = args.svgs or sorted(glob.glob(os.path.join(HERE, '*.svg')))
+    jobs = args.jobs or os.cpu_count() or 1
+    total = 0
+    for path, lines, count, elapsed in check_files(paths, jobs, args.tolerance):
+        for line in lines[:args.limit or None]:
+            print(f"{os.path.relpath(path)}: {line}")
+        if args.limit and len(lines) > args.limit:
+            print(f"{os.path.relpath(path)}: ... {len(lines) - args.limit} more")
+        print(f"{os.path.relpath(path)}: {count} shapes, {len(lines)} issues ({elapsed * 1000:.1f} ms)")
+        total += len(lines)
+    sys.exit(1 if total else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""Output layer: atomic file writes on a background thread, or one archive
+
+Generated files go through a writer, either whole with ``write(name,
+data)`` or streamed: a renderer opens a file with ``spool(name,
+writer.spool_dir(name))``, writes the document into it as it is
+produced and hands ``(name, path, size)`` to ``writer.commit``, so no
+page is ever held in memory as one string. Spooling works the same in
+a worker process, which then returns only the path.
+
+- FileWriter writes each file to a temporary sibling and renames it over
+  the target, so an interrupted run never leaves a half-written page
+  behind: a reader sees either the old file or the new one. With
+  ``sync`` every file is fsynced before its rename and every directory
+  that received files is fsynced once per flush, not once per file.
+- ArchiveWriter packs every file into one zip or tar archive instead of
+  thousands of small files. The archive is written under a temporary
+  name and renamed into place on close.
+
+Writes are queued and carried out by one background thread, so the next
+page is rendered while the last one is being written. ``flush`` waits
+for the queue to drain and raises the first error the thread hit. The
+error is sticky: once a write has failed, everything still queued is
+dropped and every later ``write``, ``flush`` or ``close`` raises it
+again until ``abort`` throws the output away; ``close`` also finishes
+the output.
+"""
+import io
+import itertools
+import os
+import queue
+import shutil
+import tarfile
+import threading
+import time
+import zipfile
+
+# Rendered files waiting for the writer thread; bounds the memory they hold
+QUEUE_SIZE = 64
+
+ARCHIVE_FORMATS = {'.zip': None, '.tar': 'w', '.tar.gz': 'w:gz', '.tgz': 'w:gz', '.tar.bz2': 'w:bz2',
+                   '.tar.xz': 'w:xz'}
+
+
+def archive_mode(path):
+    """tarfile mode for an archive name, None for zip; ValueError otherwise"""
+    for suffix, mode in ARCHIVE_FORMATS.items():
+        if path.endswith(suffix):
+            return mode
+    raise ValueError(f"Unknown archive type {path!r}; use one of {', '.join(ARCHIVE_FORMATS)}")
+
+
+# Tells apart the spool files one process opens for the same name
+_spool_ids = itertools.count()
+
+
+def spool(name, directory):
+    """Open a new temporary file in ``directory`` for ``name``; return (path, binary file)"""
+    path = os.path.join(directory, f'.{os.path.basename(name)}.{os.getpid()}.{next(_spool_ids)}.tmp')
+    return path, open(path, 'xb')
+
+
+def discard(files):
+    """Remove spooled files, (name, path, size) each, that will not be committed"""
+    for name, path, size in files:
+        _remove(path)
+
+
+def _remove(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def fsync_dir(directory):
+    fd = os.open(directory or '.', os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class QueuedWriter:
+    """Hands ``write`` calls to a background thread; subclasses do the writing"""
+
+    def __init__(self, queue_size=QUEUE_SIZE):
+        self.queue = queue.Queue(queue_size)
+        self.error = None
+        self.written = 0
+        self.thread = threading.Thread(target=self._run, name='output-writer', daemon=True)
+        self.thread.start()
+
+    def write(self, name, data):
+        """Queue ``data`` (bytes) to be written as ``name``"""
+        self._raise()
+        self.queue.put((name, data, None))
+
+    def spool_dir(self, name):
+        """Directory to spool ``name`` into, so that committing it is cheap"""
+        raise NotImplementedError
+
+    def commit(self, files):
+        """Queue spooled files, (name, path, size) each, to become part of the output
+
+        The writer owns the files from here on and removes them if they
+        are not written.
+        """
+        files = list(files)
+        try:
+            self._raise()
+        except BaseException:
+            discard(files)
+            raise
+        for name, path, size in files:
+            self.queue.put((name, None, path))
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                name, data, path = item
+                # After an error the rest of the queue is dropped
+                if self.error is not None:
+                    if path is not None:
+                        _remove(path)
+                elif path is None:
+                    self._write(name, data)
+                    self.written += 1
+                else:
+                    self._commit(name, path)
+                    self.written += 1
+            except Exception as exc:
+                self.error = exc
+            finally:
+                self.queue.task_done()
+
+    def _raise(self):
+        # Kept until abort(), so a caught error cannot let the output finish
+        if self.error is not None:
+            raise self.error
+
+    def flush(self):
+        """Wait until every queued file is written"""
+        self.queue.join()
+        self._raise()
+        self._flush()
+
+    def _stop(self):
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def close(self):
+        """Flush, stop the writer thread and finish the output
+
+        If a write failed, the output is aborted instead and the error
+        re-raised, so nothing half written is left behind.
+        """
+        try:
+            self.flush()
+        except BaseException:
+            self.abort()
+            raise
+        self._stop()
+        self._close()
+
+    def abort(self):
+        """Stop the writer thread, dropping what is still queued"""
+        self.error = self.error or RuntimeError('output aborted')
+        self._stop()
+        self.error = None
+        self._abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def _write(self, name, data):
+        raise NotImplementedError
+
+    def _commit(self, name, path):
+        raise NotImplementedError
+
+    def _flush(self):
+        pass
+
+    def _close(self):
+        pass
+
+    def _abort(self):
+        pass
+
+
+class FileWriter(QueuedWriter):
+    """Write each file atomically: a temporary sibling renamed over the target"""
+
+    def __init__(self, sync=False, queue_size=QUEUE_SIZE):
+        self.sync = sync
+        self.created = set()
+        self.dirty = set()
+        super().__init__(queue_size)
+
+    def _makedirs(self, name):
+        directory = os.path.dirname(name)
+        if directory and directory not in self.created:
+            os.makedirs(directory, exist_ok=True)
+            self.created.add(directory)
+        return directory
+
+    def spool_dir(self, name):
+        # Next to the target, so the commit is a rename
+        return self._makedirs(name) or '.'
+
+    def _write(self, name, data):
+        directory = self._makedirs(name)
+        # Hidden and unique per process, so workers never share a temp file
+        tmp = os.path.join(directory, f'.{os.path.basename(name)}.{os.getpid()}.tmp')
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(data)
+                if self.sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, name)
+        except BaseException:
+            _remove(tmp)
+            raise
+        if self.sync:
+            self.dirty.add(directory)
+
+    def _commit(self, name, path):
+        try:
+            if self.sync:
+                with open(path, 'rb') as f:
+                    os.fsync(f.fileno())
+            os.replace(path, name)
+        except BaseException:
+            _remove(path)
+            raise
+        if self.sync:
+            self.dirty.add(os.path.dirname(name))
+
+    def _flush(self):
+        # One fsync per directory makes every rename since the last flush durable
+        while self.dirty:
+            fsync_dir(self.dirty.pop())
+
+
+class ArchiveWriter(QueuedWriter):
+    """Pack every file into one zip or tar archive at ``path``"""
+
+    def __init__(self, path, sync=False, queue_size=QUEUE_SIZE):
+        self.path = path
+        self.sync = sync
+        mode = archive_mode(path)
+        self.tmp = os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}.{os.getpid()}.tmp')
+        if mode is None:
+            self.archive = zipfile.ZipFile(self.tmp, 'w', zipfile.ZIP_DEFLATED)
+        else:
+            self.archive = tarfile.open(self.tmp, mode)
+        super().__init__(queue_size)
+
+    def spool_dir(self, name):
+        return os.path.dirname(self.path) or '.'
+
+    def _write(self, name, data):
+        self._add(name, len(data), io.BytesIO(data))
+
+    def _commit(self, name, path):
+        try:
+            with open(path, 'rb') as f:
+                self._add(name, os.fstat(f.fileno()).st_size, f)
+        finally:
+            _remove(path)
+
+    def _add(self, name, size, f):
+        """Copy ``size`` bytes from the binary file ``f`` into the archive as ``name``"""
+        name = os.path.normpath(name).replace(os.sep, '/')
+        if isinstance(self.archive, zipfile.ZipFile):
+            info = zipfile.ZipInfo(name, time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.file_size = size
+            with self.archive.open(info, 'w') as member:
+                shutil.copyfileobj(f, member)
+            return
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        self.archive.addfile(info, f)
+
+    def _close(self):
+        try:
+            self.archive.close()
+            if self.sync:
+                with open(self.tmp, 'rb') as f:
+                    os.fsync(f.fileno())
+            os.replace(self.tmp, self.path)
+        except BaseException:
+            _remove(self.tmp)
+            raise
+        if self.sync:
+            fsync_dir(os.path.dirname(self.path))
+
+    def _abort(self):
+        try:
+            self.archive.close()
+        finally:
+            _remove(self.tmp)
+
+
+def open_writer(archive=None, sync=False):
+    """ArchiveWriter for an archive path, otherwise a FileWriter"""
+    if archive:
+        return ArchiveWriter(archive, sync)
+    return FileWriter(sync)
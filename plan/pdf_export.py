@@ -0,0 +1,327 @@
+"""Export wireframe SVGs into one paginated, vector PDF
+
+    python pdf_export.py -o wireframes.pdf [SVG or directory ...]
+
+Every SVG becomes one page, drawn as PDF vector operators by the
+rasterizer's tree walker (rasterize.Renderer), so stylesheet rules,
+<use> references, opacity and dashed donut arcs behave exactly as in the
+PNG output. Unlike the PNGs, rounded corners are kept and text is set in
+real fonts: the standard Helvetica faces the generator's text metrics
+come from, so nothing needs embedding.
+
+The document is streamed: each page is parsed, drawn, compressed and
+written before the next SVG is read, and only the byte offsets of the
+objects written so far, the page references and the bookmark titles stay
+in memory. Fonts and transparency states are shared objects referenced
+from a single resource dictionary, so each is written once however many
+pages use it.
+"""
+import argparse
+import math
+import os
+import time
+import xml.etree.ElementTree as ET
+import zlib
+
+from rasterize import Renderer, parse_dasharray, parse_number
+from text_metrics import text_width
+
+PX_TO_PT = 0.75
+
+# Base-14 fonts by (monospace, bold)
+FONTS = {
+    (False, False): 'Helvetica',
+    (False, True): 'Helvetica-Bold',
+    (True, False): 'Courier',
+    (True, True): 'Courier-Bold',
+}
+BOLD_WEIGHTS = ('bold', '600', '700', '800', '900')
+
+# Characters outside WinAnsiEncoding that the wireframes use
+TEXT_FALLBACKS = str.maketrans({'←': '<-', '→': '->', '✓': 'v', '•': '-'})
+
+# Control point distance for a quarter circle drawn as a cubic Bezier
+KAPPA = 0.5522847498
+
+
+def _n(value):
+    """Compact PDF number"""
+    text = f'{value:.2f}'.rstrip('0').rstrip('.')
+    return text if text != '-0' else '0'
+
+
+def _string(text):
+    data = text.translate(TEXT_FALLBACKS).encode('cp1252', 'replace')
+    return b'(' + data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)') + b')'
+
+
+def _color(color):
+    return ' '.join(_n(channel / 255) for channel in color)
+
+
+class PdfWriter:
+    """Write PDF objects to a binary file as they are produced
+
+    Object numbers for the catalog, page tree and shared resources are
+    reserved up front; those objects are written last, once every page is
+    known, followed by the cross-reference table.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.position = 0
+        self.offsets = []
+        self.kids = []
+        self.bookmarks = []
+        self.fonts = {}
+        self.alphas = {}
+        self._write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        self.catalog = self.reserve()
+        self.pages = self.reserve()
+        self.resources = self.reserve()
+
+    def _write(self, data):
+        self.f.write(data)
+        self.position += len(data)
+
+    def reserve(self):
+        self.offsets.append(None)
+        return len(self.offsets)
+
+    def write_object(self, number, body):
+        self.offsets[number - 1] = self.position
+        self._write(b'%d 0 obj\n' % number + body + b'\nendobj\n')
+
+    def font(self, monospace, bold):
+        """Resource name of a shared standard font, writing it on first use"""
+        base = FONTS[monospace, bold]
+        if base not in self.fonts:
+            number = self.reserve()
+            self.write_object(number, f'<< /Type /Font /Subtype /Type1 /BaseFont /{base} '
+                                      f'/Encoding /WinAnsiEncoding >>'.encode())
+            self.fonts[base] = (f'F{len(self.fonts) + 1}', number)
+        return self.fonts[base][0]
+
+    def alpha(self, fill, stroke):
+        """Resource name of a shared transparency state"""
+        key = (round(fill, 3), round(stroke, 3))
+        if key not in self.alphas:
+            self.alphas[key] = f'GS{len(self.alphas) + 1}'
+        return self.alphas[key]
+
+    def add_page(self, width, height, content, title=None):
+        """Write one page: its compressed content stream, then the page object"""
+        stream = zlib.compress(content, 6)
+        contents = self.reserve()
+        self.write_object(contents, b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(stream)
+                          + stream + b'\nendstream')
+        page = self.reserve()
+        self.write_object(page, (f'<< /Type /Page /Parent {self.pages} 0 R '
+                                 f'/MediaBox [0 0 {_n(width)} {_n(height)}] '
+                                 f'/Resources {self.resources} 0 R /Contents {contents} 0 R >>').encode())
+        self.kids.append(page)
+        if title:
+            self.bookmarks.append((title, page))
+
+    def close(self, title=None):
+        """Write the shared resources, page tree, bookmarks and trailer"""
+        fonts = ' '.join(f'/{name} {number} 0 R' for name, number in self.fonts.values())
+        states = ' '.join(f'/{name} << /ca {_n(fill)} /CA {_n(stroke)} >>'
+                          for (fill, stroke), name in self.alphas.items())
+        self.write_object(self.resources, f'<< /Font << {fonts} >> /ExtGState << {states} >> >>'.encode())
+        kids = ' '.join(f'{number} 0 R' for number in self.kids)
+        self.write_object(self.pages, f'<< /Type /Pages /Kids [{kids}] /Count {len(self.kids)} >>'.encode())
+
+        outlines = ''
+        if self.bookmarks:
+            root = self.reserve()
+            items = [self.reserve() for _ in self.bookmarks]
+            for i, ((name, page), number) in enumerate(zip(self.bookmarks, items)):
+                links = ''.join([f' /Prev {items[i - 1]} 0 R' if i else '',
+                                 f' /Next {items[i + 1]} 0 R' if i + 1 < len(items) else ''])
+                self.write_object(number, b'<< /Title ' + _string(name) + (
+                    f' /Parent {root} 0 R{links} /Dest [{page} 0 R /Fit] >>').encode())
+            self.write_object(root, f'<< /Type /Outlines /First {items[0]} 0 R /Last {items[-1]} 0 R '
+                                    f'/Count {len(items)} >>'.encode())
+            outlines = f' /Outlines {root} 0 R /PageMode /UseOutlines'
+        self.write_object(self.catalog, f'<< /Type /Catalog /Pages {self.pages} 0 R{outlines} >>'.encode())
+        info = self.reserve()
+        self.write_object(info, b'<< /Title ' + _string(title or 'Wireframes') + b' /Producer (pdf_export.py) >>')
+
+        xref = self.position
+        self._write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(self.offsets) + 1))
+        self._write(b''.join(b'%010d 00000 n \n' % offset for offset in self.offsets))
+        self._write(f'trailer\n<< /Size {len(self.offsets) + 1} /Root {self.catalog} 0 R '
+                    f'/Info {info} 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+
+
+class PdfPage(Renderer):
+    """Draw a parsed SVG tree as the content stream of one PDF page"""
+
+    def __init__(self, root, writer):
+        self.writer = writer
+        super().__init__(root)
+
+    def new_canvas(self, width, height):
+        # Page space is SVG pixels with y pointing down, as in the SVG
+        return [f'{_n(PX_TO_PT)} 0 0 {_n(-PX_TO_PT)} 0 {_n(self.height * PX_TO_PT)} cm']
+
+    def content(self):
+        return '\n'.join(self.render()).encode('latin-1')
+
+    def shape(self, el, style, opacity, path, fill=True):
+        """Fill and stroke ``path`` (a list of operators) inside q/Q"""
+        ops = ['q']
+        fill_color, fill_alpha = self.paint(el, style, 'fill', opacity) if fill else (None, 0.0)
+        stroke_color, stroke_alpha = self.paint(el, style, 'stroke', opacity)
+        fill_alpha = fill_alpha if fill_color is not None else 0.0
+        stroke_alpha = stroke_alpha if stroke_color is not None else 0.0
+        if fill_alpha <= 0 and stroke_alpha <= 0:
+            return
+        if 0 < fill_alpha < 1 or 0 < stroke_alpha < 1:
+            ops.append(f'/{self.writer.alpha(fill_alpha or 1, stroke_alpha or 1)} gs')
+        if fill_alpha > 0:
+            ops.append(f'{_color(fill_color)} rg')
+        if stroke_alpha > 0:
+            ops.append(f'{_color(stroke_color)} RG {_n(parse_number(style.get("stroke-width"), 1.0))} w')
+            pattern = parse_dasharray(style.get('stroke-dasharray', el.get('stroke-dasharray')))
+            if pattern:
+                offset = parse_number(style.get('stroke-dashoffset', el.get('stroke-dashoffset')))
+                ops.append(f'[{" ".join(_n(part) for part in pattern)}] {_n(offset)} d')
+        ops.extend(path)
+        ops.append('B' if fill_alpha > 0 and stroke_alpha > 0 else 'f' if fill_alpha > 0 else 'S')
+        ops.append('Q')
+        self.canvas.append(' '.join(ops))
+
+    def rect(self, el, style, dx, dy, opacity):
+        x = parse_number(el.get('x')) + dx
+        y = parse_number(el.get('y')) + dy
+        width = parse_number(el.get('width'))
+        height = parse_number(el.get('height'))
+        rx = parse_number(el.get('rx', el.get('ry')))
+        ry = parse_number(el.get('ry', el.get('rx')))
+        rx, ry = min(rx, width / 2), min(ry, height / 2)
+        if not rx or not ry:
+            path = [f'{_n(x)} {_n(y)} {_n(width)} {_n(height)} re']
+        else:
+            kx, ky = rx * (1 - KAPPA), ry * (1 - KAPPA)
+            right, bottom = x + width, y + height
+            path = [
+                f'{_n(x + rx)} {_n(y)} m {_n(right - rx)} {_n(y)} l',
+                f'{_n(right - kx)} {_n(y)} {_n(right)} {_n(y + ky)} {_n(right)} {_n(y + ry)} c',
+                f'{_n(right)} {_n(bottom - ry)} l',
+                f'{_n(right)} {_n(bottom - ky)} {_n(right - kx)} {_n(bottom)} {_n(right - rx)} {_n(bottom)} c',
+                f'{_n(x + rx)} {_n(bottom)} l',
+                f'{_n(x + kx)} {_n(bottom)} {_n(x)} {_n(bottom - ky)} {_n(x)} {_n(bottom - ry)} c',
+                f'{_n(x)} {_n(y + ry)} l',
+                f'{_n(x)} {_n(y + ky)} {_n(x + kx)} {_n(y)} {_n(x + rx)} {_n(y)} c h',
+            ]
+        self.shape(el, style, opacity, path)
+
+    def circle(self, el, style, dx, dy, opacity, angle=0.0):
+        cx = parse_number(el.get('cx')) + dx
+        cy = parse_number(el.get('cy')) + dy
+        r = parse_number(el.get('r'))
+        k = r * KAPPA
+        # Start at 3 o'clock and run clockwise on screen, where dashes begin
+        path = [
+            f'{_n(cx + r)} {_n(cy)} m',
+            f'{_n(cx + r)} {_n(cy + k)} {_n(cx + k)} {_n(cy + r)} {_n(cx)} {_n(cy + r)} c',
+            f'{_n(cx - k)} {_n(cy + r)} {_n(cx - r)} {_n(cy + k)} {_n(cx - r)} {_n(cy)} c',
+            f'{_n(cx - r)} {_n(cy - k)} {_n(cx - k)} {_n(cy - r)} {_n(cx)} {_n(cy - r)} c',
+            f'{_n(cx + k)} {_n(cy - r)} {_n(cx + r)} {_n(cy - k)} {_n(cx + r)} {_n(cy)} c',
+        ]
+        if angle:
+            a = math.radians(angle)
+            cos, sin = math.cos(a), math.sin(a)
+            path.insert(0, f'{_n(cos)} {_n(sin)} {_n(-sin)} {_n(cos)} '
+                           f'{_n(cx - cos * cx + sin * cy)} {_n(cy - sin * cx - cos * cy)} cm')
+        self.shape(el, style, opacity, path)
+
+    def line(self, el, style, dx, dy, opacity):
+        x1 = parse_number(el.get('x1')) + dx
+        y1 = parse_number(el.get('y1')) + dy
+        x2 = parse_number(el.get('x2')) + dx
+        y2 = parse_number(el.get('y2')) + dy
+        self.shape(el, style, opacity, [f'{_n(x1)} {_n(y1)} m {_n(x2)} {_n(y2)} l'], fill=False)
+
+    def text(self, el, style, dx, dy, opacity):
+        content = ' '.join(''.join(el.itertext()).split())
+        if not content:
+            return
+        family = style.get('font-family', 'Arial')
+        size = parse_number(style.get('font-size'), 16.0)
+        weight = style.get('font-weight', 'normal')
+        x = parse_number(el.get('x')) + dx
+        y = parse_number(el.get('y')) + dy
+        anchor = style.get('text-anchor', 'start')
+        if anchor in ('middle', 'end'):
+            x -= text_width(content, family, size, weight) / (2 if anchor == 'middle' else 1)
+        color, alpha = self.paint(el, style, 'fill', opacity)
+        if color is None or alpha <= 0:
+            return
+        font = self.writer.font('mono' in family.lower() or 'courier' in family.lower(), weight in BOLD_WEIGHTS)
+        ops = ['q']
+        if alpha < 1:
+            ops.append(f'/{self.writer.alpha(alpha, 1)} gs')
+        # The text matrix flips y back so glyphs stand upright in page space
+        ops.append(f'{_color(color)} rg BT /{font} {_n(size)} Tf 1 0 0 -1 {_n(x)} {_n(y)} Tm '
+                   f'{_string(content).decode("latin-1")} Tj ET Q')
+        self.canvas.append(' '.join(ops))
+
+
+def svg_files(paths):
+    """SVG paths in order, expanding directories to their sorted *.svg files"""
+    for path in paths:
+        if os.path.isdir(path):
+            yield from (os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.svg'))
+        else:
+            yield path
+
+
+def export_pdf(svg_paths, out_path, title=None):
+    """Write every SVG as a page of ``out_path``; return the page count
+
+    ``svg_paths`` may be any iterable, including a generator, and is read
+    one file at a time.
+    """
+    count = 0
+    tmp = out_path + '.tmp'
+    with open(tmp, 'wb') as f:
+        writer = PdfWriter(f)
+        for path in svg_paths:
+            page = PdfPage(ET.parse(path).getroot(), writer)
+            content = page.content()
+            writer.add_page(page.width * PX_TO_PT, page.height * PX_TO_PT, content,
+                            os.path.splitext(os.path.basename(path))[0])
+            count += 1
+        writer.close(title)
+    os.replace(tmp, out_path)
+    return count
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Export wireframe SVGs into one PDF')
+    parser.add_argument('svgs', nargs='*', metavar='SVG',
+                        help='SVG files or directories of them (default: the generated pages)')
+    parser.add_argument('-o', '--output', default='wireframes.pdf', help='PDF file to write')
+    parser.add_argument('--title', default='Bug Tracker Wireframes', help='document title')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Export the SVGs given on the command line"""
+    args = parse_args(argv)
+    if args.svgs:
+        paths = svg_files(args.svgs)
+    else:
+        # Imported here because create_wireframes imports this module
+        from create_wireframes import PAGES
+        paths = [filename for filename, spec in PAGES]
+    start = time.perf_counter()
+    count = export_pdf(paths, args.output, args.title)
+    print(f"Created {args.output}: {count} pages in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+"""Preview server: render the wireframes on request
+
+    python preview_server.py [--port 8000] [--spec FILE] [--data PATH]
+
+A small asyncio HTTP/1.1 server (stdlib only) that renders pages with the
+in-memory builders instead of reading the SVG files from disk. ``/``
+lists the pages and ``/<page>.svg`` renders one; ``?theme=dark`` and
+``?viewport=mobile`` (or a pixel width) pick a variant.
+
+A page's ETag is its build manifest digest (spec, render options, theme,
+data files and generator code). It is known before anything is rendered,
+so a matching If-None-Match is answered 304 straight away. Working out a
+URL's digest hashes files and binds data, so it runs on the render
+thread like the renders; the result is remembered per URL until the
+data changes, and later requests for the URL get their 304 or cached
+page without waiting for that thread. Rendered pages are kept in an LRU
+together with their gzip encoding. Concurrent requests for a page that
+is not cached yet share a single render: the first request starts it
+and the others await the same future.
+
+The --data files are checked for a new mtime or size on every request;
+when their contents changed the statistics are reloaded before any page
+is routed, so a new ETag always comes with the new numbers. A page that
+fails to render is answered 500 with the error.
+"""
+import argparse
+import asyncio
+import hashlib
+import html
+import os
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from build_manifest import file_digest, page_digest
+from create_wireframes import page_list
+from dashboard_data import bind_data, data_inputs, has_metrics, load_stats
+from svg_minify import compress
+from variants import fit_viewport, parse_viewport
+from wireframe_engine import render_page
+from wireframe_specs import THEMES
+
+CACHE_SIZE = 64
+MAX_HEADERS = 100
+# Larger request bodies are not read; the connection is closed instead
+MAX_DISCARD = 1 << 20
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+class BadRequest(Exception):
+    pass
+
+
+def render(spec, options, theme):
+    """SVG bytes of one page and their gzip encoding"""
+    body = render_page(spec, None, theme=theme, **options).encode('utf-8')
+    return body, compress(body, 'gz')
+
+
+class PageCache:
+    """LRU of rendered pages, keyed on their digest, with single-flight renders
+
+    Renders run one at a time on a worker thread, so the engine's caches
+    are only ever touched by that thread and the event loop keeps serving
+    cached pages and 304s meanwhile. Other jobs that touch those caches
+    go through ``run`` onto the same thread.
+    """
+
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+        self.pending = {}
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='render')
+        self.renders = 0
+
+    async def run(self, func, *args):
+        """Call ``func(*args)`` on the render thread"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def get(self, digest, job):
+        """(body, gzip body) for ``digest``, rendering ``job`` if needed"""
+        entry = self.entries.get(digest)
+        if entry is not None:
+            self.entries.move_to_end(digest)
+            return entry
+        future = self.pending.get(digest)
+        if future is None:
+            future = self.pending[digest] = asyncio.ensure_future(self._render(digest, job))
+        # A client that disconnects must not cancel the render for the others
+        return await asyncio.shield(future)
+
+    async def _render(self, digest, job):
+        try:
+            entry = await self.run(render, *job)
+        finally:
+            del self.pending[digest]
+        self.renders += 1
+        self.entries[digest] = entry
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+        return entry
+
+
+def accepts_gzip(value):
+    """True if an Accept-Encoding header value allows gzip
+
+    An explicit gzip entry takes precedence over ``*``. A q-value that
+    does not parse counts as 1, like a missing one.
+    """
+    qualities = {}
+    for part in value.split(','):
+        name, *params = part.split(';')
+        q = 1.0
+        for param in params:
+            key, _, number = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(number)
+                except ValueError:
+                    pass
+        qualities.setdefault(name.strip().lower(), q)
+    return qualities.get('gzip', qualities.get('*', 0)) > 0
+
+
+def etag_matches(value, etag):
+    """Weak comparison of an If-None-Match header value against ``etag``"""
+    tags = [tag.strip() for tag in value.split(',')]
+    return '*' in tags or any(tag.removeprefix('W/') == etag.removeprefix('W/') for tag in tags)
+
+
+async def read_request(reader):
+    """(method, target, version, headers) of the next request, or None at EOF"""
+    line = await reader.readline()
+    if not line:
+        return None
+    parts = line.decode('latin-1').split()
+    if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+        raise BadRequest(line)
+    headers = {}
+    for _ in range(MAX_HEADERS):
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            return parts[0], parts[1], parts[2], headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    raise BadRequest('too many headers')
+
+
+async def discard_body(reader, headers):
+    """Read and drop a request body; False if the connection must close instead
+
+    A body left unread would be parsed as the next request. Chunked and
+    oversized bodies are not read.
+    """
+    if headers.get('transfer-encoding', 'identity').lower() != 'identity':
+        return False
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise BadRequest('bad Content-Length')
+    if length < 0:
+        raise BadRequest('bad Content-Length')
+    if length > MAX_DISCARD:
+        return False
+    await reader.readexactly(length)
+    return True
+
+
+class PreviewServer:
+    """Serves every page of ``pages`` ([(filename, spec)]) from memory"""
+
+    def __init__(self, pages, options=None, data=None, cache_size=CACHE_SIZE):
+        self.pages = dict(pages)
+        self.options = options or {}
+        self.data = data
+        self.inputs = []
+        self.stats = None
+        self.stamp = None
+        self.data_digest = None
+        self.reloading = None
+        self.cache = PageCache(cache_size)
+        # (path, query, data digest) -> route(); read and written on the event loop only
+        self.routes = OrderedDict()
+        self.routes_size = cache_size
+        if data:
+            self.data_changed()
+            self.reload_data()
+
+    def data_changed(self):
+        """True if a data file was added, removed or touched since the last call"""
+        if not self.data:
+            return False
+        stamp = []
+        for path in data_inputs(self.data):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stamp.append((path, st.st_mtime_ns, st.st_size))
+        if stamp == self.stamp:
+            return False
+        self.stamp = stamp
+        return True
+
+    def reload_data(self):
+        """Reload the statistics if the data files' contents changed"""
+        file_digest.cache_clear()
+        inputs = data_inputs(self.data)
+        h = hashlib.sha256()
+        for path in inputs:
+            h.update(file_digest(path).encode())
+        if h.hexdigest() != self.data_digest:
+            self.inputs, self.stats = inputs, load_stats(self.data)
+            self.data_digest = h.hexdigest()
+
+    async def refresh(self):
+        """Bring the statistics up to date before a request is routed
+
+        The reload runs on the render thread, after any render already
+        queued; requests arriving meanwhile await the same reload.
+        """
+        if self.data_changed():
+            loop = asyncio.get_running_loop()
+            self.reloading = loop.run_in_executor(self.cache.executor, self.reload_data)
+        if self.reloading is not None:
+            await asyncio.shield(self.reloading)
+
+    async def lookup(self, path, query):
+        """route() on the render thread, remembered per URL until the data changes"""
+        key = (path, query, self.data_digest)
+        if key in self.routes:
+            self.routes.move_to_end(key)
+            return self.routes[key]
+        route = await self.cache.run(self.route, path, query)
+        self.routes[key] = route
+        if len(self.routes) > self.routes_size:
+            self.routes.popitem(last=False)
+        return route
+
+    def route(self, path, query):
+        """(digest, render job) for a page URL, or None if there is no such page
+
+        Raises ValueError for an unknown theme or viewport. Call it on the
+        render thread (see lookup).
+        """
+        spec = self.pages.get(path.lstrip('/'))
+        if spec is None:
+            return None
+        params = {key: values[-1] for key, values in parse_qs(query).items()}
+        theme = None
+        if params.get('theme'):
+            if params['theme'] not in THEMES:
+                raise ValueError(f"Unknown theme {params['theme']!r}; use one of {', '.join(THEMES)}")
+            theme = THEMES[params['theme']]
+        if params.get('viewport'):
+            spec = fit_viewport(spec, parse_viewport(params['viewport'])[1])
+        inputs = self.inputs if self.stats is not None and has_metrics(spec) else ()
+        digest = page_digest(spec, self.options, theme, inputs)
+        if inputs:
+            spec = bind_data(spec, self.stats)
+        return digest, (spec, self.options, theme)
+
+    def index(self):
+        links = ''.join(
+            f'<li><a href="{html.escape(name)}">{html.escape(name)}</a> '
+            + ' '.join(f'<a href="{html.escape(name)}?theme={theme}">{theme}</a>' for theme in THEMES if theme != 'light')
+            + '</li>\n'
+            for name in self.pages
+        )
+        return ('<!DOCTYPE html>\n<meta charset="utf-8">\n<title>Wireframes</title>\n'
+                f'<ul>\n{links}</ul>\n').encode('utf-8')
+
+    async def respond(self, method, target, headers):
+        """(status, headers, body) for one request"""
+        if method not in ('GET', 'HEAD'):
+            return 405, {'Allow': 'GET, HEAD'}, b''
+        url = urlsplit(target)
+        if url.path == '/':
+            return 200, {'Content-Type': 'text/html; charset=utf-8'}, self.index()
+        await self.refresh()
+        try:
+            route = await self.lookup(url.path, url.query)
+        except ValueError as exc:
+            return 400, {'Content-Type': 'text/plain; charset=utf-8'}, str(exc).encode('utf-8')
+        if route is None:
+            return 404, {'Content-Type': 'text/plain; charset=utf-8'}, b'No such page'
+
+        digest, job = route
+        # Weak, so one tag covers the plain and the gzip encoding
+        etag = f'W/"{digest[:32]}"'
+        head = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+        if etag_matches(headers.get('if-none-match', ''), etag):
+            return 304, head, b''
+        body, compressed = await self.cache.get(digest, job)
+        head['Content-Type'] = 'image/svg+xml; charset=utf-8'
+        if accepts_gzip(headers.get('accept-encoding', '')):
+            head['Content-Encoding'] = 'gzip'
+            body = compressed
+        return 200, head, body
+
+    async def handle(self, reader, writer):
+        """Serve one connection, keeping it open between HTTP/1.1 requests"""
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except BadRequest:
+                    request = None
+                    writer.write(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+                if request is None:
+                    break
+                method, target, version, headers = request
+                start = time.perf_counter()
+                try:
+                    drained = await discard_body(reader, headers)
+                except BadRequest:
+                    writer.write(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+                    break
+                try:
+                    status, head, body = await self.respond(method, target, headers)
+                except Exception as exc:
+                    traceback.print_exc()
+                    status, head = 500, {'Content-Type': 'text/plain; charset=utf-8'}
+                    body = f'{type(exc).__name__}: {exc}'.encode('utf-8')
+                keep_alive = (drained and version == 'HTTP/1.1'
+                              and headers.get('connection', '').lower() != 'close')
+                lines = [f'HTTP/1.1 {status} {REASONS[status]}', f'Content-Length: {len(body)}']
+                lines += [f'{name}: {value}' for name, value in head.items()]
+                if not keep_alive:
+                    lines.append('Connection: close')
+                writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+                if method != 'HEAD':
+                    writer.write(body)
+                await writer.drain()
+                print(f"{method} {target} {status} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Serving {len(self.pages)} wireframes on http://{host}:{port}/")
+        async with server:
+            await server.serve_forever()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Serve the wireframes, rendered on request')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE,
+                        help='number of rendered pages to keep in memory')
+    parser.add_argument('--instanced', action='store_true',
+                        help='write repeated shapes once in <defs> and reference them with <use>')
+    parser.add_argument('--spec', action='append', default=[], metavar='FILE',
+                        help='also serve a page spec from a JSON or YAML file')
+    parser.add_argument('--data', metavar='PATH',
+                        help='fill dashboard statistics from mockStats.js or a directory of records')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the preview server until interrupted"""
+    args = parse_args(argv)
+    options = {'instanced': True} if args.instanced else {}
+    server = PreviewServer(page_list(args.spec), options, args.data, args.cache_size)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Opt-in render profiling: timed spans per page and per component
+
+    python create_wireframes.py --force --trace trace.json
+
+While a Tracer is active, the engine records a span for:
+- every page it renders;
+- the page's layout solve;
+- each component builder, with the number of elements it emitted;
+- instancing;
+- the stylesheet;
+- serialization.
+
+``write`` saves the spans in the Chrome trace event format, which
+chrome://tracing, Perfetto and speedscope all open. A name ending in
+.speedscope.json gets speedscope's own evented format instead.
+``summary`` totals the time and elements per component type.
+
+With no tracer active, the engine checks ``profiling.tracer is None``
+once per page and once per component, and records nothing.
+"""
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+# The active Tracer, or None when profiling is off
+tracer = None
+
+
+class Span:
+    """Times a ``with`` block; the dict it yields becomes the span's args"""
+
+    __slots__ = ('events', 'name', 'category', 'args', 'start')
+
+    def __init__(self, events, name, category, args):
+        self.events = events
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self.args
+
+    def __exit__(self, *exc):
+        self.events.append((self.name, self.category, self.start, time.perf_counter_ns(),
+                            threading.get_ident(), self.args))
+        return False
+
+
+class Tracer:
+    """Collects spans as (name, category, start ns, end ns, thread, args)"""
+
+    def __init__(self):
+        self.events = []
+        self.origin = time.perf_counter_ns()
+
+    def span(self, name, category, **args):
+        return Span(self.events, name, category, args)
+
+    def chrome_trace(self):
+        pid = os.getpid()
+        threads = {}
+        events = []
+        for name, category, start, end, thread, args in self.events:
+            events.append({'name': name, 'cat': category, 'ph': 'X', 'pid': pid,
+                           'tid': threads.setdefault(thread, len(threads) + 1),
+                           'ts': (start - self.origin) / 1000, 'dur': (end - start) / 1000, 'args': args})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def speedscope(self, name='wireframes'):
+        """Speedscope evented profile; spans nest by time as they ran"""
+        frames = {}
+        events = []
+        stack = []
+        spans = sorted(self.events, key=lambda event: (event[2], -event[3]))
+        for span_name, category, start, end, thread, args in spans:
+            while stack and stack[-1][0] <= start:
+                events.append({'type': 'C', 'frame': stack[-1][1], 'at': (stack.pop()[0] - self.origin) / 1000})
+            frame = frames.setdefault(span_name, len(frames))
+            events.append({'type': 'O', 'frame': frame, 'at': (start - self.origin) / 1000})
+            stack.append((end, frame))
+        while stack:
+            end, frame = stack.pop()
+            events.append({'type': 'C', 'frame': frame, 'at': (end - self.origin) / 1000})
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': [{'name': frame} for frame in frames]},
+            'profiles': [{'type': 'evented', 'name': name, 'unit': 'microseconds', 'startValue': 0,
+                          'endValue': events[-1]['at'] if events else 0, 'events': events}],
+        }
+
+    def write(self, path):
+        """Save the spans as a Chrome trace, or speedscope for *.speedscope.json"""
+        data = self.speedscope() if path.endswith('.speedscope.json') else self.chrome_trace()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def summary(self, limit=15):
+        """Table of the costliest span names: calls, total ms, elements"""
+        totals = defaultdict(lambda: [0, 0, 0])
+        for name, category, start, end, thread, args in self.events:
+            total = totals[category, name]
+            total[0] += 1
+            total[1] += end - start
+            total[2] += args.get('elements', 0)
+        rows = sorted(totals.items(), key=lambda item: -item[1][1])[:limit]
+        lines = [f"{'span':32} {'calls':>7} {'total ms':>10} {'elements':>10}"]
+        for (category, name), (calls, ns, elements) in rows:
+            lines.append(f"{category + ' ' + name:32} {calls:7} {ns / 1e6:10.2f} {elements:10}")
+        return '\n'.join(lines)
+
+
+def enable():
+    """Start recording spans into a new Tracer and return it"""
+    global tracer
+    tracer = Tracer()
+    return tracer
+
+
+def disable():
+    """Stop recording; return the Tracer that was active"""
+    global tracer
+    active, tracer = tracer, None
+    return active
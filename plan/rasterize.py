@@ -0,0 +1,647 @@
+"""Rasterize wireframe SVGs to PNG and WebP
+
+A small pure-Python renderer for the SVG subset the wireframes use: rect,
+circle (including the dashed arcs of donut charts), line, text, <g> with
+translate() and opacity, <defs>/<use> and <style> rules that select by
+tag or class. Rectangles keep their rx/ry corner radii. Text is drawn
+with the bundled bitmap_font, each glyph placed by the same Helvetica
+metrics the generator lays labels out with, so no font library is needed
+and every machine renders the same pixels. ``--greek`` draws one bar per
+word instead, for reviewing layout without reading the labels.
+
+PNG is encoded with zlib alone; WebP needs Pillow. Thumbnails are
+rendered supersampled and box-filtered down. Every output is cached on
+disk under the SHA-256 of the SVG bytes and the render settings, so an
+unchanged page is never rasterized twice, and cache misses are spread
+over a process pool.
+
+    python rasterize.py admin-dashboard-wireframe.svg --format png --format webp
+"""
+import argparse
+import hashlib
+import math
+import os
+import re
+import shutil
+import struct
+import time
+import xml.etree.ElementTree as ET
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import add
+
+from bitmap_font import CAP_ROWS, glyph
+from build_manifest import file_digest
+from text_metrics import text_width
+
+CACHE_DIR = '.raster-cache'
+FORMATS = ('png', 'webp')
+THUMBNAIL_WIDTH = 320
+SUPERSAMPLE = 3
+
+SVG_NS = '{http://www.w3.org/2000/svg}'
+
+# Helvetica's cap height in em, which the bitmap font's CAP_ROWS span
+CAP_HEIGHT = 0.718
+BOLD_WEIGHTS = ('bold', 'bolder', '600', '700', '800', '900')
+
+NAMED_COLORS = {
+    'black': (0, 0, 0),
+    'white': (255, 255, 255),
+    'red': (255, 0, 0),
+    'green': (0, 128, 0),
+    'blue': (0, 0, 255),
+    'yellow': (255, 255, 0),
+    'orange': (255, 165, 0),
+    'gray': (128, 128, 128),
+    'grey': (128, 128, 128),
+    'lightgray': (211, 211, 211),
+    'lightgrey': (211, 211, 211),
+    'darkgray': (169, 169, 169),
+    'darkgrey': (169, 169, 169),
+}
+
+# Presentation attributes passed from <g> and <use> to their children
+INHERITED = ('fill', 'stroke', 'stroke-width', 'font-family', 'font-size', 'font-weight', 'text-anchor')
+
+_RULE = re.compile(r'([^{}]+)\{([^}]*)\}')
+_TRANSFORM = re.compile(r'(\w+)\s*\(([^)]*)\)')
+_NUMBERS = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+def parse_color(value):
+    """(r, g, b) for a colour attribute, or None for 'none'"""
+    if value is None:
+        return (0, 0, 0)
+    value = value.strip().lower()
+    if value in ('none', 'transparent'):
+        return None
+    if value.startswith('#'):
+        digits = value[1:]
+        if len(digits) == 3:
+            digits = ''.join(d * 2 for d in digits)
+        return tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4))
+    if value.startswith('rgb'):
+        return tuple(int(float(n)) for n in _NUMBERS.findall(value)[:3])
+    return NAMED_COLORS.get(value, (0, 0, 0))
+
+
+def parse_number(value, default=0.0):
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    match = _NUMBERS.match(value.strip())
+    return float(match.group()) if match else default
+
+
+def parse_stylesheet(css):
+    """{selector: {property: value}} for simple 'tag' and '.class' rules"""
+    rules = {}
+    for selectors, body in _RULE.findall(css):
+        declarations = dict(part.split(':', 1) for part in body.split(';') if ':' in part)
+        declarations = {name.strip(): value.strip() for name, value in declarations.items()}
+        for selector in selectors.split(','):
+            rules.setdefault(selector.strip(), {}).update(declarations)
+    return rules
+
+
+def parse_transform(value):
+    """(dx, dy, degrees) from translate() and rotate() parts of a transform"""
+    dx = dy = angle = 0.0
+    for name, args in _TRANSFORM.findall(value or ''):
+        numbers = [float(n) for n in _NUMBERS.findall(args)]
+        if name == 'translate' and numbers:
+            dx += numbers[0]
+            dy += numbers[1] if len(numbers) > 1 else 0.0
+        elif name == 'rotate' and numbers:
+            angle += numbers[0]
+    return dx, dy, angle
+
+
+def parse_dasharray(value):
+    if not value or value == 'none':
+        return None
+    pattern = [float(n) for n in _NUMBERS.findall(value)]
+    if len(pattern) % 2:
+        pattern *= 2
+    return pattern if sum(pattern) > 0 else None
+
+
+def dash_intervals(length, pattern, offset=0.0):
+    """(start, end) of the drawn dashes along a path of ``length``"""
+    if not pattern:
+        yield 0.0, length
+        return
+    period = sum(pattern)
+    position = -(offset % period)
+    while position < length:
+        for i, part in enumerate(pattern):
+            if i % 2 == 0 and position + part > 0:
+                yield max(position, 0.0), min(position + part, length)
+            position += part
+
+
+def _px(value):
+    return math.floor(value + 0.5)
+
+
+@lru_cache(maxsize=256)
+def _blend_tables(color, alpha):
+    return [bytes(_px(v * (1 - alpha) + c * alpha) for v in range(256)) for c in color]
+
+
+def _rounded_row(y, x0, y0, x1, y1, rx, ry):
+    """(left, right) of a rounded rectangle along the line ``y``, or None"""
+    if not y0 <= y < y1 or x0 >= x1:
+        return None
+    edge = min(y - y0, y1 - y)
+    if edge >= ry or rx <= 0:
+        return x0, x1
+    t = 1 - edge / ry
+    inset = rx * (1 - math.sqrt(1 - t * t))
+    return x0 + inset, x1 - inset
+
+
+class Canvas:
+    """An RGB pixel buffer with span and rectangle fills"""
+
+    def __init__(self, width, height, background=(255, 255, 255)):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(bytes(background) * (width * height))
+
+    def span(self, y, x0, x1, color, tables=None):
+        """Fill pixels x0 <= x < x1 of row y (pixel coordinates)"""
+        x0 = max(x0, 0)
+        x1 = min(x1, self.width)
+        if x0 >= x1 or not 0 <= y < self.height:
+            return
+        start = (y * self.width + x0) * 3
+        end = start + (x1 - x0) * 3
+        if tables is None:
+            self.pixels[start:end] = bytes(color) * (x1 - x0)
+            return
+        pixels = self.pixels
+        for channel, table in enumerate(tables):
+            pixels[start + channel:end:3] = pixels[start + channel:end:3].translate(table)
+
+    def fill(self, x0, y0, x1, y1, color, alpha=1.0):
+        """Fill the rectangle between two corners given in canvas units"""
+        if color is None or alpha <= 0:
+            return
+        tables = _blend_tables(color, alpha) if alpha < 1 else None
+        left, right = _px(min(x0, x1)), _px(max(x0, x1))
+        for y in range(max(_px(min(y0, y1)), 0), min(_px(max(y0, y1)), self.height)):
+            self.span(y, left, right, color, tables)
+
+    def fill_rounded(self, x0, y0, x1, y1, rx, ry, color, alpha=1.0, hole=None):
+        """Fill a rectangle with elliptical corners, given in canvas units
+
+        ``hole`` is another (x0, y0, x1, y1, rx, ry) left unpainted inside
+        it, which is how rounded outlines are stroked.
+        """
+        if color is None or alpha <= 0:
+            return
+        tables = _blend_tables(color, alpha) if alpha < 1 else None
+        for y in range(max(_px(y0), 0), min(_px(y1), self.height)):
+            outer = _rounded_row(y + 0.5, x0, y0, x1, y1, rx, ry)
+            if outer is None:
+                continue
+            inner = hole and _rounded_row(y + 0.5, *hole)
+            if inner is None:
+                self.span(y, _px(outer[0]), _px(outer[1]), color, tables)
+            else:
+                self.span(y, _px(outer[0]), _px(inner[0]), color, tables)
+                self.span(y, _px(inner[1]), _px(outer[1]), color, tables)
+
+    def downsample(self, factor):
+        """A new canvas ``factor`` times smaller, each pixel the mean of a block"""
+        width, height = self.width // factor, self.height // factor
+        small = Canvas(width, height)
+        stride = self.width * 3
+        step = factor * 3
+        count = factor * factor
+        mean = count.__rfloordiv__
+        for y in range(height):
+            top = y * factor * stride
+            block = self.pixels[top:top + width * step]
+            for k in range(1, factor):
+                row = top + k * stride
+                block = list(map(add, block, self.pixels[row:row + width * step]))
+            start = y * width * 3
+            for channel in range(3):
+                sums = block[channel::step]
+                for j in range(1, factor):
+                    sums = list(map(add, sums, block[j * 3 + channel::step]))
+                small.pixels[start + channel:start + width * 3:3] = bytes(map(mean, sums))
+        return small
+
+
+class Renderer:
+    """Draw a parsed SVG tree onto a canvas at a given scale"""
+
+    def __init__(self, root, scale=1.0, greek=False):
+        self.scale = scale
+        self.greek = greek
+        width = parse_number(root.get('width'), 0)
+        height = parse_number(root.get('height'), 0)
+        view_box = [float(n) for n in _NUMBERS.findall(root.get('viewBox', ''))]
+        if not width and len(view_box) == 4:
+            width, height = view_box[2], view_box[3]
+        self.width, self.height = width, height
+        self.canvas = self.new_canvas(max(_px(width * scale), 1), max(_px(height * scale), 1))
+        self.defs = {el.get('id'): el for el in root.iter() if el.get('id')}
+        self.rules = {}
+        for el in root.iter(f'{SVG_NS}style'):
+            for selector, declarations in parse_stylesheet(''.join(el.itertext())).items():
+                self.rules.setdefault(selector, {}).update(declarations)
+        self.root = root
+        # Resolved styles by (id of parent style, ...); the dicts are kept
+        # alive here, so their ids are never reused while rendering
+        self.root_style = {}
+        self.styles = {}
+
+    def new_canvas(self, width, height):
+        return Canvas(width, height)
+
+    def render(self):
+        self.draw_children(self.root, self.root_style, 0.0, 0.0, 1.0)
+        return self.canvas
+
+    def draw_children(self, parent, style, dx, dy, opacity):
+        for child in parent:
+            self.draw(child, style, dx, dy, opacity)
+
+    def resolve_style(self, el, tag, style):
+        """Style of ``el`` under its parent's ``style``
+
+        Memoized on the parent style, tag, class and presentation
+        attributes, so elements styled alike share one dict and a large
+        page resolves each distinct style only once.
+        """
+        attrib = el.attrib
+        own = () if attrib.keys().isdisjoint(INHERITED) else tuple(
+            (name, attrib[name]) for name in INHERITED if name in attrib)
+        key = (id(style), tag, attrib.get('class'), own)
+        resolved = self.styles.get(key)
+        if resolved is None:
+            resolved = dict(style)
+            resolved.update(own)
+            # Stylesheet rules override presentation attributes
+            if self.rules:
+                for selector in [tag] + [f'.{name}' for name in attrib.get('class', '').split()]:
+                    resolved.update(self.rules.get(selector, ()))
+            self.styles[key] = resolved
+        return resolved
+
+    def inherited(self, style):
+        """The part of ``style`` that <g> and <use> pass to their children"""
+        key = ('inherited', id(style))
+        passed = self.styles.get(key)
+        if passed is None:
+            passed = self.styles[key] = {name: value for name, value in style.items() if name in INHERITED}
+        return passed
+
+    def draw(self, el, style, dx, dy, opacity):
+        tag = el.tag.replace(SVG_NS, '') if isinstance(el.tag, str) else ''
+        if tag in ('defs', 'style', 'title', 'desc', ''):
+            return
+        style = self.resolve_style(el, tag, style)
+        if 'opacity' in style or 'opacity' in el.attrib:
+            opacity *= parse_number(style.get('opacity', el.get('opacity')), 1.0)
+            if opacity <= 0:
+                return
+        angle = 0.0
+        if 'transform' in el.attrib:
+            tx, ty, angle = parse_transform(el.get('transform'))
+            dx, dy = dx + tx, dy + ty
+
+        if tag in ('g', 'use'):
+            style = self.inherited(style)
+        if tag == 'g':
+            self.draw_children(el, style, dx, dy, opacity)
+        elif tag == 'use':
+            target = self.defs.get((el.get('href') or el.get('{http://www.w3.org/1999/xlink}href') or '')[1:])
+            if target is not None:
+                self.draw(target, style, dx + parse_number(el.get('x')), dy + parse_number(el.get('y')), opacity)
+        elif tag == 'rect':
+            self.rect(el, style, dx, dy, opacity)
+        elif tag == 'circle':
+            self.circle(el, style, dx, dy, opacity, angle)
+        elif tag == 'line':
+            self.line(el, style, dx, dy, opacity)
+        elif tag == 'text':
+            self.text(el, style, dx, dy, opacity)
+
+    def paint(self, el, style, kind, opacity):
+        """Colour and alpha for the fill or stroke of ``el``"""
+        default = 'black' if kind == 'fill' else 'none'
+        color = parse_color(style.get(kind, default))
+        alpha = opacity * parse_number(style.get(f'{kind}-opacity', el.get(f'{kind}-opacity')), 1.0)
+        return color, alpha
+
+    def rect(self, el, style, dx, dy, opacity):
+        s = self.scale
+        x = (parse_number(el.get('x')) + dx) * s
+        y = (parse_number(el.get('y')) + dy) * s
+        width = parse_number(el.get('width')) * s
+        height = parse_number(el.get('height')) * s
+        # A missing radius takes the other's value; both stop at half the side
+        rx, ry = el.get('rx'), el.get('ry')
+        rx, ry = parse_number(rx if rx is not None else ry), parse_number(ry if ry is not None else rx)
+        rx, ry = min(max(rx, 0.0) * s, width / 2), min(max(ry, 0.0) * s, height / 2)
+        color, alpha = self.paint(el, style, 'fill', opacity)
+        if rx and ry:
+            self.canvas.fill_rounded(x, y, x + width, y + height, rx, ry, color, alpha)
+        else:
+            self.canvas.fill(x, y, x + width, y + height, color, alpha)
+
+        color, alpha = self.paint(el, style, 'stroke', opacity)
+        if color is None:
+            return
+        half = parse_number(style.get('stroke-width'), 1.0) * s / 2
+        pattern = parse_dasharray(style.get('stroke-dasharray', el.get('stroke-dasharray')))
+        if rx and ry and not pattern:
+            hole = (x + half, y + half, x + width - half, y + height - half, max(rx - half, 0.0), max(ry - half, 0.0))
+            self.canvas.fill_rounded(x - half, y - half, x + width + half, y + height + half,
+                                     rx + half, ry + half, color, alpha, hole)
+            return
+        # Dashed outlines follow the square corners
+        if pattern:
+            pattern = [part * s for part in pattern]
+        offset = parse_number(style.get('stroke-dashoffset', el.get('stroke-dashoffset'))) * s
+        # Walk the outline clockwise from the top-left corner
+        edges = [(x, y, 1, 0, width), (x + width, y, 0, 1, height),
+                 (x + width, y + height, -1, 0, width), (x, y + height, 0, -1, height)]
+        for ex, ey, ux, uy, length in edges:
+            for start, end in dash_intervals(length, pattern, offset):
+                x0, y0 = ex + ux * start, ey + uy * start
+                x1, y1 = ex + ux * end, ey + uy * end
+                self.canvas.fill(min(x0, x1) - half, min(y0, y1) - half,
+                                 max(x0, x1) + half, max(y0, y1) + half, color, alpha)
+            offset += length
+
+    def circle(self, el, style, dx, dy, opacity, angle=0.0):
+        s = self.scale
+        cx = (parse_number(el.get('cx')) + dx) * s
+        cy = (parse_number(el.get('cy')) + dy) * s
+        r = parse_number(el.get('r')) * s
+        canvas = self.canvas
+
+        color, alpha = self.paint(el, style, 'fill', opacity)
+        if color is not None and alpha > 0:
+            tables = _blend_tables(color, alpha) if alpha < 1 else None
+            for y in range(max(_px(cy - r), 0), min(_px(cy + r), canvas.height)):
+                offset = y + 0.5 - cy
+                if abs(offset) < r:
+                    half = math.sqrt(r * r - offset * offset)
+                    canvas.span(y, _px(cx - half), _px(cx + half), color, tables)
+
+        color, alpha = self.paint(el, style, 'stroke', opacity)
+        if color is None or alpha <= 0:
+            return
+        half_width = parse_number(style.get('stroke-width'), 1.0) * s / 2
+        outer, inner = r + half_width, max(r - half_width, 0.0)
+        tables = _blend_tables(color, alpha) if alpha < 1 else None
+        pattern = parse_dasharray(style.get('stroke-dasharray', el.get('stroke-dasharray')))
+        if pattern:
+            pattern = [part * s for part in pattern]
+            # Dashes start at 3 o'clock and run clockwise, turned by any rotate()
+            arcs = list(dash_intervals(2 * math.pi * r, pattern, parse_number(style.get('stroke-dashoffset', el.get('stroke-dashoffset'))) * s))
+            start_angle = math.radians(angle)
+        for y in range(max(_px(cy - outer), 0), min(_px(cy + outer), canvas.height)):
+            offset = y + 0.5 - cy
+            if abs(offset) >= outer:
+                continue
+            out_half = math.sqrt(outer * outer - offset * offset)
+            in_half = math.sqrt(inner * inner - offset * offset) if abs(offset) < inner else 0.0
+            for x0, x1 in ((cx - out_half, cx - in_half), (cx + in_half, cx + out_half)):
+                left, right = _px(x0), _px(x1)
+                if not pattern:
+                    canvas.span(y, left, right, color, tables)
+                    continue
+                run = None
+                for x in range(left, right + 1):
+                    inside = False
+                    if x < right:
+                        along = (math.atan2(offset, x + 0.5 - cx) - start_angle) % (2 * math.pi) * r
+                        inside = any(a <= along < b for a, b in arcs)
+                    if inside and run is None:
+                        run = x
+                    elif not inside and run is not None:
+                        canvas.span(y, run, x, color, tables)
+                        run = None
+
+    def line(self, el, style, dx, dy, opacity):
+        s = self.scale
+        x1 = (parse_number(el.get('x1')) + dx) * s
+        y1 = (parse_number(el.get('y1')) + dy) * s
+        x2 = (parse_number(el.get('x2')) + dx) * s
+        y2 = (parse_number(el.get('y2')) + dy) * s
+        color, alpha = self.paint(el, style, 'stroke', opacity)
+        half = parse_number(style.get('stroke-width'), 1.0) * s / 2
+        if x1 == x2 or y1 == y2:
+            self.canvas.fill(min(x1, x2) - half, min(y1, y2) - half,
+                             max(x1, x2) + half, max(y1, y2) + half, color, alpha)
+            return
+        steps = max(int(max(abs(x2 - x1), abs(y2 - y1))), 1)
+        for i in range(steps + 1):
+            x = x1 + (x2 - x1) * i / steps
+            y = y1 + (y2 - y1) * i / steps
+            self.canvas.fill(x - half, y - half, x + half, y + half, color, alpha)
+
+    def text(self, el, style, dx, dy, opacity):
+        """Draw a label in the bitmap font, or greeked as one bar per word"""
+        # Whitespace collapses as in the default xml:space handling
+        content = ' '.join(''.join(el.itertext()).split())
+        if not content:
+            return
+        s = self.scale
+        family = style.get('font-family', 'Arial')
+        size = parse_number(style.get('font-size'), 16.0)
+        weight = style.get('font-weight', 'normal')
+        x = parse_number(el.get('x')) + dx
+        baseline = parse_number(el.get('y')) + dy
+        anchor = style.get('text-anchor', 'start')
+        if anchor in ('middle', 'end'):
+            x -= text_width(content, family, size, weight) / (2 if anchor == 'middle' else 1)
+        color, alpha = self.paint(el, style, 'fill', opacity)
+        if self.greek:
+            self.greek_text(content, x, baseline, family, size, weight, color, alpha)
+            return
+        cell = CAP_HEIGHT * size / CAP_ROWS
+        top = baseline - CAP_ROWS * cell
+        # Bold strokes are widened by half a cell
+        bold = cell / 2 if weight in BOLD_WEIGHTS else 0.0
+        fill = self.canvas.fill
+        for char in content:
+            advance = text_width(char, family, size, weight)
+            shape = glyph(char)
+            if shape is not None:
+                width, runs = shape
+                left = x + (advance - width * cell - bold) / 2
+                for row, start, end in runs:
+                    fill((left + start * cell) * s, (top + row * cell) * s,
+                         (left + end * cell + bold) * s, (top + (row + 1) * cell) * s, color, alpha)
+            x += advance
+
+    def greek_text(self, content, x, baseline, family, size, weight, color, alpha):
+        """One bar per word, spaced by the font metrics"""
+        s = self.scale
+        alpha *= 0.85 if weight in BOLD_WEIGHTS else 0.6
+        top, bottom = (baseline - 0.55 * size) * s, (baseline - 0.05 * size) * s
+        position = 0
+        for word in content.split(' '):
+            if word:
+                left = x + text_width(content[:position], family, size, weight)
+                right = left + text_width(word, family, size, weight)
+                self.canvas.fill(left * s, top, right * s, bottom, color, alpha)
+            position += len(word) + 1
+
+
+def rasterize(svg, scale=1.0, supersample=1, greek=False):
+    """Render SVG source (str or bytes) to a Canvas"""
+    if isinstance(svg, str):
+        svg = svg.encode('utf-8')
+    canvas = Renderer(ET.fromstring(svg), scale * supersample, greek).render()
+    return canvas.downsample(supersample) if supersample > 1 else canvas
+
+
+def encode_png(canvas):
+    """8-bit RGB PNG bytes with no row filtering"""
+    stride = canvas.width * 3
+    pixels = canvas.pixels
+    raw = b''.join(b'\x00' + pixels[y * stride:(y + 1) * stride] for y in range(canvas.height))
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    header = struct.pack('>IIBBBBB', canvas.width, canvas.height, 8, 2, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(raw, 9)) + chunk(b'IEND', b'')
+
+
+def encode_webp(canvas):
+    """Lossless WebP bytes; needs Pillow"""
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError('WebP output needs Pillow: pip install Pillow')
+    import io
+    buffer = io.BytesIO()
+    Image.frombytes('RGB', (canvas.width, canvas.height), bytes(canvas.pixels)).save(buffer, 'WEBP', lossless=True)
+    return buffer.getvalue()
+
+
+ENCODERS = {'png': encode_png, 'webp': encode_webp}
+
+
+def check_formats(formats):
+    """Fail before any file is written if a format's library is missing"""
+    for fmt in formats:
+        ENCODERS[fmt](Canvas(1, 1))
+
+
+def output_name(svg_path, fmt, thumbnail=False):
+    base = os.path.splitext(svg_path)[0]
+    return f'{base}.thumb.{fmt}' if thumbnail else f'{base}.{fmt}'
+
+
+def cache_key(svg, fmt, width=None, greek=False):
+    """Digest of the SVG bytes, the output settings and the renderer's code"""
+    h = hashlib.sha256()
+    h.update(file_digest(os.path.abspath(__file__)).encode())
+    h.update(file_digest(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bitmap_font.py')).encode())
+    h.update(f'{fmt}:{width or "full"}:{"greek" if greek else "text"}:'.encode())
+    h.update(svg)
+    return h.hexdigest()
+
+
+def render_image(svg, fmt='png', width=None, greek=False):
+    """Encoded image bytes, full size or scaled to ``width`` pixels wide"""
+    if width is None:
+        canvas = rasterize(svg, greek=greek)
+    else:
+        root_width = parse_number(ET.fromstring(svg).get('width'), width)
+        canvas = rasterize(svg, width / root_width, SUPERSAMPLE, greek)
+    return ENCODERS[fmt](canvas)
+
+
+def _render_job(job):
+    svg_path, fmt, width, greek, cached = job
+    start = time.perf_counter()
+    with open(svg_path, 'rb') as f:
+        data = render_image(f.read(), fmt, width, greek)
+    tmp = f'{cached}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, cached)
+    return time.perf_counter() - start
+
+
+def rasterize_files(svg_paths, formats=('png',), thumbnail_width=THUMBNAIL_WIDTH,
+                    jobs=1, cache_dir=CACHE_DIR, greek=False):
+    """Write full-size and thumbnail images next to each SVG
+
+    Yields (output filename, seconds or None when served from the cache)
+    in input order. Only cache misses are sent to the worker pool.
+    ``greek`` draws labels as bars instead of glyphs.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    outputs, misses = [], []
+    for svg_path in svg_paths:
+        with open(svg_path, 'rb') as f:
+            svg = f.read()
+        for fmt in formats:
+            for width in (None, thumbnail_width) if thumbnail_width else (None,):
+                cached = os.path.join(cache_dir, f'{cache_key(svg, fmt, width, greek)}.{fmt}')
+                outputs.append((output_name(svg_path, fmt, width is not None), cached))
+                if not os.path.exists(cached):
+                    misses.append((svg_path, fmt, width, greek, cached))
+
+    if jobs <= 1 or len(misses) <= 1:
+        times = [_render_job(job) for job in misses]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            times = list(pool.map(_render_job, misses))
+    elapsed = {job[-1]: seconds for job, seconds in zip(misses, times)}
+
+    for filename, cached in outputs:
+        shutil.copyfile(cached, filename)
+        yield filename, elapsed.get(cached)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Rasterize wireframe SVGs to PNG/WebP')
+    parser.add_argument('svgs', nargs='+', metavar='SVG')
+    parser.add_argument('--format', action='append', choices=FORMATS, dest='formats',
+                        help='output format, may be repeated (default png)')
+    parser.add_argument('--thumbnail-width', type=int, default=THUMBNAIL_WIDTH,
+                        help='thumbnail width in pixels (0 = no thumbnails)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes (0 = one per CPU)')
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='where rendered images are cached')
+    parser.add_argument('--greek', action='store_true',
+                        help='draw each word of a label as a bar instead of its glyphs')
+    args = parser.parse_args(argv)
+    try:
+        check_formats(args.formats or ())
+    except RuntimeError as exc:
+        parser.error(str(exc))
+    return args
+
+
+def main(argv=None):
+    """Rasterize SVG files given on the command line"""
+    args = parse_args(argv)
+    jobs = args.jobs or os.cpu_count() or 1
+    for filename, elapsed in rasterize_files(args.svgs, args.formats or ['png'], args.thumbnail_width,
+                                             jobs, args.cache_dir, args.greek):
+        print(f"Created {filename}" + (f" ({elapsed * 1000:.1f} ms)" if elapsed is not None else " (cached)"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""Minify SVG files and write precompressed siblings
+
+An output stage for finished SVG documents, generated or hand-drawn:
+
+* comments and indentation between elements are dropped
+* colours are shortened (#ffffff -> #fff, black -> #000) and numbers lose
+  redundant zeros
+* presentation attributes that change nothing are removed: values equal to
+  what the element already inherits or the initial value (stroke="none",
+  fill="black", opacity="1", ...) and attributes a stylesheet rule overrides
+* runs of sibling elements that share inheritable attributes are wrapped in
+  one <g> carrying them
+
+Shapes inside <defs> or with an id may be drawn through <use> in another
+context, so they are never changed.
+
+``precompress`` writes .gz, .svgz and .br copies so a static server can
+send stored bytes instead of compressing per request; gzip output has a
+fixed mtime so it is byte-for-byte reproducible. Brotli needs the
+``brotli`` package.
+
+    python svg_minify.py homepage-wireframe-complete.svg --compress gz --compress br
+"""
+import argparse
+import gzip
+import os
+import re
+import xml.etree.ElementTree as ET
+
+from rasterize import NAMED_COLORS, parse_stylesheet
+from svg_writer import escape_attrib, escape_text
+
+COMPRESSIONS = ('gz', 'svgz', 'br')
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+XLINK_NS = 'http://www.w3.org/1999/xlink'
+XML_NS = 'http://www.w3.org/XML/1998/namespace'
+PREFIXES = {XLINK_NS: 'xlink', XML_NS: 'xml'}
+
+# Initial values of presentation properties; inherited ones flow into children
+INITIAL = {
+    'fill': '#000',
+    'fill-opacity': '1',
+    'fill-rule': 'nonzero',
+    'stroke': 'none',
+    'stroke-width': '1',
+    'stroke-opacity': '1',
+    'stroke-dasharray': 'none',
+    'stroke-dashoffset': '0',
+    'stroke-linecap': 'butt',
+    'stroke-linejoin': 'miter',
+    'font-style': 'normal',
+    'font-weight': 'normal',
+    'text-anchor': 'start',
+    'visibility': 'visible',
+    'opacity': '1',
+}
+NOT_INHERITED = {'opacity'}
+INHERITABLE = {name for name in INITIAL if name not in NOT_INHERITED} | {'font-family', 'font-size'}
+
+COLOR_PROPERTIES = {'fill', 'stroke', 'stop-color', 'flood-color', 'color'}
+NUMBER_ATTRS = {'x', 'y', 'x1', 'y1', 'x2', 'y2', 'cx', 'cy', 'r', 'rx', 'ry', 'width', 'height',
+                'font-size', 'stroke-width', 'opacity', 'fill-opacity', 'stroke-opacity',
+                'stroke-dashoffset'}
+
+# Only the containers themselves are regrouped; <text> content is left alone
+GROUPING_CONTAINERS = {'svg', 'g'}
+
+_NUMBER = re.compile(r'-?(?:\d+\.?\d*|\.\d+)')
+_HEX6 = re.compile(r'#([0-9a-f])\1([0-9a-f])\2([0-9a-f])\3')
+
+
+def _hex(rgb):
+    return '#%02x%02x%02x' % rgb
+
+
+def _short_hex(value):
+    match = _HEX6.fullmatch(value)
+    return f'#{match.group(1)}{match.group(2)}{match.group(3)}' if match else value
+
+
+# Named colours that are shorter than their hex spelling
+_SHORTER_NAMES = {}
+for _name, _rgb in NAMED_COLORS.items():
+    _short = _short_hex(_hex(_rgb))
+    if len(_name) < len(_short) and len(_name) < len(_SHORTER_NAMES.get(_short, _short)):
+        _SHORTER_NAMES[_short] = _name
+
+
+def shorten_color(value):
+    """Shortest spelling of a colour: #ffffff -> #fff, white -> #fff, #ff0000 -> red"""
+    color = value.strip().lower()
+    if color in NAMED_COLORS:
+        color = _hex(NAMED_COLORS[color])
+    elif not re.fullmatch(r'#[0-9a-f]{3}|#[0-9a-f]{6}', color):
+        return value
+    color = _short_hex(color)
+    return _SHORTER_NAMES.get(color, color)
+
+
+def shorten_number(value):
+    """Drop redundant zeros: 0.50 -> .5, 10.0 -> 10, -0 -> 0"""
+    if not _NUMBER.fullmatch(value):
+        return value
+    if '.' in value:
+        value = value.rstrip('0').rstrip('.')
+    if value.startswith('0.'):
+        value = value[1:]
+    elif value.startswith('-0.'):
+        value = '-' + value[2:]
+    return '0' if value in ('-0', '', '-') else value
+
+
+def shorten_value(name, value):
+    if name in COLOR_PROPERTIES:
+        return shorten_color(value)
+    if name in NUMBER_ATTRS:
+        return shorten_number(value.strip())
+    if name == 'font-family':
+        return re.sub(r'\s*,\s*', ',', value.strip())
+    if name in ('transform', 'points', 'd', 'viewBox', 'stroke-dasharray'):
+        return re.sub(r'\s+', ' ', re.sub(r'\s*,\s*', ',', value.strip()))
+    return value
+
+
+def minify_css(css):
+    """Collapse whitespace and shorten colours in a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s*([{};:,])\s*', r'\1', css.strip())
+    css = css.replace(';}', '}')
+    return re.sub(r'(^|[{;])(fill|stroke|stop-color|flood-color|color):([^;}]+)',
+                  lambda m: m.group(1) + m.group(2) + ':' + shorten_color(m.group(3)), css)
+
+
+def _local(name):
+    return name.rpartition('}')[2]
+
+
+def _rules_for(el, rules):
+    declarations = {}
+    for selector in [_local(el.tag)] + [f'.{name}' for name in el.get('class', '').split()]:
+        declarations.update(rules.get(selector, ()))
+    return declarations
+
+
+def _prune(el, rules, inherited, safe):
+    """Shorten values and drop attributes that have no effect, recursively"""
+    tag = _local(el.tag)
+    if tag == 'defs' or el.get('id') is not None:
+        safe = False
+    if tag == 'style':
+        el.text = minify_css(el.text or '')
+        return
+    declarations = {name: shorten_color(value) if name in COLOR_PROPERTIES else value
+                    for name, value in _rules_for(el, rules).items()}
+    for name in list(el.attrib):
+        value = el.attrib[name] = shorten_value(name, el.attrib[name])
+        if not safe or name not in INITIAL and name not in INHERITABLE:
+            continue
+        if name in declarations:
+            # A stylesheet rule beats the attribute
+            del el.attrib[name]
+        elif name in NOT_INHERITED:
+            if value == INITIAL[name]:
+                del el.attrib[name]
+        elif value == inherited.get(name, INITIAL.get(name)):
+            del el.attrib[name]
+
+    computed = dict(inherited)
+    for name in INHERITABLE:
+        if name in declarations:
+            computed[name] = declarations[name]
+        elif name in el.attrib:
+            computed[name] = el.attrib[name]
+    for child in el:
+        _prune(child, rules, computed, safe)
+
+
+def _attrs_length(attrs):
+    return sum(len(f' {name}="{escape_attrib(value)}"') for name, value in attrs)
+
+
+def _group_runs(el):
+    """Wrap runs of siblings sharing inheritable attributes in a <g>"""
+    for child in el:
+        if _local(child.tag) in GROUPING_CONTAINERS:
+            _group_runs(child)
+    if _local(el.tag) not in GROUPING_CONTAINERS:
+        return
+
+    def shared(child):
+        if child.get('id') is not None or _local(child.tag) in ('defs', 'style'):
+            return set()
+        return {(name, value) for name, value in child.attrib.items() if name in INHERITABLE}
+
+    def saving(run, common):
+        return (len(run) - 1) * _attrs_length(common) - len('<g></g>')
+
+    children = []
+    run, common = [], set()
+
+    def flush():
+        if len(run) > 1 and saving(run, common) > 0:
+            names = {name for name, value in common}
+            # Keep the attribute order of the first element
+            group = ET.Element(el.tag[:len(el.tag) - len(_local(el.tag))] + 'g')
+            for name, value in run[0].attrib.items():
+                if name in names:
+                    group.set(name, value)
+            for member in run:
+                for name in names:
+                    del member.attrib[name]
+                group.append(member)
+            children.append(group)
+        else:
+            children.extend(run)
+
+    for child in list(el):
+        attrs = shared(child)
+        narrowed = common & attrs
+        if run and narrowed and saving(run + [child], narrowed) >= saving(run, common):
+            run.append(child)
+            common = narrowed
+            continue
+        flush()
+        run, common = [child], attrs
+    flush()
+    el[:] = children
+
+
+def _name(name, namespaces):
+    if name.startswith('{'):
+        uri, local = name[1:].split('}', 1)
+        if uri == SVG_NS:
+            return local
+        prefix = PREFIXES.get(uri)
+        if prefix:
+            namespaces.add(uri)
+            return f'{prefix}:{local}'
+    return name
+
+
+def _serialize(el, write, namespaces, in_text=False):
+    tag = _name(el.tag, namespaces)
+    attrs = ''.join(f' {_name(name, namespaces)}="{escape_attrib(value)}"' for name, value in el.attrib.items())
+    in_text = in_text or tag == 'text'
+    text = el.text
+    if text and not in_text and tag != 'style' and not text.strip():
+        text = None
+    if text and tag == 'text' and not len(el):
+        text = ' '.join(text.split())
+    if not text and not len(el):
+        write(f'<{tag}{attrs}/>')
+        return
+    write(f'<{tag}{attrs}>')
+    if text:
+        write(escape_text(text))
+    for child in el:
+        _serialize(child, write, namespaces, in_text)
+        if child.tail and (in_text or child.tail.strip()):
+            write(escape_text(child.tail))
+    write(f'</{tag}>')
+
+
+def minify(svg):
+    """Minified SVG markup for a document given as str or bytes"""
+    if isinstance(svg, str):
+        svg = svg.encode('utf-8')
+    root = ET.fromstring(svg)
+    rules = {}
+    for style in root.iter(f'{{{SVG_NS}}}style'):
+        for selector, declarations in parse_stylesheet(''.join(style.itertext())).items():
+            rules.setdefault(selector, {}).update(declarations)
+    _prune(root, rules, {}, True)
+    _group_runs(root)
+
+    parts = []
+    namespaces = set()
+    _serialize(root, parts.append, namespaces)
+    declarations = f' xmlns="{SVG_NS}"'
+    for uri in sorted(namespaces - {XML_NS}):
+        declarations += f' xmlns:{PREFIXES[uri]}="{uri}"'
+    head = parts[0]
+    parts[0] = head[:4] + declarations + head[4:]
+    return ''.join(parts)
+
+
+def compress(data, fmt):
+    """Compressed bytes in one of COMPRESSIONS"""
+    if fmt in ('gz', 'svgz'):
+        return gzip.compress(data, 9, mtime=0)
+    if fmt == 'br':
+        try:
+            import brotli
+        except ImportError:
+            raise RuntimeError('Brotli output needs the brotli package: pip install brotli')
+        return brotli.compress(data, quality=11)
+    raise ValueError(f'Unknown compression {fmt!r}')
+
+
+def check_compressions(formats):
+    """Fail before any file is written if a format's library is missing"""
+    for fmt in formats:
+        compress(b'', fmt)
+
+
+def sibling_name(path, fmt):
+    """admin.svg -> admin.svg.gz / admin.svgz / admin.svg.br"""
+    if fmt == 'svgz':
+        return os.path.splitext(path)[0] + '.svgz'
+    return f'{path}.{fmt}'
+
+
+def precompress(path, formats):
+    """Write a compressed sibling of ``path`` per format; return their names"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    written = []
+    for fmt in formats:
+        target = sibling_name(path, fmt)
+        with open(target, 'wb') as f:
+            f.write(compress(data, fmt))
+        written.append(target)
+    return written
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Minify SVG files and write precompressed copies')
+    parser.add_argument('svgs', nargs='+', metavar='SVG')
+    parser.add_argument('--in-place', action='store_true',
+                        help='overwrite each file instead of writing NAME.min.svg')
+    parser.add_argument('--compress', action='append', default=[], choices=COMPRESSIONS,
+                        help='also write a compressed sibling (may be repeated)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Minify SVG files given on the command line"""
+    args = parse_args(argv)
+    check_compressions(args.compress)
+    for path in args.svgs:
+        with open(path, 'rb') as f:
+            original = f.read()
+        target = path if args.in_place else os.path.splitext(path)[0] + '.min.svg'
+        minified = minify(original).encode('utf-8')
+        with open(target, 'wb') as f:
+            f.write(minified)
+        siblings = precompress(target, args.compress)
+        print(f"Minified {path}: {len(original):,} -> {len(minified):,} bytes"
+              + ''.join(f", {name} {os.path.getsize(name):,}" for name in siblings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,452 @@
+import io
+import json
+
+
+def escape_text(text):
+    """Escape character data the same way ElementTree does"""
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    return text
+
+
+def escape_attrib(value):
+    """Escape an attribute value the same way ElementTree does"""
+    value = escape_text(value)
+    if '"' in value:
+        value = value.replace('"', '&quot;')
+    if '\r' in value:
+        value = value.replace('\r', '&#13;')
+    if '\n' in value:
+        value = value.replace('\n', '&#10;')
+    if '\t' in value:
+        value = value.replace('\t', '&#09;')
+    return value
+
+
+def format_attrs(attrs):
+    """Serialize an attribute dict in insertion order"""
+    return ''.join(f' {key}="{escape_attrib(value)}"' for key, value in attrs.items())
+
+
+def fmt_number(value):
+    """Format a coordinate with at most two decimals and no trailing zeros"""
+    text = f'{value:.2f}'.rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+def num(value):
+    return str(value) if type(value) is int else fmt_number(value)
+
+
+# Every <text> uses this family; it is set once by the stylesheet
+FONT_FAMILY = 'Arial'
+
+# Presentation properties that need a unit when written as CSS
+CSS_UNITS = {'font-size': 'px', 'stroke-width': 'px'}
+
+
+class Rect:
+    """A rectangle with numeric geometry, formatted only when written"""
+    __slots__ = ('x', 'y', 'width', 'height', 'fill', 'stroke', 'stroke_width', 'dasharray', 'id',
+                 'rx', 'opacity')
+
+    def __init__(self, x, y, width, height, fill=None, stroke=None, stroke_width=None,
+                 dasharray=None, id=None, rx=None, opacity=None):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.fill = fill
+        self.stroke = stroke
+        self.stroke_width = stroke_width
+        self.dasharray = dasharray
+        self.id = id
+        self.rx = rx
+        self.opacity = opacity
+
+    def style(self):
+        return ('rect', self.fill, self.stroke, self.stroke_width, self.dasharray, self.opacity)
+
+    def presentation(self):
+        attrs = []
+        if self.fill is not None:
+            attrs.append(('fill', self.fill))
+        if self.stroke is not None:
+            attrs.append(('stroke', self.stroke))
+        if self.stroke_width is not None:
+            attrs.append(('stroke-width', num(self.stroke_width)))
+        if self.dasharray:
+            attrs.append(('stroke-dasharray', self.dasharray))
+        if self.opacity is not None:
+            attrs.append(('opacity', num(self.opacity)))
+        return attrs
+
+    def position(self):
+        return self.x or 0, self.y or 0
+
+    def instance_key(self):
+        return ('rect', self.width, self.height, self.stroke, self.stroke_width, self.dasharray,
+                self.rx, self.opacity)
+
+    def definition(self, shape_id):
+        return Rect(None, None, self.width, self.height, None, self.stroke, self.stroke_width,
+                    self.dasharray, shape_id, self.rx, self.opacity)
+
+    def markup(self, style):
+        ident = f' id="{self.id}"' if self.id else ''
+        position = f' x="{num(self.x)}" y="{num(self.y)}"' if self.x is not None else ''
+        corner = f' rx="{num(self.rx)}"' if self.rx else ''
+        return f'<rect{ident}{position} width="{num(self.width)}" height="{num(self.height)}"{corner}{style} />'
+
+
+class Circle:
+    """A circle; ``transform`` is kept with the geometry it rotates about"""
+    __slots__ = ('cx', 'cy', 'r', 'fill', 'stroke', 'stroke_width', 'dasharray', 'dashoffset',
+                 'transform', 'id', 'opacity')
+
+    def __init__(self, cx, cy, r, fill=None, stroke=None, stroke_width=None, dasharray=None,
+                 dashoffset=None, transform=None, id=None, opacity=None):
+        self.cx = cx
+        self.cy = cy
+        self.r = r
+        self.fill = fill
+        self.stroke = stroke
+        self.stroke_width = stroke_width
+        self.dasharray = dasharray
+        self.dashoffset = dashoffset
+        self.transform = transform
+        self.id = id
+        self.opacity = opacity
+
+    def style(self):
+        return ('circle', self.fill, self.stroke, self.stroke_width, self.dasharray, self.dashoffset,
+                self.opacity)
+
+    def presentation(self):
+        attrs = []
+        if self.fill is not None:
+            attrs.append(('fill', self.fill))
+        if self.stroke is not None:
+            attrs.append(('stroke', self.stroke))
+        if self.stroke_width is not None:
+            attrs.append(('stroke-width', num(self.stroke_width)))
+        if self.dasharray:
+            attrs.append(('stroke-dasharray', self.dasharray))
+        if self.dashoffset is not None:
+            attrs.append(('stroke-dashoffset', self.dashoffset))
+        if self.opacity is not None:
+            attrs.append(('opacity', num(self.opacity)))
+        return attrs
+
+    def position(self):
+        return self.cx or 0, self.cy or 0
+
+    def instance_key(self):
+        # A rotation about the centre cannot follow a <use> to a new position
+        if self.transform:
+            return None
+        return ('circle', self.r, self.stroke, self.stroke_width, self.dasharray, self.dashoffset,
+                self.opacity)
+
+    def definition(self, shape_id):
+        return Circle(None, None, self.r, None, self.stroke, self.stroke_width, self.dasharray,
+                      self.dashoffset, id=shape_id, opacity=self.opacity)
+
+    def markup(self, style):
+        ident = f' id="{self.id}"' if self.id else ''
+        position = f' cx="{num(self.cx)}" cy="{num(self.cy)}"' if self.cx is not None else ''
+        transform = f' transform="{self.transform}"' if self.transform else ''
+        return f'<circle{ident}{position} r="{num(self.r)}"{style}{transform} />'
+
+
+class Line:
+    """A straight stroke between two points"""
+    __slots__ = ('x1', 'y1', 'x2', 'y2', 'stroke', 'stroke_width')
+
+    def __init__(self, x1, y1, x2, y2, stroke='black', stroke_width=None):
+        self.x1 = x1
+        self.y1 = y1
+        self.x2 = x2
+        self.y2 = y2
+        self.stroke = stroke
+        self.stroke_width = stroke_width
+
+    def style(self):
+        return ('line', self.stroke, self.stroke_width)
+
+    def presentation(self):
+        attrs = [('stroke', self.stroke)]
+        if self.stroke_width is not None:
+            attrs.append(('stroke-width', num(self.stroke_width)))
+        return attrs
+
+    def markup(self, style):
+        return (f'<line x1="{num(self.x1)}" y1="{num(self.y1)}" x2="{num(self.x2)}" '
+                f'y2="{num(self.y2)}"{style} />')
+
+
+class Text:
+    """A single-line label in FONT_FAMILY"""
+    __slots__ = ('x', 'y', 'text', 'size', 'fill', 'bold', 'anchor')
+
+    def __init__(self, x, y, text, size=12, fill='black', bold=False, anchor=None):
+        self.x = x
+        self.y = y
+        self.text = text
+        self.size = size
+        self.fill = fill
+        self.bold = bold
+        self.anchor = anchor
+
+    def style(self):
+        return ('text', self.size, self.bold, self.fill, self.anchor)
+
+    def presentation(self):
+        attrs = [('font-size', num(self.size))]
+        if self.bold:
+            attrs.append(('font-weight', 'bold'))
+        attrs.append(('fill', self.fill))
+        if self.anchor:
+            attrs.append(('text-anchor', self.anchor))
+        return attrs
+
+    def markup(self, style):
+        if not self.text:
+            return f'<text x="{num(self.x)}" y="{num(self.y)}"{style} />'
+        return f'<text x="{num(self.x)}" y="{num(self.y)}"{style}>{escape_text(self.text)}</text>'
+
+
+class Use:
+    """A reference to a shape in <defs>, placed at (x, y)"""
+    __slots__ = ('href', 'x', 'y', 'fill')
+
+    def __init__(self, href, x, y, fill=None):
+        self.href = href
+        self.x = x
+        self.y = y
+        self.fill = fill
+
+    def style(self):
+        return ('use', self.fill)
+
+    def presentation(self):
+        return [('fill', self.fill)] if self.fill is not None else []
+
+    def markup(self, style):
+        return f'<use href="#{self.href}" x="{num(self.x)}" y="{num(self.y)}"{style} />'
+
+
+# Style key of every Fragment; the style map holds itself under this key
+FRAGMENT = ('fragment',)
+
+# Distinct style markups kept per fragment (one per theme and class layout)
+FRAGMENT_VARIANTS = 64
+
+
+class Fragment:
+    """A run of shapes shared by many pages, serialized once per style markup
+
+    ``key`` identifies the shapes (the component and its parameters). The
+    serialized text only depends on them and on the attribute or class
+    markup the page's stylesheet gives their styles, so it is cached per
+    tuple of that markup: every page that styles the fragment the same way
+    reuses one string.
+    """
+    __slots__ = ('key', 'shapes', 'styles', 'markups')
+
+    def __init__(self, key, shapes):
+        self.key = key
+        self.shapes = shapes
+        self.styles = tuple(dict.fromkeys(shape.style() for shape in shapes))
+        self.markups = {}
+
+    def style(self):
+        return FRAGMENT
+
+    def markup(self, style):
+        # ``style`` is the whole style map of the page (see stylesheet)
+        attrs = tuple(map(style.__getitem__, self.styles))
+        text = self.markups.get(attrs)
+        if text is None:
+            if len(self.markups) >= FRAGMENT_VARIANTS:
+                self.markups.clear()
+            text = self.markups[attrs] = ''.join(shape.markup(style[shape.style()]) for shape in self.shapes)
+        return text
+
+
+def _class_name(i):
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    name = letters[i % 26]
+    i //= 26
+    while i:
+        name = letters[i % 26] + name
+        i //= 26
+    return name
+
+
+# (theme, style key) -> (inline attribute markup, CSS declarations), shared by all pages
+_STYLE_CACHE = {}
+_STYLE_CACHE_SIZE = 4096
+
+
+def recolor(presentation, theme, text=False):
+    """Presentation pairs with fill and stroke colours mapped through ``theme``
+
+    A theme maps colours separately for 'fill', 'stroke' and 'text' (the
+    fill of text), so white labels on coloured buttons can stay white while
+    white panels turn dark.
+    """
+    fills = theme.get('text' if text else 'fill', {})
+    strokes = theme.get('stroke', {})
+    return [(name, fills.get(value, value) if name == 'fill' else
+             strokes.get(value, value) if name == 'stroke' else value)
+            for name, value in presentation]
+
+
+def _style_parts(key, shape, theme, theme_key):
+    cache_key = (theme_key, key)
+    parts = _STYLE_CACHE.get(cache_key)
+    if parts is None:
+        if len(_STYLE_CACHE) >= _STYLE_CACHE_SIZE:
+            _STYLE_CACHE.clear()
+        presentation = shape.presentation()
+        if theme:
+            presentation = recolor(presentation, theme, key[0] == 'text')
+        parts = _STYLE_CACHE[cache_key] = (
+            format_attrs(dict(presentation)),
+            ';'.join(f'{prop}:{value}{CSS_UNITS.get(prop, "")}' for prop, value in presentation),
+        )
+    return parts
+
+
+def style_usage(shapes):
+    """(count per style key, one sample shape per key) for ``shapes``
+
+    A Fragment counts as the shapes it holds.
+    """
+    counts = {}
+    samples = {}
+    for shape in shapes:
+        key = shape.style()
+        if key is FRAGMENT:
+            inner_counts, inner_samples = style_usage(shape.shapes)
+            for key, n in inner_counts.items():
+                counts[key] = counts.get(key, 0) + n
+                samples.setdefault(key, inner_samples[key])
+            continue
+        n = counts.get(key)
+        if n is None:
+            counts[key] = 1
+            samples[key] = shape
+        else:
+            counts[key] = n + 1
+    return counts, samples
+
+
+def stylesheet(usage, theme=None, min_uses=2):
+    """Hoist repeated presentation attributes into CSS classes
+
+    ``usage`` comes from style_usage(). Shapes with the same style() share
+    a class when there are at least ``min_uses`` of them and the class is
+    shorter than repeating the attributes. Returns (css text, {style key:
+    attribute markup}) where the markup is either ``class="..."`` or the
+    inline attributes. The font family is set once for all text. Colours
+    are mapped through ``theme`` (see recolor) on the way out. Fragments
+    find the map itself under FRAGMENT.
+    """
+    counts, samples = usage
+    theme_key = json.dumps(theme, sort_keys=True) if theme else None
+    rules = []
+    if any(key[0] == 'text' for key in counts):
+        rules.append(f'text{{font-family:{FONT_FAMILY}}}')
+    attrs = {}
+    classes = 0
+    for key in sorted(counts, key=counts.get, reverse=True):
+        inline, css = _style_parts(key, samples[key], theme, theme_key)
+        attrs[key] = inline
+        if counts[key] < min_uses:
+            continue
+        name = _class_name(classes)
+        markup = f' class="{name}"'
+        rule = f'.{name}{{{css}}}'
+        if counts[key] * (len(inline) - len(markup)) > len(rule):
+            rules.append(rule)
+            attrs[key] = markup
+            classes += 1
+    attrs[FRAGMENT] = attrs
+    return ''.join(rules), attrs
+
+
+class SvgWriter:
+    """Stream SVG elements to a writable as they are produced
+
+    Output matches ``ET.tostring(root, encoding='unicode')`` byte for byte,
+    but nothing is kept in memory apart from the stack of open tags. When
+    ``out`` is None the document is collected in a string buffer and
+    returned by ``close()``.
+    """
+
+    def __init__(self, out=None, attrs=None):
+        self._buffer = io.StringIO() if out is None else None
+        self._write = (self._buffer or out).write
+        self._stack = []
+        self._pending = False
+        if attrs is not None:
+            self.start('svg', attrs)
+
+    def _flush_start(self):
+        if self._pending:
+            self._write('>')
+            self._pending = False
+
+    def start(self, tag, attrs):
+        """Open a container element"""
+        self._flush_start()
+        self._write(f'<{tag}{format_attrs(attrs)}')
+        self._stack.append(tag)
+        self._pending = True
+
+    def end(self):
+        """Close the innermost open element"""
+        tag = self._stack.pop()
+        if self._pending:
+            self._write(' />')
+            self._pending = False
+        else:
+            self._write(f'</{tag}>')
+
+    def element(self, tag, attrs, text=None):
+        """Write a leaf element, with optional text content"""
+        self._flush_start()
+        if text:
+            self._write(f'<{tag}{format_attrs(attrs)}>{escape_text(text)}</{tag}>')
+        else:
+            self._write(f'<{tag}{format_attrs(attrs)} />')
+
+    def shapes(self, shapes, style):
+        """Write shape records, looking up their presentation markup in ``style``"""
+        self._flush_start()
+        write = self._write
+        for shape in shapes:
+            write(shape.markup(style[shape.style()]))
+
+    def rect(self, attrs):
+        self.element('rect', attrs)
+
+    def circle(self, attrs):
+        self.element('circle', attrs)
+
+    def text(self, attrs, text):
+        self.element('text', attrs, text)
+
+    def close(self):
+        """Close every open element; return the document if buffered"""
+        while self._stack:
+            self.end()
+        if self._buffer is not None:
+            return self._buffer.getvalue()
+        return None
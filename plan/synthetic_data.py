@@ -0,0 +1,490 @@
+"""Synthetic bug tracker datasets at production scale
+
+    python synthetic_data.py [OUT_DIR] --bugs 1000000 --users 5000 --projects 200 [--seed 0]
+
+Users, projects and bugs follow the backend's Mongoose schemas
+(backend/src/models): ObjectId-style ids, the priority, status, role and
+reporter type enums, a project ref on every bug, internal reporters that
+are testers, assignees that are developers and projects created by
+admins.
+
+Records are generated in batches of ``--batch-size`` as NumPy columns,
+one vectorized draw per field. Every batch has its own random stream,
+seeded from (seed, kind, batch number), so the same seed and batch size
+always give the same dataset. Batches are streamed out as they are made:
+
+- jsonl (default): users.jsonl, projects.jsonl and bugs.jsonl, the files
+  ``create_wireframes.py --data OUT_DIR`` and dashboard_data read;
+- npz: a directory per kind holding one part-NNNNN.npz per batch, with
+  enums kept as small integer codes (their labels are stored alongside)
+  and text as UTF-8 bytes; ``--data OUT_DIR`` reads these too;
+- parquet: one file per kind with a row group per batch (needs pyarrow).
+
+Output files are written under a temporary name and renamed into place;
+an npz directory is written whole under a temporary name and swapped in,
+so no part of an earlier dataset survives next to the new one. A failed
+write leaves the previous output as it was.
+"""
+import argparse
+import json
+import os
+import shutil
+import time
+from itertools import repeat
+from json.encoder import encode_basestring
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from dashboard_data import PRIORITIES, STATUSES, shard_files
+
+KINDS = ('users', 'projects', 'bugs')
+FORMATS = ('jsonl', 'npz', 'parquet')
+BATCH_SIZE = 1 << 16
+OUT_DIR = 'synthetic-data'
+
+ROLES = ('admin', 'developer', 'tester')
+PROJECT_STATUSES = ('active', 'inactive', 'archived')
+REPORTER_TYPES = ('internal', 'public')
+
+# Enum fields of each kind, stored as codes into these labels
+ENUMS = {
+    'users': {'role': ROLES},
+    'projects': {'status': PROJECT_STATUSES},
+    'bugs': {'priority': PRIORITIES, 'status': STATUSES, 'reporter.type': REPORTER_TYPES},
+}
+
+ROLE_WEIGHTS = (0.02, 0.5, 0.48)
+PROJECT_STATUS_WEIGHTS = (0.7, 0.2, 0.1)
+PRIORITY_WEIGHTS = (0.1, 0.25, 0.4, 0.25)
+STATUS_WEIGHTS = (0.35, 0.25, 0.4)
+PUBLIC_REPORTS = 0.2
+ACTIVE_USERS = 0.95
+
+# ObjectIds: the timestamp of START, a byte per kind and the record index
+START = '2024-01-01T00:00:00'
+DAYS = 365
+ID_PREFIX = {kind: f'{1704067200:08x}{code:02x}' for code, kind in enumerate(KINDS, 1)}
+ID_DIGITS = 14
+
+FIRST_NAMES = ('Alex', 'Priya', 'John', 'Jane', 'Mike', 'Sarah', 'Wei', 'Fatima', 'Carlos', 'Aisha',
+               'Tom', 'Elena', 'Ravi', 'Nina', 'Omar', 'Lucy', 'Kenji', 'Maria', 'David', 'Zara')
+LAST_NAMES = ('Smith', 'Patel', 'Developer', 'Tester', 'Chen', 'Garcia', 'Khan', 'Nguyen', 'Brown',
+              'Silva', 'Kumar', 'Muller', 'Rossi', 'Tanaka', 'Okafor', 'Novak', 'Haddad', 'Jones')
+PROJECT_WORDS = ('Web App', 'Mobile Application', 'API Gateway', 'Admin Portal', 'Payments', 'Search',
+                 'Notifications', 'Reporting', 'Analytics', 'Auth Service', 'Data Pipeline', 'Help Center')
+AREAS = ('Login', 'Dashboard', 'Sidebar', 'Bug list', 'Search', 'Profile page', 'Export', 'Notifications',
+         'Project settings', 'Signup form', 'Comment box', 'File upload')
+PROBLEMS = ('fails to load', 'shows stale data', 'is misaligned on small screens', 'crashes on submit',
+            'is slow to respond', 'loses unsaved changes', 'returns a server error', 'ignores filters',
+            'displays the wrong count', 'times out under load')
+STEPS = ('1. Log in\n2. Open the {area}\n3. Observe the problem',
+         '1. Open the {area} on a mobile device\n2. Reload the page\n3. Observe the problem',
+         '1. Fill in the {area}\n2. Click save\n3. Observe the problem')
+EXPECTED = ('The page works as documented', 'Changes are saved and shown immediately',
+            'The response arrives within two seconds')
+ACTUAL = ('An error message is shown', 'Nothing happens', 'The page freezes for several seconds',
+          'Outdated values are displayed')
+
+
+HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8) if np is not None else None
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError('NumPy is required to generate synthetic data')
+
+
+def _rng(seed, kind, batch):
+    return np.random.default_rng([seed, KINDS.index(kind), batch])
+
+
+def object_ids(kind, indexes):
+    """24-hex-digit ids for records of ``kind`` at ``indexes``"""
+    shifts = np.arange(4 * (ID_DIGITS - 1), -1, -4, dtype=np.uint64)
+    digits = HEX_DIGITS[(indexes.astype(np.uint64)[:, None] >> shifts) & np.uint64(15)]
+    hex_index = np.ascontiguousarray(digits).view(f'S{ID_DIGITS}').ravel()
+    return np.char.add(ID_PREFIX[kind].encode(), hex_index).astype('U24')
+
+
+def _pick(rng, choices, n):
+    return np.array(choices)[rng.integers(0, len(choices), n)]
+
+
+def _timestamps(rng, n, days=DAYS):
+    """createdAt uniform over ``days`` from START, updatedAt up to a month later"""
+    created = np.datetime64(START, 'ms') + rng.integers(0, days * 86400000, n).astype('timedelta64[ms]')
+    updated = created + (rng.exponential(3 * 86400000, n).astype('int64') % (30 * 86400000)).astype('timedelta64[ms]')
+    return created, updated
+
+
+def user_roles(n, seed=0):
+    """Role codes of all ``n`` users; the first three cover every role"""
+    _require_numpy()
+    roles = np.random.default_rng([seed, len(KINDS)]).choice(len(ROLES), n, p=ROLE_WEIGHTS).astype(np.uint8)
+    roles[:len(ROLES)] = np.arange(min(n, len(ROLES)))
+    return roles
+
+
+def _role_indexes(roles, role):
+    """Indexes of the users with ``role``; ValueError if there are none"""
+    indexes = np.flatnonzero(roles == ROLES.index(role))
+    if not len(indexes):
+        raise ValueError(f'No user has the {role} role; generate at least {len(ROLES)} users')
+    return indexes
+
+
+def _full_names(rng, n):
+    return _pick(rng, FIRST_NAMES, n), _pick(rng, LAST_NAMES, n)
+
+
+def user_columns(rng, index, roles):
+    n = len(index)
+    first, last = _full_names(rng, n)
+    username = np.char.add(np.char.add(np.char.add(np.char.lower(first), '_'), np.char.lower(last)),
+                           index.astype(str))
+    created, updated = _timestamps(rng, n)
+    return {
+        '_id': object_ids('users', index),
+        'username': username,
+        'email': np.char.add(username, '@example.com'),
+        'firstName': first,
+        'lastName': last,
+        'role': roles[index],
+        'isActive': rng.random(n) < ACTIVE_USERS,
+        'createdAt': created,
+        'updatedAt': updated,
+    }
+
+
+def project_columns(rng, index, admins):
+    n = len(index)
+    words = _pick(rng, PROJECT_WORDS, n)
+    created, updated = _timestamps(rng, n, days=30)
+    return {
+        '_id': object_ids('projects', index),
+        # Numbered, since project names are unique
+        'name': np.char.add(np.char.add(words, ' '), (index + 1).astype(str)),
+        'description': np.char.add(np.char.add('Synthetic project for the ', np.char.lower(words)), ' team'),
+        'status': rng.choice(len(PROJECT_STATUSES), n, p=PROJECT_STATUS_WEIGHTS).astype(np.uint8),
+        'createdBy': object_ids('users', admins[rng.integers(0, len(admins), n)]),
+        'createdAt': created,
+        'updatedAt': updated,
+    }
+
+
+def bug_columns(rng, index, projects, developers, testers):
+    n = len(index)
+    area = rng.integers(0, len(AREAS), n)
+    areas = np.array(AREAS)[area]
+    title = np.char.add(np.char.add(areas, ' '), _pick(rng, PROBLEMS, n))
+    priority = rng.choice(len(PRIORITIES), n, p=PRIORITY_WEIGHTS).astype(np.uint8)
+    status = rng.choice(len(STATUSES), n, p=STATUS_WEIGHTS).astype(np.uint8)
+    # Squaring a uniform draw skews bugs towards the first projects
+    project = (projects * rng.random(n) ** 2).astype(np.int64)
+    public = rng.random(n) < PUBLIC_REPORTS
+    first, last = _full_names(rng, n)
+    reporter_email = np.char.add(np.char.add(np.char.add(np.char.lower(first), '.'), np.char.lower(last)),
+                                 '@example.com')
+    reporter_user = object_ids('users', testers[rng.integers(0, len(testers), n)])
+    # Open bugs are picked up less often than ones already worked on
+    assigned = rng.random(n) < np.where(status == STATUSES.index('open'), 0.5, 0.95)
+    assignee = object_ids('users', developers[rng.integers(0, len(developers), n)])
+    steps = np.array([step.replace('{area}', area_name.lower()) for area_name in AREAS for step in STEPS])
+    created, updated = _timestamps(rng, n)
+    return {
+        '_id': object_ids('bugs', index),
+        'title': title,
+        'description': np.char.add(title, ' for some users since the last release.'),
+        'priority': priority,
+        'status': status,
+        'project': object_ids('projects', project),
+        'reporter.type': public.astype(np.uint8),
+        'reporter.user': np.where(public, '', reporter_user),
+        'reporter.name': np.where(public, np.char.add(np.char.add(first, ' '), last), ''),
+        'reporter.email': np.where(public, reporter_email, ''),
+        'assignedTo': np.where(assigned, assignee, ''),
+        'stepsToReproduce': steps[area * len(STEPS) + rng.integers(0, len(STEPS), n)],
+        'expectedBehavior': _pick(rng, EXPECTED, n),
+        'actualBehavior': _pick(rng, ACTUAL, n),
+        'createdAt': created,
+        'updatedAt': updated,
+    }
+
+
+COLUMNS = {'users': user_columns, 'projects': project_columns, 'bugs': bug_columns}
+
+
+def batches(kind, count, seed=0, batch_size=BATCH_SIZE, **refs):
+    """Yield dicts of column arrays for ``count`` records of ``kind``
+
+    ``refs`` are what the kind's records point at: ``roles`` for users,
+    ``admins`` for projects, and ``projects``, ``developers`` and
+    ``testers`` for bugs (see generate).
+    """
+    _require_numpy()
+    for batch, start in enumerate(range(0, count, batch_size)):
+        index = np.arange(start, min(start + batch_size, count))
+        yield COLUMNS[kind](_rng(seed, kind, batch), index, **refs)
+
+
+def records(kind, columns):
+    """Yield one record dict per row of a batch, shaped like the backend's
+
+    Enum codes become their labels, timestamps ISO strings, fields named
+    ``a.b`` nest as ``{'a': {'b': ...}}`` and empty strings are left out.
+    """
+    enums = ENUMS[kind]
+    names = list(columns)
+    values = []
+    for name in names:
+        column = columns[name]
+        if name in enums:
+            column = np.array(enums[name])[column]
+        elif column.dtype.kind == 'M':
+            column = np.char.add(np.datetime_as_string(column, unit='ms'), 'Z')
+        values.append(column.tolist())
+    nested = [tuple(name.split('.', 1)) if '.' in name else None for name in names]
+    for row in zip(*values):
+        record = {}
+        for name, path, value in zip(names, nested, row):
+            if value == '':
+                continue
+            if path is None:
+                record[name] = value
+            else:
+                record.setdefault(path[0], {})[path[1]] = value
+        yield record
+
+
+def _replace_when_done(path):
+    tmp = os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}.{os.getpid()}.tmp')
+    return tmp, lambda: os.replace(tmp, path)
+
+
+def _remove(path):
+    """Delete a file or directory tree if it exists"""
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def _json_texts(kind, name, column):
+    """JSON text of each value of a column; '' where the field is left out"""
+    if name in ENUMS[kind]:
+        labels = [json.dumps(label) for label in ENUMS[kind][name]]
+        return [labels[code] for code in column.tolist()]
+    if column.dtype.kind == 'M':
+        return [f'"{value}Z"' for value in np.datetime_as_string(column, unit='ms').tolist()]
+    if column.dtype.kind == 'b':
+        return ['true' if value else 'false' for value in column.tolist()]
+    if column.dtype.kind == 'U':
+        return [encode_basestring(value) if value else '' for value in column.tolist()]
+    return [json.dumps(value) for value in column.tolist()]
+
+
+def json_lines(kind, columns):
+    """The compact JSON text of every record of a batch, as ``records`` gives them
+
+    Each column is turned into ``,"key":value`` fragments in one pass and
+    every line is a join of its row's fragments. The first field of a
+    record and of each nested object must always be present.
+    """
+    parts = []
+    group = ''
+    for name, column in columns.items():
+        outer, _, inner = name.rpartition('.')
+        key = json.dumps(inner)
+        texts = _json_texts(kind, name, column)
+        if not parts:
+            opening = f'{{{key}:'
+            parts.append([opening + text for text in texts])
+            continue
+        if outer != group:
+            if group:
+                parts.append(repeat('}'))
+            group = outer
+            if outer:
+                opening = f',{json.dumps(outer)}:{{{key}:'
+                parts.append([opening + text for text in texts])
+                continue
+        field = f',{key}:'
+        parts.append([field + text if text else '' for text in texts])
+    parts.append(repeat('}}' if group else '}'))
+    return list(map(''.join, zip(*parts)))
+
+
+def write_jsonl(path, kind, column_batches):
+    """Stream batches to a JSONL file; return the number of records"""
+    tmp, done = _replace_when_done(path)
+    count = 0
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            for columns in column_batches:
+                lines = json_lines(kind, columns)
+                if lines:
+                    f.write('\n'.join(lines) + '\n')
+                count += len(lines)
+    except BaseException:
+        _remove(tmp)
+        raise
+    done()
+    return count
+
+
+def _utf8(column):
+    # UTF-8 bytes take a quarter of the space of NumPy's UCS-4 strings, and
+    # for ASCII text a plain cast produces them
+    try:
+        return column.astype('S')
+    except UnicodeEncodeError:
+        return np.char.encode(column, 'utf-8')
+
+
+def write_npz(path, kind, column_batches):
+    """One compressed part-NNNNN.npz per batch in the directory ``path``
+
+    The parts go into a temporary directory that then replaces ``path``
+    whole, so shards of an earlier, larger dataset are never left behind.
+    """
+    tmp, done = _replace_when_done(path)
+    old = tmp[:-len('.tmp')] + '.old'
+    count = 0
+    labels = {f'{name}.labels': np.array(values) for name, values in ENUMS[kind].items()}
+    try:
+        os.makedirs(tmp)
+        for batch, columns in enumerate(column_batches):
+            columns = {name: _utf8(column) if column.dtype.kind == 'U' else column
+                       for name, column in columns.items()}
+            with open(os.path.join(tmp, f'part-{batch:05d}.npz'), 'wb') as f:
+                np.savez_compressed(f, **columns, **labels)
+            count += len(columns['_id'])
+        # A directory cannot be renamed over a non-empty one, so the old
+        # one is moved aside first and deleted once the new one is in place
+        if os.path.exists(path):
+            os.replace(path, old)
+        done()
+    except BaseException:
+        _remove(tmp)
+        if os.path.exists(old) and not os.path.exists(path):
+            os.replace(old, path)
+        raise
+    _remove(old)
+    return count
+
+
+def npz_batches(path):
+    """Yield the column batches of an npz directory written by write_npz
+
+    Text comes back as str columns; enum columns stay codes into ENUMS.
+    """
+    _require_numpy()
+    for shard in shard_files(path):
+        columns = {}
+        with np.load(shard) as part:
+            for key in part.files:
+                if not key.endswith('.labels'):
+                    column = part[key]
+                    columns[key] = np.char.decode(column, 'utf-8') if column.dtype.kind == 'S' else column
+        yield columns
+
+
+def write_parquet(path, kind, column_batches):
+    """Stream batches to a Parquet file, one row group per batch"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError('Parquet output needs the pyarrow package: pip install pyarrow')
+    enums = ENUMS[kind]
+    tmp, done = _replace_when_done(path)
+    writer = None
+    count = 0
+    try:
+        try:
+            for columns in column_batches:
+                arrays = {}
+                for name, column in columns.items():
+                    if name in enums:
+                        arrays[name] = pa.DictionaryArray.from_arrays(column.astype(np.int8), enums[name])
+                    elif column.dtype.kind == 'U':
+                        arrays[name] = pa.array(column, mask=column == '')
+                    else:
+                        arrays[name] = pa.array(column)
+                table = pa.table(arrays)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp, table.schema)
+                writer.write_table(table)
+                count += len(table)
+        finally:
+            if writer is not None:
+                writer.close()
+    except BaseException:
+        _remove(tmp)
+        raise
+    if writer is not None:
+        done()
+    return count
+
+
+WRITERS = {'jsonl': (write_jsonl, '{kind}.jsonl'), 'npz': (write_npz, '{kind}'),
+           'parquet': (write_parquet, '{kind}.parquet')}
+
+
+def generate(out_dir, users, projects, bugs, seed=0, fmt='jsonl', batch_size=BATCH_SIZE):
+    """Write the three datasets into ``out_dir``; yield (path, records, seconds)
+
+    User roles are drawn for the whole population up front (one byte per
+    user), so projects can point at admins and bugs at developers and
+    testers without the user records being kept. Bugs are only ever
+    assigned to developers and reported by testers; ValueError if there
+    are bugs but no users with those roles (or projects but no admin).
+    """
+    _require_numpy()
+    write, pattern = WRITERS[fmt]
+    roles = user_roles(users, seed)
+    refs = {'users': {'roles': roles}, 'projects': {}, 'bugs': {'projects': projects}}
+    if projects:
+        refs['projects']['admins'] = _role_indexes(roles, 'admin')
+    if bugs:
+        refs['bugs']['developers'] = _role_indexes(roles, 'developer')
+        refs['bugs']['testers'] = _role_indexes(roles, 'tester')
+    os.makedirs(out_dir, exist_ok=True)
+    counts = {'users': users, 'projects': projects, 'bugs': bugs}
+    for kind in KINDS:
+        start = time.perf_counter()
+        path = os.path.join(out_dir, pattern.format(kind=kind))
+        count = write(path, kind, batches(kind, counts[kind], seed, batch_size, **refs[kind]))
+        yield path, count, time.perf_counter() - start
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a synthetic bug tracker dataset')
+    parser.add_argument('out_dir', nargs='?', default=OUT_DIR, help=f'output directory (default: {OUT_DIR})')
+    parser.add_argument('--bugs', type=int, default=100000)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--projects', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0, help='same seed and batch size, same data')
+    parser.add_argument('--format', choices=FORMATS, default='jsonl', dest='fmt')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='records generated per batch')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Generate the dataset given on the command line"""
+    args = parse_args(argv)
+    if min(args.users, args.projects) < 1 or args.bugs < 0 or args.batch_size < 1:
+        raise SystemExit('--users and --projects must be at least 1 and --batch-size positive')
+    try:
+        for path, count, elapsed in generate(args.out_dir, args.users, args.projects, args.bugs, args.seed,
+                                             args.fmt, args.batch_size):
+            print(f"Wrote {count} records to {path} in {elapsed:.2f} s ({count / max(elapsed, 1e-9):,.0f}/s)")
+    except (RuntimeError, ValueError) as exc:
+        raise SystemExit(str(exc))
+
+
+if __name__ == "__main__":
+    main()
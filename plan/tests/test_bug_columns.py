@@ -0,0 +1,59 @@
+import pytest
+
+from dashboard_data import aggregate_bugs
+
+np = pytest.importorskip('numpy')
+
+from bug_columns import BugColumns, summarize, summarize_npz  # noqa: E402
+
+BUGS = [
+    {'priority': 'high', 'status': 'open', 'project': 'p1', 'assignedTo': 'u1',
+     'reporter': {'type': 'internal'}, 'createdAt': '2024-01-02T10:00:00Z'},
+    {'priority': 'low', 'status': 'closed', 'project': 'p2', 'assignedTo': 'u2'},
+    {'status': 'in-progress', 'project': 'p1', 'reportedBy': 'u3'},
+    {'priority': 'urgent', 'status': 'open', 'assignedTo': 'u1'},
+    {'priority': 'critical', 'status': 'reopened', 'project': 'p3', 'assignedTo': 'u2'},
+    {'priority': None, 'status': None, 'project': 'p2'},
+    {'priority': 'urgent', 'status': 'wontfix', 'reporter': {'type': 'public'}},
+    {},
+]
+
+
+def test_summarize_matches_row_path():
+    assert summarize(BUGS) == aggregate_bugs(BUGS)
+
+
+def test_summarize_matches_row_path_across_batches():
+    stats = BugColumns.from_records(BUGS, batch_size=3).stats()
+    assert stats == aggregate_bugs(BUGS)
+
+
+def test_unknown_values_keep_their_names():
+    columns = BugColumns.from_records(BUGS)
+    assert columns.priority_counts()['urgent'] == 2
+    assert columns.priority_counts()['medium'] == 2
+    assert columns.status_counts()['reopened'] == 1
+    assert columns.crosstab().sum() == len(BUGS)
+
+
+def test_summarize_matches_row_path_on_empty_input():
+    assert summarize([]) == aggregate_bugs([])
+
+
+def test_months_without_bugs_are_zero():
+    bugs = [{'createdAt': '2024-11-30T10:00:00Z'}, {'createdAt': '2025-02-01T00:00:00Z'}, {}]
+    expected = {'2024-11': 1, '2024-12': 0, '2025-01': 0, '2025-02': 1}
+    assert BugColumns.from_records(bugs).time_buckets() == expected
+    assert aggregate_bugs(bugs)['bugsPerMonth'] == expected
+
+
+def test_npz_shards_match_the_records(tmp_path):
+    from dashboard_data import iter_records, shard_files
+    from synthetic_data import generate
+
+    list(generate(str(tmp_path), 20, 5, 500, seed=2, fmt='npz', batch_size=128))
+    stats = summarize_npz(shard_files(str(tmp_path / 'bugs')))
+    expected = aggregate_bugs(iter_records(str(tmp_path / 'bugs')))
+    assert stats == expected
+    # The project chart shows the first projects, so the order must agree too
+    assert list(stats['bugsPerProject']) == list(expected['bugsPerProject'])
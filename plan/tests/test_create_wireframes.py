@@ -0,0 +1,28 @@
+"""Builds through the create_wireframes command line"""
+import gzip
+
+from create_wireframes import main
+from svg_minify import minify
+from variants import fit_viewport
+from wireframe_engine import render_page
+from wireframe_specs import ADMIN_DASHBOARD, THEMES, VIEWPORTS
+
+
+def test_variants_are_minified_and_compressed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    main(['--variants', '--roles', 'admin', '--viewports', 'mobile', '--themes', 'dark', '--minify',
+          '--compress', 'gz'])
+    page = tmp_path / 'variants' / 'admin-mobile-dark.svg'
+    spec = fit_viewport(ADMIN_DASHBOARD, VIEWPORTS['mobile'])
+    assert page.read_bytes() == minify(render_page(spec, None, theme=THEMES['dark'])).encode('utf-8')
+    assert gzip.decompress((tmp_path / 'variants' / 'admin-mobile-dark.svg.gz').read_bytes()) == page.read_bytes()
+
+
+def test_deleted_compressed_sibling_is_rebuilt(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    main(['--compress', 'gz'])
+    (tmp_path / 'login-wireframe.svg.gz').unlink()
+    capsys.readouterr()
+    main(['--compress', 'gz'])
+    assert 'Created login-wireframe.svg ' in capsys.readouterr().out
+    assert (tmp_path / 'login-wireframe.svg.gz').exists()
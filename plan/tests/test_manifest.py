@@ -0,0 +1,130 @@
+import copy
+import os
+import shutil
+
+import pytest
+
+import build_manifest
+from build_manifest import Manifest, file_digest, generator_sources, page_digest
+from create_wireframes import PAGES
+
+SPEC = PAGES[0][1]
+
+
+def test_page_digest_is_stable():
+    assert page_digest(SPEC, {'instanced': True}) == page_digest(copy.deepcopy(SPEC), {'instanced': True})
+
+
+def test_page_digest_changes_with_spec():
+    spec = copy.deepcopy(SPEC)
+    spec['components'][-1]['text'] = 'Something else'
+    assert page_digest(spec) != page_digest(SPEC)
+
+
+def test_page_digest_changes_with_options_and_theme():
+    digest = page_digest(SPEC)
+    assert page_digest(SPEC, {'instanced': True}) != digest
+    assert page_digest(SPEC, {'minify_output': True}) != digest
+    assert page_digest(SPEC, theme={'white': '#000000'}) != digest
+
+
+def test_page_digest_changes_with_data(tmp_path):
+    data = tmp_path / 'bugs.jsonl'
+    data.write_text('{"title": "a"}\n')
+    digest = page_digest(SPEC, inputs=[str(data)])
+    data.write_text('{"title": "b"}\n')
+    file_digest.cache_clear()
+    assert page_digest(SPEC, inputs=[str(data)]) != digest
+
+
+def test_manifest_round_trip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'page.svg').write_text('<svg/>')
+    manifest = Manifest('manifest.json')
+    assert not manifest.is_current('page.svg', 'abc')
+    manifest.record('page.svg', 'abc')
+    manifest.save()
+    reloaded = Manifest('manifest.json')
+    assert reloaded.is_current('page.svg', 'abc')
+    assert not reloaded.is_current('page.svg', 'def')
+
+
+def test_manifest_notices_changed_or_missing_output(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'page.svg').write_text('<svg/>')
+    manifest = Manifest(None)
+    manifest.record('page.svg', 'abc')
+    (tmp_path / 'page.svg').write_text('<svg></svg>')
+    assert not manifest.is_current('page.svg', 'abc')
+    (tmp_path / 'page.svg').unlink()
+    assert not manifest.is_current('page.svg', 'abc')
+
+
+def test_manifest_notices_changed_or_missing_siblings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'page.svg').write_text('<svg/>')
+    (tmp_path / 'page.svg.gz').write_bytes(b'12345')
+    manifest = Manifest(None)
+    manifest.record('page.svg', 'abc', siblings={'page.svg.gz': 5})
+    assert manifest.is_current('page.svg', 'abc')
+    (tmp_path / 'page.svg.gz').write_bytes(b'123')
+    assert not manifest.is_current('page.svg', 'abc')
+    (tmp_path / 'page.svg.gz').unlink()
+    assert not manifest.is_current('page.svg', 'abc')
+
+
+def test_generator_sources_follow_the_engine_imports():
+    sources = generator_sources()
+    for name in ('wireframe_engine.py', 'svg_writer.py', 'layout.py', 'text_metrics.py', 'dashboard_data.py',
+                 'svg_minify.py', 'create_wireframes.py', 'build_manifest.py'):
+        assert name in sources
+    assert 'wireframe_specs.py' not in sources
+
+
+@pytest.fixture
+def plan_copy(tmp_path, monkeypatch):
+    """A copy of the plan/ sources that build_manifest hashes instead"""
+    for name in os.listdir(build_manifest.HERE):
+        if name.endswith('.py'):
+            shutil.copy(os.path.join(build_manifest.HERE, name), tmp_path / name)
+    monkeypatch.setattr(build_manifest, 'HERE', str(tmp_path))
+    _clear_caches()
+    yield tmp_path
+    monkeypatch.undo()
+    _clear_caches()
+
+
+def _clear_caches():
+    generator_sources.cache_clear()
+    file_digest.cache_clear()
+
+
+def _append(path, text):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+    _clear_caches()
+
+
+def test_page_digest_changes_with_every_generator_source(plan_copy):
+    digest = page_digest(SPEC)
+    for name in generator_sources():
+        _append(plan_copy / name, '\n# edited\n')
+        edited = page_digest(SPEC)
+        assert edited != digest, name
+        digest = edited
+
+
+def test_new_engine_import_is_hashed(plan_copy):
+    (plan_copy / 'new_helper.py').write_text('WIDTH = 1\n')
+    assert 'new_helper.py' not in generator_sources()
+    _append(plan_copy / 'layout.py', '\nfrom new_helper import WIDTH\n')
+    assert 'new_helper.py' in generator_sources()
+    digest = page_digest(SPEC)
+    _append(plan_copy / 'new_helper.py', 'WIDTH = 2\n')
+    assert page_digest(SPEC) != digest
+
+
+def test_spec_module_is_hashed_as_data(plan_copy):
+    digest = page_digest(SPEC)
+    _append(plan_copy / 'wireframe_specs.py', '\n# edited\n')
+    assert page_digest(SPEC) == digest
@@ -0,0 +1,141 @@
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from output_writer import ArchiveWriter, FileWriter, spool
+
+
+class FailingArchive(ArchiveWriter):
+    """An archive whose write of ``bad.svg`` fails on the writer thread"""
+
+    def _write(self, name, data):
+        if name == 'bad.svg':
+            raise OSError('disk full')
+        super()._write(name, data)
+
+
+@pytest.mark.parametrize('suffix', ['.zip', '.tar.gz'])
+def test_archive_round_trip(tmp_path, suffix):
+    path = str(tmp_path / f'out{suffix}')
+    with ArchiveWriter(path) as writer:
+        writer.write('a.svg', b'<svg/>')
+        writer.write('sub/b.svg', b'<svg></svg>')
+    if suffix == '.zip':
+        with zipfile.ZipFile(path) as archive:
+            assert archive.read('sub/b.svg') == b'<svg></svg>'
+    else:
+        with tarfile.open(path) as archive:
+            assert archive.extractfile('sub/b.svg').read() == b'<svg></svg>'
+    assert os.listdir(tmp_path) == [f'out{suffix}']
+
+
+@pytest.mark.parametrize('suffix', ['.zip', '.tar.gz'])
+def test_failed_write_leaves_no_archive_or_temp_file(tmp_path, suffix):
+    writer = FailingArchive(str(tmp_path / f'out{suffix}'))
+    writer.write('a.svg', b'<svg/>')
+    writer.write('bad.svg', b'<svg/>')
+    with pytest.raises(OSError, match='disk full'):
+        writer.close()
+    assert os.listdir(tmp_path) == []
+    assert not writer.thread.is_alive()
+
+
+def test_failed_write_in_with_block_leaves_nothing(tmp_path):
+    with pytest.raises(OSError, match='disk full'):
+        with FailingArchive(str(tmp_path / 'out.zip')) as writer:
+            writer.write('bad.svg', b'<svg/>')
+    assert os.listdir(tmp_path) == []
+
+
+def test_file_writer_replaces_atomically(tmp_path):
+    target = tmp_path / 'page.svg'
+    target.write_bytes(b'old')
+    with FileWriter(sync=True) as writer:
+        writer.write(str(target), b'new')
+        writer.write(str(tmp_path / 'sub' / 'other.svg'), b'x')
+    assert target.read_bytes() == b'new'
+    assert sorted(os.listdir(tmp_path)) == ['page.svg', 'sub']
+
+
+def test_file_writer_failure_leaves_no_temp_file(tmp_path):
+    (tmp_path / 'blocker').write_bytes(b'')
+    writer = FileWriter()
+    writer.write(str(tmp_path / 'page.svg'), b'ok')
+    writer.write(str(tmp_path / 'blocker' / 'page.svg'), b'x')
+    with pytest.raises(OSError):
+        writer.close()
+    assert sorted(os.listdir(tmp_path)) == ['blocker', 'page.svg']
+
+
+def test_error_stays_raised_until_abort(tmp_path):
+    writer = FailingArchive(str(tmp_path / 'out.zip'))
+    writer.write('bad.svg', b'<svg/>')
+    with pytest.raises(OSError, match='disk full'):
+        writer.flush()
+    # Catching the error does not let later files into the archive
+    with pytest.raises(OSError, match='disk full'):
+        writer.write('late.svg', b'<svg/>')
+    with pytest.raises(OSError, match='disk full'):
+        writer.flush()
+    with pytest.raises(OSError, match='disk full'):
+        writer.close()
+    assert writer.written == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_files_queued_after_a_failure_are_dropped(tmp_path):
+    (tmp_path / 'blocker').write_bytes(b'')
+    writer = FileWriter()
+    writer.write(str(tmp_path / 'blocker' / 'page.svg'), b'x')
+    writer.write(str(tmp_path / 'later.svg'), b'x')
+    with pytest.raises(OSError):
+        writer.flush()
+    with pytest.raises(OSError):
+        writer.flush()
+    writer.abort()
+    assert sorted(os.listdir(tmp_path)) == ['blocker']
+
+
+def spooled(writer, name, data):
+    path, f = spool(name, writer.spool_dir(name))
+    with f:
+        f.write(data)
+    return [(name, path, len(data))]
+
+
+@pytest.mark.parametrize('suffix', ['.zip', '.tar'])
+def test_archive_takes_spooled_files(tmp_path, suffix):
+    path = str(tmp_path / f'out{suffix}')
+    with ArchiveWriter(path) as writer:
+        writer.commit(spooled(writer, 'sub/a.svg', b'<svg/>'))
+    if suffix == '.zip':
+        with zipfile.ZipFile(path) as archive:
+            assert archive.read('sub/a.svg') == b'<svg/>'
+    else:
+        with tarfile.open(path) as archive:
+            assert archive.extractfile('sub/a.svg').read() == b'<svg/>'
+    assert os.listdir(tmp_path) == [f'out{suffix}']
+
+
+def test_file_writer_renames_spooled_files(tmp_path):
+    target = str(tmp_path / 'sub' / 'page.svg')
+    with FileWriter(sync=True) as writer:
+        writer.commit(spooled(writer, target, b'<svg/>'))
+    with open(target, 'rb') as f:
+        assert f.read() == b'<svg/>'
+    assert os.listdir(tmp_path / 'sub') == ['page.svg']
+
+
+def test_spooled_files_are_removed_after_a_failure(tmp_path):
+    writer = FailingArchive(str(tmp_path / 'out.zip'))
+    writer.write('bad.svg', b'<svg/>')
+    writer.commit(spooled(writer, 'queued.svg', b'<svg/>'))
+    with pytest.raises(OSError, match='disk full'):
+        writer.flush()
+    late = spooled(writer, 'late.svg', b'<svg/>')
+    with pytest.raises(OSError, match='disk full'):
+        writer.commit(late)
+    writer.abort()
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,129 @@
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+from create_wireframes import PAGES
+from preview_server import PreviewServer, accepts_gzip
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('gzip', True),
+    ('gzip, deflate, br', True),
+    ('deflate;q=1, gzip;q=0.5', True),
+    ('GZIP', True),
+    ('gzip;q=0', False),
+    ('gzip; q=0.0', False),
+    ('gzip;q=x', True),
+    ('gzip;q=', True),
+    ('gzip;level=1;q=0', False),
+    ('*', True),
+    ('*;q=0', False),
+    ('gzip;q=0, *', False),
+    ('*;q=0, gzip', True),
+    ('br, deflate', False),
+    ('', False),
+])
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+def request(server, raw):
+    """Send raw request bytes to a served PreviewServer; return the response bytes"""
+    async def run():
+        listener = await asyncio.start_server(server.handle, '127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(raw)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+    return asyncio.run(run())
+
+
+def get(server, path, **headers):
+    lines = [f'GET {path} HTTP/1.1', 'Host: localhost', 'Connection: close']
+    lines += [f'{name.replace("_", "-")}: {value}' for name, value in headers.items()]
+    response = request(server, ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+    head, _, body = response.partition(b'\r\n\r\n')
+    status_line, *header_lines = head.decode('latin-1').split('\r\n')
+    fields = dict(line.split(': ', 1) for line in header_lines)
+    return int(status_line.split()[1]), fields, body
+
+
+def test_malformed_q_value_is_served():
+    status, fields, body = get(PreviewServer(PAGES), '/login-wireframe.svg', Accept_Encoding='gzip;q=x')
+    assert status == 200
+    assert fields['Content-Encoding'] == 'gzip'
+
+
+def test_render_error_is_a_500():
+    broken = {'name': 'broken', 'width': 100, 'height': 100, 'components': [{'type': 'no_such_component'}]}
+    server = PreviewServer([('broken-wireframe.svg', broken)])
+    status, fields, body = get(server, '/broken-wireframe.svg')
+    assert status == 500
+    assert b'no_such_component' in body
+
+
+def write_bugs(path, count):
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(count):
+            f.write(json.dumps({'_id': str(i), 'title': f'Bug {i}', 'priority': 'high', 'status': 'open'}) + '\n')
+
+
+def test_data_edits_reload_the_statistics(tmp_path):
+    bugs = tmp_path / 'bugs.jsonl'
+    write_bugs(bugs, 2)
+    server = PreviewServer(PAGES, data=str(tmp_path))
+    assert server.stats['totalBugs'] == 2
+    first = get(server, '/admin-dashboard-wireframe.svg')
+    assert get(server, '/admin-dashboard-wireframe.svg', If_None_Match=first[1]['ETag'])[0] == 304
+
+    write_bugs(bugs, 5)
+    stat = os.stat(bugs)
+    os.utime(bugs, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    status, fields, body = get(server, '/admin-dashboard-wireframe.svg')
+    assert server.stats['totalBugs'] == 5
+    assert status == 200
+    assert fields['ETag'] != first[1]['ETag']
+    assert body != first[2]
+
+
+def test_routing_runs_on_the_render_thread_once_per_url():
+    server = PreviewServer(PAGES)
+    threads = []
+    route = server.route
+
+    def traced(path, query):
+        threads.append(threading.current_thread().name)
+        return route(path, query)
+    server.route = traced
+    first = get(server, '/login-wireframe.svg?theme=dark')
+    assert get(server, '/login-wireframe.svg?theme=dark', If_None_Match=first[1]['ETag'])[0] == 304
+    assert len(threads) == 1
+    assert threads[0].startswith('render')
+
+
+def test_request_body_is_not_read_as_the_next_request():
+    body = b'GET /nope HTTP/1.1\r\n\r\n'
+    response = request(PreviewServer(PAGES),
+                       b'POST /login-wireframe.svg HTTP/1.1\r\nHost: localhost\r\n'
+                       b'Content-Length: %d\r\n\r\n%s' % (len(body), body)
+                       + b'GET /login-wireframe.svg HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n')
+    assert response.startswith(b'HTTP/1.1 405 ')
+    assert response.count(b'HTTP/1.1 ') == 2
+    assert b'HTTP/1.1 200 OK' in response
+    assert b'HTTP/1.1 404' not in response
+
+
+def test_chunked_body_closes_the_connection():
+    response = request(PreviewServer(PAGES),
+                       b'POST / HTTP/1.1\r\nHost: localhost\r\nTransfer-Encoding: chunked\r\n\r\n'
+                       b'5\r\nhello\r\n0\r\n\r\n')
+    assert response.startswith(b'HTTP/1.1 405 ')
+    assert b'Connection: close' in response
+    assert response.count(b'HTTP/1.1 ') == 1
@@ -0,0 +1,50 @@
+from rasterize import rasterize
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}">{body}</svg>'
+
+
+def pixel(canvas, x, y):
+    start = (y * canvas.width + x) * 3
+    return tuple(canvas.pixels[start:start + 3])
+
+
+def inked_columns(canvas):
+    """x of every column with a non-white pixel"""
+    return {x for x in range(canvas.width) for y in range(canvas.height) if pixel(canvas, x, y) != (255, 255, 255)}
+
+
+def test_labels_are_drawn_as_glyphs():
+    svg = SVG.format(w=120, h=40, body='<text x="10" y="30" font-size="20" fill="black">HI</text>')
+    glyphs = rasterize(svg)
+    greeked = rasterize(svg, greek=True)
+    # H and I are separate strokes; greeking draws one solid bar per word
+    columns = sorted(inked_columns(glyphs))
+    assert any(b - a > 1 for a, b in zip(columns, columns[1:]))
+    columns = sorted(inked_columns(greeked))
+    assert columns == list(range(columns[0], columns[-1] + 1))
+    assert glyphs.pixels != greeked.pixels
+    assert pixel(glyphs, 13, 20) == (0, 0, 0)
+
+
+def test_unknown_characters_are_drawn_as_boxes():
+    canvas = rasterize(SVG.format(w=60, h=40, body='<text x="10" y="30" font-size="20">☃</text>'))
+    assert inked_columns(canvas)
+
+
+def test_rounded_corners_are_left_unpainted():
+    canvas = rasterize(SVG.format(w=100, h=100, body='<rect x="10" y="10" width="80" height="80" rx="20" fill="black"/>'))
+    assert pixel(canvas, 11, 11) == (255, 255, 255)
+    assert pixel(canvas, 30, 11) == (0, 0, 0)
+    assert pixel(canvas, 11, 50) == (0, 0, 0)
+    assert pixel(canvas, 50, 50) == (0, 0, 0)
+
+
+def test_rounded_outline_is_a_ring():
+    canvas = rasterize(SVG.format(w=100, h=100, body='<rect x="10" y="10" width="80" height="80" ry="20" '
+                                                      'fill="none" stroke="black" stroke-width="4"/>'))
+    assert pixel(canvas, 50, 10) == (0, 0, 0)
+    assert pixel(canvas, 10, 50) == (0, 0, 0)
+    assert pixel(canvas, 50, 50) == (255, 255, 255)
+    assert pixel(canvas, 10, 10) == (255, 255, 255)
+    # The arc passes through the corner's diagonal
+    assert pixel(canvas, 16, 16) == (0, 0, 0)
@@ -0,0 +1,82 @@
+"""Rendered pages against the committed SVGs, and output modes that must
+draw the same picture"""
+import gzip
+import os
+
+import pytest
+
+from bug_table import table_page
+from create_wireframes import PAGES
+from rasterize import rasterize
+from svg_minify import minify
+from wireframe_engine import render_page, spool_page
+from wireframe_specs import EYE_ICON, LOGIN, LOGIN_ERROR, MENU_ICON, SIGNUP, SIGNUP_ERROR, TABLE_SPECS
+
+PLAN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize('filename, spec', PAGES, ids=[page[0] for page in PAGES])
+def test_render_matches_committed_svg(filename, spec):
+    with open(os.path.join(PLAN, filename), encoding='utf-8') as f:
+        assert render_page(spec, None) == f.read()
+
+
+@pytest.mark.parametrize('page, error_page, message', [
+    (LOGIN, LOGIN_ERROR, 'Invalid username or password'),
+    (SIGNUP, SIGNUP_ERROR, 'Email address is already registered'),
+])
+def test_error_state_is_its_own_page(page, error_page, message):
+    svg, error_svg = render_page(page, None), render_page(error_page, None)
+    assert message not in svg
+    assert message in error_svg
+    for icon in (MENU_ICON, EYE_ICON):
+        assert icon in svg and icon in error_svg
+
+
+@pytest.mark.parametrize('filename, spec', PAGES, ids=[page[0] for page in PAGES])
+def test_uncached_render_matches_cached(filename, spec):
+    assert render_page(spec, None, cached=False) == render_page(spec, None)
+
+
+@pytest.mark.parametrize('filename, spec', PAGES, ids=[page[0] for page in PAGES])
+def test_streamed_page_matches_rendered_string(tmp_path, filename, spec):
+    [(name, path, size)] = spool_page(spec, filename, str(tmp_path))
+    with open(path, 'rb') as f:
+        data = f.read()
+    assert name == filename
+    assert size == len(data)
+    assert data == render_page(spec, None).encode('utf-8')
+
+
+def test_spooled_minified_page_and_siblings(tmp_path):
+    filename, spec = PAGES[0]
+    files = spool_page(spec, filename, str(tmp_path), minify_output=True, compress=['gz', 'svgz'])
+    assert [name for name, path, size in files] == [filename, filename + '.gz', filename[:-4] + '.svgz']
+    with open(files[0][1], 'rb') as f:
+        data = f.read()
+    assert data == minify(render_page(spec, None)).encode('utf-8')
+    for name, path, size in files[1:]:
+        with open(path, 'rb') as f:
+            assert gzip.decompress(f.read()) == data
+
+
+@pytest.mark.parametrize('filename, spec', PAGES, ids=[page[0] for page in PAGES])
+def test_minified_page_rasterizes_the_same(filename, spec):
+    svg = render_page(spec, None)
+    assert rasterize(minify(svg)).pixels == rasterize(svg).pixels
+
+
+@pytest.mark.parametrize('filename, spec', PAGES, ids=[page[0] for page in PAGES])
+def test_instanced_page_rasterizes_the_same(filename, spec):
+    assert rasterize(render_page(spec, None, True)).pixels == rasterize(render_page(spec, None)).pixels
+
+
+ROWS = [{'id': f'#{i:03d}', 'title': f'Bug number {i}', 'status': ('open', 'in-progress', 'closed')[i % 3],
+         'priority': ('critical', 'high', 'medium', 'low')[i % 4], 'assignedTo': 'Jane Developer',
+         'created': '2024-03-01'} for i in range(1, 19)]
+SIZED_PAGES = PAGES + [(spec['name'], table_page(spec, ROWS, 1, 1)) for spec in TABLE_SPECS]
+
+
+@pytest.mark.parametrize('filename, spec', SIZED_PAGES, ids=[page[0] for page in SIZED_PAGES])
+def test_instanced_page_is_never_larger(filename, spec):
+    assert len(render_page(spec, None, True, cached=False)) <= len(render_page(spec, None, cached=False))
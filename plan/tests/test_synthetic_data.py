@@ -0,0 +1,114 @@
+import os
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import synthetic_data  # noqa: E402
+from dashboard_data import data_inputs, iter_records, load_stats  # noqa: E402
+from synthetic_data import ENUMS, batches, generate, user_roles  # noqa: E402
+
+
+def build(out_dir, fmt='jsonl', users=20, projects=5, bugs=500, **kwargs):
+    return list(generate(str(out_dir), users, projects, bugs, fmt=fmt, batch_size=64, **kwargs))
+
+
+def load(out_dir, kind):
+    return list(iter_records(os.path.join(out_dir, f'{kind}.jsonl')))
+
+
+def test_references_respect_roles(tmp_path):
+    build(tmp_path)
+    roles = {user['_id']: user['role'] for user in load(tmp_path, 'users')}
+    project_ids = {project['_id'] for project in load(tmp_path, 'projects')}
+    for project in load(tmp_path, 'projects'):
+        assert roles[project['createdBy']] == 'admin'
+    bugs = load(tmp_path, 'bugs')
+    assert len(bugs) == 500
+    assert any('assignedTo' in bug for bug in bugs)
+    for bug in bugs:
+        assert bug['project'] in project_ids
+        if 'assignedTo' in bug:
+            assert roles[bug['assignedTo']] == 'developer'
+        if bug['reporter']['type'] == 'internal':
+            assert roles[bug['reporter']['user']] == 'tester'
+
+
+@pytest.mark.parametrize('users', [1, 2])
+def test_bugs_without_developers_are_an_error(tmp_path, users):
+    with pytest.raises(ValueError, match='role'):
+        build(tmp_path, users=users)
+    assert not os.path.exists(tmp_path / 'users.jsonl')
+
+
+def test_few_users_are_fine_without_bugs(tmp_path):
+    build(tmp_path, users=1, projects=1, bugs=0)
+    assert load(tmp_path, 'users')[0]['role'] == 'admin'
+
+
+def test_every_role_is_present():
+    for n in range(3, 10):
+        assert set(user_roles(n).tolist()) == {0, 1, 2}
+
+
+def test_output_is_reproducible(tmp_path):
+    build(tmp_path / 'a', seed=7)
+    build(tmp_path / 'b', seed=7)
+    for kind in ('users', 'projects', 'bugs'):
+        with open(tmp_path / 'a' / f'{kind}.jsonl', 'rb') as a, open(tmp_path / 'b' / f'{kind}.jsonl', 'rb') as b:
+            assert a.read() == b.read()
+
+
+def test_parquet_round_trip(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+
+    build(tmp_path / 'jsonl', seed=5)
+    build(tmp_path / 'parquet', fmt='parquet', seed=5)
+    for kind in ('users', 'projects', 'bugs'):
+        table = pq.read_table(tmp_path / 'parquet' / f'{kind}.parquet')
+        expected = load(tmp_path / 'jsonl', kind)
+        rows = table.to_pylist()
+        assert len(rows) == len(expected)
+        for name in ENUMS[kind]:
+            assert pa.types.is_dictionary(table.schema.field(name).type)
+        for row, record in zip(rows, expected):
+            for name, value in row.items():
+                outer, _, inner = name.rpartition('.')
+                want = record.get(outer, {}).get(inner) if outer else record.get(name)
+                if hasattr(value, 'isoformat'):
+                    value = value.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+                assert value == want, (kind, name)
+
+
+def test_npz_reads_back_like_jsonl(tmp_path):
+    build(tmp_path / 'jsonl', seed=3)
+    build(tmp_path / 'npz', fmt='npz', seed=3)
+    for kind in ('users', 'projects', 'bugs'):
+        assert list(iter_records(str(tmp_path / 'npz' / kind))) == load(tmp_path / 'jsonl', kind)
+    assert load_stats(str(tmp_path / 'npz')) == load_stats(str(tmp_path / 'jsonl'))
+    assert len(data_inputs(str(tmp_path / 'npz'))) == len(os.listdir(tmp_path / 'npz' / 'bugs')) + 2
+
+
+def test_smaller_npz_dataset_replaces_every_shard(tmp_path):
+    build(tmp_path, fmt='npz', bugs=300)
+    build(tmp_path, fmt='npz', bugs=100)
+    assert sorted(os.listdir(tmp_path / 'bugs')) == ['part-00000.npz', 'part-00001.npz']
+    assert sum(1 for bug in iter_records(str(tmp_path / 'bugs'))) == 100
+    assert sorted(os.listdir(tmp_path)) == ['bugs', 'projects', 'users']
+
+
+@pytest.mark.parametrize('fmt', ['jsonl', 'npz', 'parquet'])
+def test_failed_write_leaves_no_temporary_output(tmp_path, monkeypatch, fmt):
+    if fmt == 'parquet':
+        pytest.importorskip('pyarrow')
+    build(tmp_path, fmt=fmt, bugs=100)
+    before = sorted(os.listdir(tmp_path))
+
+    def failing(kind, count, seed=0, batch_size=64, **refs):
+        yield from batches(kind, min(count, 64), seed, batch_size, **refs)
+        raise OSError('disk full')
+    monkeypatch.setattr(synthetic_data, 'batches', failing)
+    with pytest.raises(OSError, match='disk full'):
+        build(tmp_path, fmt=fmt, bugs=100)
+    assert sorted(os.listdir(tmp_path)) == before
@@ -0,0 +1,70 @@
+import io
+
+import pytest
+
+from create_wireframes import PAGES
+from svg_minify import minify
+from wireframe_diff import CHANGES, diff, elements
+from wireframe_engine import render_page
+
+
+def records(svg, roles):
+    return elements(io.BytesIO(svg.encode('utf-8')), roles)[2]
+
+
+def changes(old, new):
+    roles = {}
+    result = diff(records(old, roles), records(new, roles))
+    return {change: len(result[change]) for change in CHANGES}
+
+
+NONE = dict.fromkeys(CHANGES, 0)
+
+
+def page(*body, style=''):
+    css = f'<style>{style}</style>' if style else ''
+    return f'<svg xmlns="http://www.w3.org/2000/svg" width="200" height="100">{css}{"".join(body)}</svg>'
+
+
+@pytest.mark.parametrize('filename, spec', PAGES, ids=[p[0] for p in PAGES])
+def test_page_against_its_minified_self_is_unchanged(filename, spec):
+    svg = render_page(spec, None)
+    assert changes(svg, minify(svg)) == NONE
+
+
+@pytest.mark.parametrize('filename, spec', PAGES, ids=[p[0] for p in PAGES])
+def test_instanced_page_is_unchanged(filename, spec):
+    assert changes(render_page(spec, None), render_page(spec, None, True)) == NONE
+
+
+@pytest.mark.parametrize('old, new', [
+    ('<text x="5" y="20" font-size="14">Hi</text>', '<text x="5" y="20" font-size="14px">Hi</text>'),
+    ('<rect x="0" y="0" width="9" height="9" fill="white" />',
+     '<rect x="0" y="0" width="9" height="9" fill="#fff" />'),
+    ('<rect x="0" y="0" width="9" height="9" fill="#FFFFFF" stroke="black" />',
+     '<rect x="0" y="0" width="9" height="9" style="fill: #fff; stroke: #000" />'),
+    ('<text x="5" y="20" font-weight="bold">Hi</text>', '<text x="5" y="20" font-weight="700">Hi</text>'),
+    ('<rect x="0" y="0" width="9" height="9" />', '<rect x="0" y="0" width="9" height="9" fill="black" />'),
+    ('<line x1="0" y1="0" x2="9" y2="0" stroke="red" stroke-dasharray="4,2" />',
+     '<line x1="0" y1="0" x2="9" y2="0" stroke="#f00" stroke-dasharray="4 2" />'),
+])
+def test_equivalent_styles_are_one_role(old, new):
+    assert changes(page(old), page(new)) == NONE
+
+
+def test_stylesheet_and_inline_style_are_one_role():
+    old = page('<rect x="0" y="0" width="9" height="9" class="a" />', style='.a{fill:#00f;stroke-width:2px}')
+    new = page('<rect x="0" y="0" width="9" height="9" fill="blue" stroke-width="2" />')
+    assert changes(old, new) == NONE
+
+
+def test_different_colour_is_a_different_role():
+    old = page('<rect x="0" y="0" width="9" height="9" fill="white" />')
+    new = page('<rect x="0" y="0" width="9" height="9" fill="#eee" />')
+    assert changes(old, new) == dict(NONE, added=1, removed=1)
+
+
+def test_moved_element():
+    old = page('<rect x="0" y="0" width="9" height="9" fill="red" />')
+    new = page('<rect x="20" y="0" width="9" height="9" fill="red" />')
+    assert changes(old, new) == dict(NONE, moved=1)
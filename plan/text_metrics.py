@@ -0,0 +1,136 @@
+"""Text measurement and fitting for wireframe labels
+
+Widths come from the Helvetica/Arial advance-width tables (units per 1000
+em), so labels can be centred, wrapped, truncated and shrunk to fit their
+boxes without a font renderer. Measurements are memoized in an LRU cache
+keyed on (text, font family, size, weight); data-driven pages measure the
+same strings over and over, and ``cache_stats()`` shows how well that pays
+off.
+"""
+from functools import lru_cache
+
+ELLIPSIS = '...'
+
+# Advance widths for ' ' (32) through '~' (126)
+_REGULAR = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+_BOLD = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+]
+_FALLBACK = 556
+_MONOSPACE = 600
+
+REGULAR = {chr(32 + i): w for i, w in enumerate(_REGULAR)}
+BOLD = {chr(32 + i): w for i, w in enumerate(_BOLD)}
+
+
+def _table(family, weight):
+    if 'mono' in family.lower() or 'courier' in family.lower():
+        return None
+    return BOLD if str(weight) in ('bold', 'bolder', '600', '700', '800', '900') else REGULAR
+
+
+def _char_widths(text, family, size, weight):
+    table = _table(family, weight)
+    scale = size / 1000
+    if table is None:
+        return [_MONOSPACE * scale] * len(text)
+    get = table.get
+    return [get(ch, _FALLBACK) * scale for ch in text]
+
+
+@lru_cache(maxsize=1 << 16)
+def text_width(text, family='Arial', size=12, weight='normal'):
+    """Rendered width of ``text`` in pixels"""
+    table = _table(family, weight)
+    if table is None:
+        return _MONOSPACE * len(text) * size / 1000
+    get = table.get
+    return sum(get(ch, _FALLBACK) for ch in text) * size / 1000
+
+
+def cache_stats():
+    """Hits, misses, hit rate and entries of the width cache"""
+    info = text_width.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'hit_rate': info.hits / lookups if lookups else 0.0,
+        'entries': info.currsize,
+    }
+
+
+def cache_report():
+    stats = cache_stats()
+    lookups = stats['hits'] + stats['misses']
+    return (f"Text metrics cache: {lookups:,} lookups, {stats['hit_rate']:.1%} hits, "
+            f"{stats['entries']:,} entries")
+
+
+def truncate(text, max_width, family='Arial', size=12, weight='normal'):
+    """``text`` shortened with an ellipsis so it is at most ``max_width`` wide"""
+    if text_width(text, family, size, weight) <= max_width:
+        return text
+    budget = max_width - text_width(ELLIPSIS, family, size, weight)
+    used = 0.0
+    for i, width in enumerate(_char_widths(text, family, size, weight)):
+        used += width
+        if used > budget:
+            return text[:i].rstrip() + ELLIPSIS if i else ''
+    return text
+
+
+def wrap(text, max_width, family='Arial', size=12, weight='normal'):
+    """Greedy word wrap; words wider than a line are truncated"""
+    lines = []
+    line = ''
+    for word in text.split():
+        candidate = f'{line} {word}' if line else word
+        if text_width(candidate, family, size, weight) <= max_width:
+            line = candidate
+            continue
+        if line:
+            lines.append(line)
+        line = truncate(word, max_width, family, size, weight)
+    if line:
+        lines.append(line)
+    return lines
+
+
+def fit_text(text, width, height, family='Arial', size=12, weight='normal',
+             min_size=8, line_height=1.2):
+    """Largest size <= ``size`` at which ``text`` wraps into the box
+
+    Returns (size, lines). If even ``min_size`` needs too many lines, the
+    lines that fit are kept and the last one ends in an ellipsis.
+    """
+    for candidate in range(int(size), int(min_size) - 1, -1):
+        lines = wrap(text, width, family, candidate, weight)
+        if len(lines) * candidate * line_height <= height:
+            return candidate, lines
+    max_lines = max(int(height // (min_size * line_height)), 1)
+    lines = wrap(text, width, family, min_size, weight)
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        lines[-1] = truncate(lines[-1] + ELLIPSIS, width, family, min_size, weight)
+    return min_size, lines
+
+
+def fit_size(text, max_width, family='Arial', size=12, weight='normal', min_size=8):
+    """Largest size <= ``size`` at which ``text`` fits on one line"""
+    width = text_width(text, family, size, weight)
+    if width <= max_width:
+        return size
+    return max(int(size * max_width / width), min_size)
@@ -0,0 +1,209 @@
+"""Variant matrix: every role page at every viewport in every theme
+
+A roles x viewports x themes matrix is expanded into one job per
+(role, viewport) pair. The page is fitted to the viewport and laid out
+once per pair; themes only change colours, so each theme reuses that
+layout and rebuilds just the stylesheet before writing its file. Jobs
+can be spread over a process pool, and an index.json plus an index.html
+gallery list every variant.
+
+Pages with a layout tree reflow: layout.py solves the tree again for
+the viewport width, wrapping rows and growing the page height as needed.
+Other pages are fitted fluidly: horizontal positions, widths and steps
+scale with the canvas, and below MOBILE_BREAKPOINT the sidebar is dropped
+so the content takes the full width. Either way labels are truncated to
+their boxes, and heights and font sizes are kept.
+"""
+import copy
+import html
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+
+from layout import resolve
+from output_writer import FileWriter, discard
+from wireframe_engine import spool_page
+from wireframe_specs import MOBILE_BREAKPOINT, ROLE_SPECS, THEMES, VIEWPORTS
+
+INDEX_FILE = 'index.json'
+GALLERY_FILE = 'index.html'
+
+# Geometry components fall back to when a spec leaves it out
+DEFAULT_GEOMETRY = {
+    'sidebar': {'width': 250},
+    'main_area': {'x': 250},
+    'breadcrumb': {'x': 270},
+    'stat_cards': {'x': 280},
+    'button_row': {'width': 200},
+}
+LENGTH_FIELDS = ('width', 'step', 'max_width')
+
+# Room the header title leaves for the user menu buttons
+USER_MENU_WIDTH = 170
+
+
+def parse_viewport(value):
+    """(name, width) for a viewport name or a plain pixel width"""
+    if value in VIEWPORTS:
+        return value, VIEWPORTS[value]
+    try:
+        width = int(value)
+    except ValueError:
+        raise ValueError(f'Unknown viewport {value!r}; use one of {", ".join(VIEWPORTS)} or a width')
+    return f'w{width}', width
+
+
+def fit_viewport(spec, width):
+    """Copy of ``spec`` laid out for a canvas ``width`` pixels wide"""
+    if width == spec['width']:
+        return spec
+    if 'layout' in spec:
+        page = copy.copy(spec)
+        page['width'] = width
+        page['components'] = [_fit_header(c, width, spec['components']) for c in spec['components']]
+        return page
+    components = spec['components']
+    offset = 0
+    if width < MOBILE_BREAKPOINT:
+        sidebars = [c for c in components if c['type'] == 'sidebar']
+        if sidebars:
+            offset = sidebars[0].get('width', DEFAULT_GEOMETRY['sidebar']['width'])
+            components = [c for c in components if c['type'] != 'sidebar']
+    scale = width / (spec['width'] - offset)
+
+    fitted = []
+    for c in components:
+        c = dict(DEFAULT_GEOMETRY.get(c['type'], {}), **c)
+        if 'x' in c:
+            c['x'] = max(round((c['x'] - offset) * scale), 0)
+        for field in LENGTH_FIELDS:
+            if field in c:
+                c[field] = round(c[field] * scale)
+        if 'columns' in c:
+            c['columns'] = [dict(col, width=round(col['width'] * scale)) for col in c['columns']]
+        fitted.append(_fit_header(c, width, components))
+    page = copy.copy(spec)
+    page['width'] = width
+    page['components'] = fitted
+    return page
+
+
+def _fit_header(c, width, components):
+    """Narrow the header title so it stays clear of the user menu"""
+    if c['type'] == 'header' and any(other['type'] == 'user_menu' for other in components):
+        return dict(c, max_width=width - 20 - USER_MENU_WIDTH)
+    return c
+
+
+def variant_filename(role, viewport, theme):
+    return f'{role}-{viewport}-{theme}.svg'
+
+
+def expand(roles, viewports, themes, specs=None):
+    """One job per (role, viewport): (role, viewport name, fitted spec, themes)"""
+    specs = specs or ROLE_SPECS
+    jobs = []
+    for role in roles:
+        for value in viewports:
+            name, width = parse_viewport(value)
+            jobs.append((role, name, fit_viewport(specs[role], width), list(themes)))
+    return jobs
+
+
+def render_job(job, out_dir, directory, **options):
+    """Render every theme of one (role, viewport) job; return [(path, files, seconds)]
+
+    Each theme's files are spooled into ``directory`` (see
+    wireframe_engine.spool_page). The first theme lays the page out; the
+    others find the layout in the engine's plan cache and only restyle it.
+    """
+    role, viewport, spec, themes = job
+    rendered = []
+    try:
+        for theme in themes:
+            path = os.path.join(out_dir, variant_filename(role, viewport, theme))
+            start = time.perf_counter()
+            files = spool_page(spec, path, directory, theme=THEMES[theme], **options)
+            rendered.append((path, files, time.perf_counter() - start))
+    except BaseException:
+        for path, files, seconds in rendered:
+            discard(files)
+        raise
+    return rendered
+
+
+def render_jobs(jobs, out_dir, directory, workers=1, **options):
+    """render_job for every job, in order, spread over ``workers`` processes
+
+    Files of results that are never taken are removed.
+    """
+    render = partial(render_job, out_dir=out_dir, directory=directory, **options)
+    if workers <= 1:
+        yield from map(render, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(render, jobs)
+        try:
+            yield from results
+        finally:
+            for rendered in results:
+                for path, files, seconds in rendered:
+                    discard(files)
+
+
+def build(jobs, out_dir, workers=1, writer=None, **options):
+    """Write all jobs, yielding (path, files, seconds) in job order
+
+    ``files`` are the (name, path, size) the variant was written as.
+    Workers only render; the files go through ``writer`` (by default a
+    FileWriter of its own, closed before the last item is yielded back).
+    """
+    with FileWriter() if writer is None else nullcontext(writer) as out:
+        directory = out.spool_dir(os.path.join(out_dir, INDEX_FILE))
+        for rendered in render_jobs(jobs, out_dir, directory, workers, **options):
+            out.commit(file for path, files, seconds in rendered for file in files)
+            yield from rendered
+
+
+def write_index(jobs, themes, out_dir, sizes=None, writer=None):
+    """Write index.json and an index.html gallery for the whole matrix
+
+    ``sizes`` maps variant paths to their size in bytes; any other variant
+    is looked up on disk. With a ``writer`` the index files go through it.
+    """
+    sizes = sizes or {}
+    entries = []
+    for role, viewport, spec, _ in jobs:
+        height = resolve(spec)['height']
+        for theme in themes:
+            filename = variant_filename(role, viewport, theme)
+            path = os.path.join(out_dir, filename)
+            entries.append({
+                'file': filename,
+                'role': role,
+                'viewport': viewport,
+                'theme': theme,
+                'width': spec['width'],
+                'height': height,
+                'bytes': sizes[path] if path in sizes else os.path.getsize(path) if os.path.exists(path) else None,
+            })
+    index = json.dumps({'variants': entries}, indent=2)
+
+    figures = ''.join(
+        f'<figure><a href="{html.escape(e["file"])}"><img src="{html.escape(e["file"])}" '
+        f'width="{min(e["width"], 320)}" loading="lazy"></a>'
+        f'<figcaption>{html.escape(e["role"])} / {html.escape(e["viewport"])} / '
+        f'{html.escape(e["theme"])}</figcaption></figure>\n'
+        for e in entries
+    )
+    gallery = ('<!DOCTYPE html>\n<meta charset="utf-8">\n<title>Wireframe variants</title>\n'
+               '<style>body{font-family:Arial,sans-serif}figure{display:inline-block;'
+               'vertical-align:top;margin:8px}img{border:1px solid #ccc}</style>\n'
+               f'{figures}')
+    with FileWriter() if writer is None else nullcontext(writer) as out:
+        out.write(os.path.join(out_dir, INDEX_FILE), index.encode('utf-8'))
+        out.write(os.path.join(out_dir, GALLERY_FILE), gallery.encode('utf-8'))
+    return entries
@@ -0,0 +1,255 @@
+"""Watch mode: rebuild the wireframes as their sources change
+
+``create_wireframes.py --watch`` keeps running after the first build and
+watches the generator modules, the --spec files and the --data files. On
+Linux it uses inotify through ctypes; elsewhere, or with --poll, every
+path is polled for a new mtime or size every POLL_INTERVAL seconds.
+
+Changes are handled in the same warm process. An edited module is
+reloaded together with the modules that import it, dependencies first;
+every other module keeps its caches, so editing a spec leaves the layout
+solver, the text metrics and the engine's plan cache warm. The file
+digest cache is then cleared and the build manifest picks out the pages
+whose inputs actually changed, and only those are rendered.
+"""
+import ctypes
+import ctypes.util
+import importlib
+import os
+import select
+import struct
+import sys
+import time
+import traceback
+
+from build_manifest import module_imports
+from dashboard_data import data_inputs
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+POLL_INTERVAL = 0.05
+
+# Editors often save in several steps (write, rename, chmod); events that
+# follow the first one this closely belong to the same save
+SETTLE = 0.01
+
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_FROM = 0x40
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+INOTIFY_EVENT = struct.Struct('iIII')
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class PollWatcher:
+    """Detect changes by comparing the (mtime, size) of every path"""
+
+    name = 'polling'
+
+    def __init__(self, paths, interval=POLL_INTERVAL):
+        self.interval = interval
+        self.state = {}
+        self.watch(paths)
+
+    def watch(self, paths):
+        """Replace the watched paths"""
+        self.state = {path: self.state[path] if path in self.state else _stat(path) for path in paths}
+
+    def wait(self, timeout=None):
+        """Block until watched paths change and return them (empty on timeout)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path, seen in self.state.items():
+                current = _stat(path)
+                if current != seen:
+                    self.state[path] = current
+                    changed.add(path)
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(self.interval)
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watches on the directories holding the watched paths
+
+    Directories rather than files are watched, so a save that writes a new
+    file and renames it over the old one is still seen.
+    """
+
+    name = 'inotify'
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self, paths):
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.dirs = {}
+        self.paths = set()
+        self.watch(paths)
+
+    def watch(self, paths):
+        """Replace the watched paths, adding directory watches as needed"""
+        self.paths = set(paths)
+        watched = set(self.dirs.values())
+        for path in self.paths:
+            for directory in [os.path.dirname(path)] + ([path] if os.path.isdir(path) else []):
+                if directory in watched:
+                    continue
+                wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+                if wd < 0:
+                    errno = ctypes.get_errno()
+                    raise OSError(errno, os.strerror(errno), directory)
+                self.dirs[wd] = directory
+                watched.add(directory)
+
+    def _read(self):
+        changed = set()
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            directory = self.dirs.get(wd)
+            if directory is None:
+                continue
+            path = os.path.join(directory, name)
+            if path in self.paths:
+                changed.add(path)
+            elif directory in self.paths:
+                # A file added to or removed from a watched data directory
+                changed.add(directory)
+        return changed
+
+    def wait(self, timeout=None):
+        """Block until watched paths change and return them (empty on timeout)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed = set()
+        while not changed:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not select.select([self.fd], [], [], remaining)[0]:
+                return changed
+            changed = self._read()
+        while select.select([self.fd], [], [], SETTLE)[0]:
+            changed |= self._read()
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def make_watcher(paths, poll=False):
+    """inotify watcher where available, otherwise a polling one"""
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    return PollWatcher(paths)
+
+
+def module_graph():
+    """Module name -> plan modules it imports, for every module in plan/"""
+    names = {name[:-3] for name in os.listdir(HERE) if name.endswith('.py')}
+    return {name: module_imports(os.path.join(HERE, name + '.py')) & names for name in names}
+
+
+def reload_order(changed, graph):
+    """``changed`` modules and every module importing them, dependencies first"""
+    dirty = set(changed)
+    grew = True
+    while grew:
+        grew = False
+        for name, deps in graph.items():
+            if name not in dirty and deps & dirty:
+                dirty.add(name)
+                grew = True
+    order = []
+    seen = set()
+
+    def visit(name):
+        if name in seen:
+            return
+        seen.add(name)
+        for dep in sorted(graph.get(name, ())):
+            visit(dep)
+        if name in dirty:
+            order.append(name)
+
+    for name in sorted(dirty):
+        visit(name)
+    return order
+
+
+def watched_paths(args, graph):
+    paths = {os.path.join(HERE, name + '.py') for name in graph}
+    paths.update(os.path.abspath(path) for path in args.spec)
+    if args.data:
+        paths.add(os.path.abspath(args.data))
+        paths.update(os.path.abspath(path) for path in data_inputs(args.data))
+    return paths
+
+
+def rebuild(changed, args, graph, manifest, options, output):
+    """Reload what ``changed`` touches and rebuild the affected pages"""
+    modules = [name for name in graph if os.path.join(HERE, name + '.py') in changed]
+    for name in modules:
+        graph[name] = module_imports(os.path.join(HERE, name + '.py')) & set(graph)
+    for name in reload_order(modules, graph):
+        if name in sys.modules:
+            importlib.reload(sys.modules[name])
+    build_manifest = importlib.import_module('build_manifest')
+    build_manifest.file_digest.cache_clear()
+    build_manifest.generator_sources.cache_clear()
+    create_wireframes = importlib.import_module('create_wireframes')
+    pages = create_wireframes.page_list(args.spec)
+    built, inputs, stats = create_wireframes.build_pages(pages, manifest, options, output, args.data,
+                                                         args.columnar)
+    return built, pages
+
+
+def run(args, manifest, options, output):
+    """Rebuild pages on every change until interrupted
+
+    A change that fails to import or render is reported and the previous
+    output is left in place; the next save tries again.
+    """
+    graph = module_graph()
+    watcher = make_watcher(watched_paths(args, graph), args.poll)
+    print(f"Watching {len(watcher.paths if hasattr(watcher, 'paths') else watcher.state)} files "
+          f"with {watcher.name}; press Ctrl+C to stop")
+    try:
+        while True:
+            changed = watcher.wait()
+            start = time.perf_counter()
+            try:
+                built, pages = rebuild(changed, args, graph, manifest, options, output)
+            except Exception:
+                traceback.print_exc()
+                continue
+            finally:
+                watcher.watch(watched_paths(args, graph))
+            names = ', '.join(sorted(os.path.relpath(path) for path in changed))
+            print(f"{names} changed: rebuilt {len(built)} of {len(pages)} wireframes in "
+                  f"{(time.perf_counter() - start) * 1000:.1f} ms")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
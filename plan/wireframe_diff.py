@@ -0,0 +1,277 @@
+"""Structural diff between two versions of a wireframe SVG
+
+    python wireframe_diff.py old.svg new.svg [--overlay diff.svg] [--json]
+
+Both documents are flattened into drawn elements by the rasterizer's tree
+walker, so <use> references, translate() and stylesheet classes are
+resolved the same way they are when drawing. Each element gets a role
+(tag, resolved paint and font, text content) and a bounding box.
+
+Matching is hash based and runs in linear time after the two walks:
+
+1. elements whose role and box are both unchanged pair up through a dict
+   keyed on (role, box) and are dropped;
+2. what is left is grouped by role, and within a role old and new
+   elements pair up in document order; a pair whose box changed is
+   reported as moved (position changed) or resized (same position);
+3. anything still unpaired was removed or added.
+
+Roles compare resolved values, not source text: presentation attributes,
+stylesheet rules and ``style=`` declarations are merged first, colours are
+compared as RGB and lengths as numbers, so a page and its minified copy
+have the same roles. A relabelled element is a different role, so it shows
+up as removed plus added. The overlay SVG outlines unchanged elements in grey and marks
+added (green), removed (red), moved (orange, with an arrow from the old
+position) and resized (purple) elements.
+"""
+import argparse
+import json
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import defaultdict, deque
+
+from rasterize import Renderer, parse_color, parse_dasharray, parse_number
+from svg_writer import SvgWriter
+from text_metrics import text_width
+
+# Style properties that are part of an element's role, with the value each
+# has when nothing sets it
+ROLE_PROPERTIES = {'fill': 'black', 'stroke': 'none', 'stroke-width': '1', 'stroke-dasharray': 'none',
+                   'stroke-dashoffset': '0', 'font-size': '16', 'font-weight': 'normal'}
+
+# Properties the rasterizer's style resolution does not pass down, read
+# from the element itself
+OWN_PROPERTIES = ('stroke-dasharray', 'stroke-dashoffset')
+
+FONT_WEIGHTS = {'normal': 400, 'bold': 700}
+
+CHANGES = ('added', 'removed', 'moved', 'resized')
+COLORS = {'added': '#16a34a', 'removed': '#dc2626', 'moved': '#f97316', 'resized': '#9333ea'}
+
+
+class BoxWalker(Renderer):
+    """Walk an SVG tree, calling ``add`` with the bounding box of every shape
+
+    ``add(tag, el, style, opacity, box, label)`` gets boxes as
+    (x, y, width, height) in page coordinates, in document order; text
+    boxes run from the font size above the baseline down to it.
+    """
+
+    def new_canvas(self, width, height):
+        return []
+
+    def add(self, tag, el, style, opacity, box, label=None):
+        raise NotImplementedError
+
+    def rect(self, el, style, dx, dy, opacity):
+        self.add('rect', el, style, opacity, (parse_number(el.get('x')) + dx, parse_number(el.get('y')) + dy,
+                                              parse_number(el.get('width')), parse_number(el.get('height'))))
+
+    def circle(self, el, style, dx, dy, opacity, angle=0.0):
+        r = parse_number(el.get('r'))
+        self.add('circle', el, style, opacity, (parse_number(el.get('cx')) + dx - r,
+                                                parse_number(el.get('cy')) + dy - r, 2 * r, 2 * r))
+
+    def line(self, el, style, dx, dy, opacity):
+        x1, x2 = parse_number(el.get('x1')) + dx, parse_number(el.get('x2')) + dx
+        y1, y2 = parse_number(el.get('y1')) + dy, parse_number(el.get('y2')) + dy
+        self.add('line', el, style, opacity, (min(x1, x2), min(y1, y2), abs(x2 - x1), abs(y2 - y1)))
+
+    def text(self, el, style, dx, dy, opacity):
+        content = ' '.join(''.join(el.itertext()).split())
+        size = parse_number(style.get('font-size'), 16.0)
+        width = text_width(content, style.get('font-family', 'Arial'), size, style.get('font-weight', 'normal'))
+        x = parse_number(el.get('x')) + dx
+        anchor = style.get('text-anchor', 'start')
+        if anchor in ('middle', 'end'):
+            x -= width / (2 if anchor == 'middle' else 1)
+        self.add('text', el, style, opacity, (x, parse_number(el.get('y')) + dy - size, width, size), content)
+
+
+def normalize(name, value):
+    """Comparable form of a role property: RGB colours, numeric lengths"""
+    if name in ('fill', 'stroke'):
+        return parse_color(value)
+    if name == 'stroke-dasharray':
+        return tuple(parse_dasharray(value) or ())
+    if name == 'font-weight':
+        return FONT_WEIGHTS.get(value.strip().lower(), parse_number(value, 400))
+    return parse_number(value)
+
+
+def declarations(css):
+    """{property: value} of a ``style=`` attribute"""
+    pairs = (part.split(':', 1) for part in css.split(';') if ':' in part)
+    return {name.strip(): value.strip() for name, value in pairs}
+
+
+class Collector(BoxWalker):
+    """Collect (role, box) records in document order
+
+    Roles are interned as small integers in ``roles``, which two
+    collectors share so that their records can be compared directly.
+    """
+
+    def __init__(self, root, roles):
+        self.roles = roles
+        self.paints = {}
+        super().__init__(root)
+
+    def paint(self, el, style):
+        """Normalized ROLE_PROPERTIES of an element under its resolved style"""
+        # Resolved styles are shared dicts, so each paint is worked out once
+        key = (id(style), el.get('style'), *map(el.get, OWN_PROPERTIES))
+        paint = self.paints.get(key)
+        if paint is None:
+            # Presentation attributes, then stylesheet rules, then style=
+            values = {name: el.get(name) for name in OWN_PROPERTIES if name in el.attrib}
+            values.update(style)
+            values.update(declarations(el.get('style') or ''))
+            paint = self.paints[key] = tuple(normalize(name, values.get(name, default))
+                                             for name, default in ROLE_PROPERTIES.items())
+        return paint
+
+    def add(self, tag, el, style, opacity, box, label=None):
+        role = (tag, label, self.paint(el, style))
+        self.canvas.append((self.roles.setdefault(role, len(self.roles)), box))
+
+
+def elements(path, roles):
+    """(width, height, [(role id, box)]) for an SVG file"""
+    collector = Collector(ET.parse(path).getroot(), roles)
+    return collector.width, collector.height, collector.render()
+
+
+def diff(old, new):
+    """Match two element lists; return {change: [...], 'unchanged': [box]}
+
+    Moved and resized entries are (role, old box, new box); added and
+    removed ones are (role, box).
+    """
+    # 1. Identical elements: a multiset of (role, box) from the old side
+    exact = defaultdict(int)
+    for record in old:
+        exact[record] += 1
+    unchanged = []
+    new_left = []
+    for record in new:
+        if exact.get(record):
+            exact[record] -= 1
+            unchanged.append(record[1])
+        else:
+            new_left.append(record)
+
+    # 2. Same role, different box: pair in document order
+    by_role = defaultdict(deque)
+    for record in old:
+        if exact.get(record):
+            exact[record] -= 1
+            by_role[record[0]].append(record[1])
+    result = {change: [] for change in CHANGES}
+    for role, box in new_left:
+        candidates = by_role.get(role)
+        if candidates:
+            before = candidates.popleft()
+            change = 'moved' if before[:2] != box[:2] else 'resized'
+            result[change].append((role, before, box))
+        else:
+            result['added'].append((role, box))
+
+    # 3. Old elements nobody claimed
+    for role, boxes in by_role.items():
+        result['removed'].extend((role, box) for box in boxes)
+    result['unchanged'] = unchanged
+    return result
+
+
+def _num(value):
+    return f'{value:.2f}'.rstrip('0').rstrip('.')
+
+
+def _hex(rgb):
+    return '#{:02x}{:02x}{:02x}'.format(*rgb) if rgb else 'none'
+
+
+def describe(role, *boxes):
+    tag, label = role[0], role[1]
+    name = f"{tag} '{label}'" if label and tag == 'text' else f'{tag} {_hex(role[2][0])}'
+    return name + ' ' + ' -> '.join('({},{} {}x{})'.format(*map(_num, box)) for box in boxes)
+
+
+def write_overlay(result, width, height, out):
+    """Write an SVG highlighting every change over outlines of the rest"""
+    svg = SvgWriter(out, {'width': _num(width), 'height': _num(height), 'xmlns': 'http://www.w3.org/2000/svg'})
+    svg.rect({'x': '0', 'y': '0', 'width': _num(width), 'height': _num(height), 'fill': 'white'})
+
+    def box(b, color, dashed=False, fill='none'):
+        attrs = {'x': _num(b[0]), 'y': _num(b[1]), 'width': _num(b[2]), 'height': _num(b[3]),
+                 'fill': fill, 'stroke': color, 'stroke-width': '1' if color == '#d1d5db' else '2'}
+        if dashed:
+            attrs['stroke-dasharray'] = '4,3'
+        svg.rect(attrs)
+
+    for b in result['unchanged']:
+        box(b, '#d1d5db')
+    for role, b in result['removed']:
+        box(b, COLORS['removed'], dashed=True)
+    for role, b in result['added']:
+        box(b, COLORS['added'], fill='#dcfce7')
+    for change in ('moved', 'resized'):
+        for role, before, after in result[change]:
+            box(before, COLORS[change], dashed=True)
+            box(after, COLORS[change])
+            if change == 'moved':
+                svg.element('line', {
+                    'x1': _num(before[0] + before[2] / 2), 'y1': _num(before[1] + before[3] / 2),
+                    'x2': _num(after[0] + after[2] / 2), 'y2': _num(after[1] + after[3] / 2),
+                    'stroke': COLORS[change], 'stroke-width': '1'})
+    for i, change in enumerate(CHANGES):
+        svg.rect({'x': f'{10 + i * 110}', 'y': '10', 'width': '12', 'height': '12', 'fill': COLORS[change]})
+        svg.text({'x': f'{28 + i * 110}', 'y': '21', 'font-family': 'Arial', 'font-size': '12'},
+                 f'{change} {len(result[change])}')
+    svg.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Diff two versions of a wireframe SVG')
+    parser.add_argument('old')
+    parser.add_argument('new')
+    parser.add_argument('--overlay', metavar='FILE', help='write an SVG highlighting the changes')
+    parser.add_argument('--json', action='store_true', help='print the changes as JSON')
+    parser.add_argument('--limit', type=int, default=50, help='changes listed per kind (0 = all)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Print the changes between two SVGs; exit 1 if there are any"""
+    args = parse_args(argv)
+    start = time.perf_counter()
+    roles = {}
+    width, height, old = elements(args.old, roles)
+    new_width, new_height, new = elements(args.new, roles)
+    result = diff(old, new)
+    elapsed = time.perf_counter() - start
+    names = list(roles)
+
+    if args.overlay:
+        with open(args.overlay, 'w', encoding='utf-8') as f:
+            write_overlay(result, max(width, new_width), max(height, new_height), f)
+    if args.json:
+        json.dump({change: [dict(zip(('tag', 'label', 'paint'), names[role]), boxes=boxes)
+                            for role, *boxes in result[change]] for change in CHANGES}, sys.stdout)
+        print()
+    else:
+        for change in CHANGES:
+            entries = result[change]
+            for entry in entries[:args.limit or None]:
+                print(f'{change:8} {describe(names[entry[0]], *entry[1:])}')
+            if args.limit and len(entries) > args.limit:
+                print(f'{change:8} ... {len(entries) - args.limit} more')
+        print(f"{len(old)} -> {len(new)} elements: " + ', '.join(f'{len(result[c])} {c}' for c in CHANGES)
+              + f" ({elapsed * 1000:.1f} ms)")
+    sys.exit(1 if any(result[change] for change in CHANGES) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,753 @@
+import io
+import json
+import math
+import os
+from functools import lru_cache
+
+import profiling
+from dashboard_data import format_label
+from layout import line_height, resolve
+from output_writer import discard, spool
+from svg_minify import compress as compress_data
+from svg_minify import minify, sibling_name
+from svg_writer import (
+    Circle,
+    Fragment,
+    Line,
+    Rect,
+    SvgWriter,
+    Text,
+    Use,
+    fmt_number,
+    format_attrs,
+    style_usage,
+    stylesheet,
+)
+from text_metrics import fit_size, text_width, truncate, wrap
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+
+# Component type -> function(component, page) yielding shape records
+COMPONENTS = {}
+
+PRIORITY_COLORS = {'critical': '#dc3545', 'high': '#fd7e14', 'medium': '#ffc107', 'low': '#007bff'}
+STATUS_COLORS = {'open': '#17a2b8', 'inProgress': '#ffc107', 'in-progress': '#ffc107', 'closed': '#28a745'}
+PALETTE = ['#007bff', '#28a745', '#fd7e14', '#6f42c1', '#17a2b8', '#dc3545', '#ffc107', '#6c757d']
+
+# Page chrome repeated across the role dashboards; each is built and
+# serialized once per distinct set of parameters (see chrome_fragment)
+CHROME = frozenset(('header', 'user_menu', 'sidebar', 'breadcrumb'))
+
+# (component type, parameters, page size) -> Fragment, shared by all pages
+_FRAGMENTS = {}
+_FRAGMENTS_SIZE = 1024
+
+
+def component(name):
+    """Register a page-spec component type"""
+    def register(func):
+        COMPONENTS[name] = func
+        return func
+    return register
+
+
+def text_op(x, y, text, size=12, fill='black', bold=False, anchor=None):
+    return Text(x, y, text, size, fill, bold, anchor)
+
+
+def rect_op(x, y, width, height, fill, stroke='black', stroke_width=1, dasharray=None):
+    return Rect(x, y, width, height, fill, stroke, stroke_width, dasharray)
+
+
+def button_ops(x, y, width, height, fill, label, text_color='white', size=12,
+               bold=True, align='center', text_dx=None, text_dy=None, padding=4):
+    """A filled button with its label centred (or inset) and shrunk to fit"""
+    yield rect_op(x, y, width, height, fill)
+    if text_dy is None:
+        text_dy = height // 2 + 3
+    weight = 'bold' if bold else 'normal'
+    if align == 'center':
+        size = fit_size(label, width - 2 * padding, size=size, weight=weight)
+        yield text_op(x + width // 2, y + text_dy, label, size, text_color, bold, 'middle')
+    else:
+        text_dx = text_dx or padding
+        size = fit_size(label, width - text_dx - padding, size=size, weight=weight)
+        yield text_op(x + text_dx, y + text_dy, label, size, text_color, bold)
+
+
+@component('background')
+def background(c, page):
+    yield Rect(None, None, page['width'], page['height'], c.get('fill', 'white'), 'none')
+
+
+@component('header')
+def header(c, page):
+    yield rect_op(0, 0, page['width'], c.get('height', 60), '#f8f9fa', stroke_width=2)
+    title = c['title']
+    if c.get('max_width'):
+        title = truncate(title, c['max_width'], size=c.get('title_size', 16), weight='bold')
+    yield text_op(20, 35, title, c.get('title_size', 16), bold=True)
+    if c.get('subtitle'):
+        yield text_op(20, 55, c['subtitle'], 14, '#666')
+
+
+@component('user_menu')
+def user_menu(c, page):
+    right = page['width']
+    yield from button_ops(right - 150, 15, 80, 30, '#e9ecef', 'User Info', 'black', bold=False)
+    yield from button_ops(right - 60, 15, 50, 30, '#dc3545', 'Logout', 'white', bold=False)
+
+
+@component('sidebar')
+def sidebar(c, page):
+    top = c.get('top', 60)
+    active = c.get('active', 0)
+    width = c.get('width', 250)
+    yield rect_op(0, top, width, page['height'] - top, '#f1f3f4', stroke_width=2)
+    yield text_op(20, top + 30, truncate(c.get('title', 'Navigation'), width - 40, size=16, weight='bold'),
+                  16, bold=True)
+    for i, item in enumerate(c['items']):
+        y_pos = top + 50 + i * 50
+        selected = i == active
+        yield rect_op(20, y_pos, width - 40, 40, '#007bff' if selected else '#ffffff')
+        yield text_op(30, y_pos + 25, truncate(item, width - 60, size=14), 14, 'white' if selected else 'black')
+
+
+@component('main_area')
+def main_area(c, page):
+    top = c.get('top', 60)
+    x = c.get('x', 250)
+    yield rect_op(x, top, page['width'] - x, page['height'] - top, '#ffffff', stroke_width=2)
+
+
+@component('breadcrumb')
+def breadcrumb(c, page):
+    x = c.get('x', 270)
+    y = c.get('y', 80)
+    width = c.get('width', page['width'] - x - 20)
+    yield rect_op(x, y, width, 30, '#f8f9fa')
+    yield text_op(x + 10, y + 18, truncate(c.get('text', 'Home > Dashboard'), width - 20))
+
+
+@component('section_title')
+def section_title(c, page):
+    title = c['text']
+    if c.get('max_width'):
+        title = truncate(title, c['max_width'], size=18, weight='bold')
+    yield text_op(c['x'], c['y'], title, 18, bold=True)
+
+
+@component('text')
+def text(c, page):
+    size = c.get('size', 12)
+    bold = c.get('bold', False)
+    label = c['text']
+    if c.get('max_width'):
+        label = truncate(label, c['max_width'], size=size, weight='bold' if bold else 'normal')
+    yield text_op(c['x'], c['y'], label, size, c.get('fill', 'black'), bold, c.get('anchor'))
+
+
+@component('rect')
+def rect(c, page):
+    stroke = c.get('stroke', 'black')
+    yield Rect(c['x'], c['y'], c['width'], c['height'], c['fill'], stroke,
+               c.get('stroke_width', 1) if stroke else None, c.get('dasharray'),
+               rx=c.get('rx'), opacity=c.get('opacity'))
+
+
+@component('stat_cards')
+def stat_cards(c, page):
+    y = c.get('y', 160)
+    width = c['width']
+    for i, card in enumerate(c['cards']):
+        x_pos = c.get('x', 280) + i * c['step']
+        yield rect_op(x_pos, y, width, 120, card['color'], stroke_width=2)
+        yield text_op(x_pos + 20, y + 25, truncate(card['title'], width - 40, size=14, weight='bold'),
+                      14, bold=True)
+        yield rect_op(x_pos + 20, y + 40, width - 40, 60, 'white', '#ccc')
+        if 'value' in card:
+            size = fit_size(card['value'], width - 60, size=card.get('value_size', 24), weight='bold')
+            yield text_op(x_pos + width // 2, y + 78, card['value'], size, bold=True, anchor='middle')
+
+
+@component('button')
+def button(c, page):
+    yield from button_ops(c['x'], c['y'], c['width'], c['height'], c['fill'], c['label'],
+                          size=c.get('size', 12), text_dy=c.get('text_dy'))
+
+
+@component('button_row')
+def button_row(c, page):
+    for i, item in enumerate(c['buttons']):
+        yield from button_ops(c['x'] + i * c['step'], c['y'], c.get('width', 200),
+                              c.get('height', 50), item['color'], item['label'])
+
+
+@component('form_field')
+def form_field(c, page):
+    x, y = c['x'], c['y']
+    yield text_op(x, y, c['label'], 14, bold=True)
+    yield rect_op(x, y + 10, c['width'], c.get('height', 35), 'white', '#ccc')
+    yield text_op(x + 10, y + 30, truncate(c['placeholder'], c['width'] - 20), 12, '#999')
+
+
+@component('radio_group')
+def radio_group(c, page):
+    y = c['y']
+    for i, option in enumerate(c['options']):
+        x_pos = c['x'] + i * c['step']
+        yield Circle(x_pos + 10, y + 10, 8, 'white', option['color'], 2)
+        yield rect_op(x_pos + 25, y, 80, 20, option['color'], 'none', None)
+        yield text_op(x_pos + 65, y + 12, option['label'], 12, 'white', True, 'middle')
+
+
+@component('banner')
+def banner(c, page):
+    x, y = c['x'], c['y']
+    yield rect_op(x, y, c['width'], c['height'], c['fill'], c['stroke'], 1, c.get('dasharray'))
+    inner = c['width'] - 40
+    yield text_op(x + 20, y + 25, truncate(c['title'], inner, size=14, weight='bold'), 14, c['color'], True)
+    yield text_op(x + 20, y + 45, truncate(c['text'], inner), 12, c['color'])
+
+
+@component('bug_table')
+def bug_table(c, page):
+    """Header row plus one row per entry of the bound 'rows' window"""
+    x, y = c['x'], c['y']
+    row_height = c.get('row_height', 30)
+    columns = c['columns']
+    width = sum(col['width'] for col in columns)
+    yield rect_op(x, y, width, row_height, '#343a40')
+    left = x
+    for col in columns:
+        yield text_op(left + 10, y + 20, col['label'], 12, 'white', True)
+        left += col['width']
+    rows = c.get('rows', [])
+    for i, row in enumerate(rows):
+        row_y = y + (i + 1) * row_height
+        yield rect_op(x, row_y, width, row_height, '#ffffff' if i % 2 == 0 else '#f8f9fa', '#dee2e6')
+        left = x
+        for col in columns:
+            value = str(row.get(col['key'], ''))
+            if col.get('badge') and value:
+                yield rect_op(left + 8, row_y + 6, 90, 18, series_color(value, 0), 'none', None)
+                yield text_op(left + 53, row_y + 19, format_label(value), 11, 'white', True, 'middle')
+            else:
+                yield text_op(left + 10, row_y + 20, truncate(value, col['width'] - 20), 12)
+            left += col['width']
+    if c.get('caption'):
+        yield text_op(x, y + (len(rows) + 1) * row_height + 25, c['caption'], 12, '#666')
+
+
+def series_color(key, i):
+    return PRIORITY_COLORS.get(key) or STATUS_COLORS.get(key) or PALETTE[i % len(PALETTE)]
+
+
+@component('bar_chart')
+def bar_chart(c, page):
+    """Vertical bars for a {label: count} mapping bound via 'metric'
+
+    The first ``limit`` entries are drawn, or the last ones with ``latest``
+    (for a time series).
+    """
+    data = c.get('data')
+    if not data:
+        return
+    items = list(data.items())
+    limit = c.get('limit', 8)
+    items = items[-limit:] if c.get('latest') else items[:limit]
+    x, y, width, height = c['x'], c['y'], c['width'], c['height']
+    yield text_op(x, y, c['title'], 14, bold=True)
+    top = y + 10
+    yield rect_op(x, top, width, height - 10, 'white', '#ccc')
+    slot = (width - 20) // len(items)
+    bar_width = slot * 3 // 5
+    base = top + height - 30
+    plot = height - 60
+    peak = max(value for key, value in items) or 1
+    for i, (key, value) in enumerate(items):
+        bar_height = value * plot // peak
+        left = x + 10 + i * slot
+        center = left + slot // 2
+        yield rect_op(left + (slot - bar_width) // 2, base - bar_height, bar_width, bar_height,
+                      series_color(key, i), 'none', None)
+        yield text_op(center, base - bar_height - 4, f'{value:,}', 11, anchor='middle')
+        yield text_op(center, base + 14, truncate(format_label(str(key)), slot - 4, size=11), 11, anchor='middle')
+
+
+@component('donut_chart')
+def donut_chart(c, page):
+    """Donut with a legend for a {label: count} mapping bound via 'metric'"""
+    data = c.get('data')
+    total = sum(data.values()) if data else 0
+    if not total:
+        return
+    x, y, height = c['x'], c['y'], c['height']
+    ring = c.get('ring', 24)
+    radius = (height - 60) // 2
+    cx = x + 20 + radius + ring // 2
+    cy = y + 20 + radius + ring // 2
+    circumference = 2 * math.pi * radius
+    yield text_op(x, y, c['title'], 14, bold=True)
+    yield Circle(cx, cy, radius, 'none', '#eee', ring)
+    offset = 0.0
+    for i, (key, value) in enumerate(data.items()):
+        length = circumference * value / total
+        yield Circle(cx, cy, radius, 'none', series_color(key, i), ring,
+                     f'{fmt_number(length)} {fmt_number(circumference - length)}',
+                     fmt_number(-offset), f'rotate(-90 {cx} {cy})')
+        offset += length
+    legend_x = cx + radius + ring + 30
+    for i, (key, value) in enumerate(data.items()):
+        legend_y = y + 30 + i * 24
+        yield rect_op(legend_x, legend_y, 12, 12, series_color(key, i), 'none', None)
+        yield text_op(legend_x + 20, legend_y + 11,
+                      f'{format_label(str(key))} {value:,} ({value * 100 // total}%)', 12)
+
+
+# Components of the public site pages (homepage, login and signup)
+LINK_COLOR = '#2563eb'
+MUTED_COLOR = '#6b7280'
+BODY_COLOR = '#374151'
+HEADING_COLOR = '#111827'
+ERROR_COLOR = '#dc2626'
+# Room an input's error message takes below its field
+ERROR_HEIGHT = 25
+
+
+@component('navbar')
+def navbar(c, page):
+    """White top bar with the brand pill, text links and a menu button
+
+    ``menu_icon`` is a glyph drawn on the menu button.
+    """
+    height = c.get('height', 80)
+    yield Rect(0, 0, page['width'], height, '#ffffff', '#e5e5e5', 1)
+    yield Rect(60, 20, 120, 40, LINK_COLOR, rx=8, opacity=0.1)
+    yield text_op(120, 45, c.get('brand', 'XYZ Corp'), 16, LINK_COLOR, True, 'middle')
+    x = 300
+    active = c.get('active', 0)
+    for i, link in enumerate(c.get('links', ())):
+        yield text_op(x, 45, link, 14, BODY_COLOR if i == active else MUTED_COLOR)
+        x += text_width(link, size=14) + 24
+    yield Circle(page['width'] - 80, height // 2, 20, '#f3f4f6', '#d1d5db')
+    if c.get('menu_icon'):
+        yield text_op(page['width'] - 80, height // 2 + 5, c['menu_icon'], 12, MUTED_COLOR, anchor='middle')
+
+
+@component('circle')
+def circle(c, page):
+    """A dot given by cx/cy/r, or filling the middle of its box
+
+    A ``glyph`` is centred on the dot in white, ``glyph_size`` pixels high.
+    """
+    if 'cx' in c:
+        cx, cy, r = c['cx'], c['cy'], c['r']
+    else:
+        r = c.get('r', min(c['width'], c['height']) // 2)
+        cx, cy = c['x'] + c['width'] // 2, c['y'] + c['height'] // 2
+    yield Circle(cx, cy, r, c.get('fill', 'none'), c.get('stroke'), c.get('stroke_width'),
+                 opacity=c.get('opacity'))
+    if c.get('glyph'):
+        size = c.get('glyph_size', 12)
+        yield text_op(cx, cy + round(size * 0.4), c['glyph'], size, c.get('glyph_fill', 'white'), anchor='middle')
+
+
+@component('paragraph')
+def paragraph(c, page):
+    """Text wrapped to its width, one baseline every ``line_height``"""
+    size = c.get('size', 14)
+    bold = c.get('bold', False)
+    x = c['x']
+    anchor = c.get('anchor')
+    if anchor == 'middle':
+        x += c['width'] // 2
+    lines = wrap(c['text'], c['width'], size=size, weight='bold' if bold else 'normal')
+    for i, line in enumerate(lines):
+        yield text_op(x, c['y'] + size + i * line_height(c), line, size,
+                      c.get('fill', BODY_COLOR), bold, anchor)
+
+
+@component('pill_button')
+def pill_button(c, page):
+    """Fully rounded button, filled or (without a fill) outlined"""
+    x, y, width, height = c['x'], c['y'], c['width'], c['height']
+    size = c.get('size', 16)
+    if c.get('fill'):
+        yield Rect(x, y, width, height, c['fill'], rx=height // 2)
+        color = c.get('color', 'white')
+    else:
+        yield Rect(x, y, width, height, 'none', '#d1d5db', 2, rx=height // 2)
+        color = c.get('color', BODY_COLOR)
+    size = fit_size(c['label'], width - height // 2, size=size)
+    yield text_op(x + width // 2, y + height // 2 + size // 3, c['label'], size, color, anchor='middle')
+
+
+@component('input')
+def text_input(c, page):
+    """Labelled, rounded text input showing its placeholder
+
+    ``icon`` is a glyph at the right end of the field, coloured
+    ``icon_fill``. An ``error`` message is shown on a tinted strip below
+    the field, which takes ERROR_HEIGHT pixels of the box.
+    """
+    x, y, width = c['x'], c['y'], c['width']
+    error = c.get('error')
+    field = c.get('height', 65) - 20 - (ERROR_HEIGHT if error else 0)
+    icon = c.get('icon')
+    yield text_op(x, y + 14, truncate(c['label'], width, size=14), 14, BODY_COLOR)
+    yield Rect(x, y + 20, width, field, '#f9fafb', '#d1d5db', 1, rx=8)
+    yield text_op(x + 15, y + 20 + field // 2 + 5,
+                  truncate(c.get('placeholder', ''), width - (60 if icon else 30), size=14), 14, '#9ca3af')
+    if icon:
+        yield text_op(x + width - 30, y + 20 + field // 2 + 5, icon, 12, c.get('icon_fill', MUTED_COLOR))
+    if error:
+        top = y + 20 + field + 5
+        yield Rect(x, top, width, 20, '#fef2f2')
+        yield text_op(x + 15, top + 13, truncate(error, width - 30, size=12), 12, ERROR_COLOR)
+
+
+@component('checkbox')
+def checkbox(c, page):
+    """Checkbox followed by a label; dict runs of the label are links"""
+    x, y = c['x'], c['y']
+    if c.get('checked'):
+        yield Rect(x, y, 15, 15, LINK_COLOR, rx=3)
+        yield text_op(x + 8, y + 11, '\u2713', 10, 'white', anchor='middle')
+    else:
+        yield Rect(x, y, 15, 15, 'none', '#d1d5db', 1, rx=3)
+    label = c['label']
+    left = x + 25
+    for run in [label] if isinstance(label, str) else label:
+        text = run['link'] if isinstance(run, dict) else run
+        yield text_op(left, y + 12, text, 14, LINK_COLOR if isinstance(run, dict) else BODY_COLOR)
+        left += text_width(text, size=14) + text_width(' ', size=14)
+
+
+@component('bullets')
+def bullets(c, page):
+    """Items marked with a small coloured dot, ``step`` pixels apart"""
+    x, y = c['x'], c['y']
+    step = c.get('step', 30)
+    for i, item in enumerate(c['items']):
+        yield Circle(x + 10, y + 10 + i * step, 4, c.get('color', '#10b981'))
+        yield text_op(x + 25, y + 15 + i * step, item, 14, BODY_COLOR)
+
+
+@component('divider')
+def divider(c, page):
+    """Horizontal rule across the box with an optional label cut into it"""
+    x, y, width = c['x'], c['y'] + c.get('height', 16) // 2, c['width']
+    yield Line(x, y, x + width, y, '#e5e7eb', 1)
+    if c.get('label'):
+        gap = text_width(c['label'], size=12) + 20
+        yield Rect(x + (width - gap) / 2, y - 8, gap, 16, c.get('background', '#ffffff'))
+        yield text_op(x + width // 2, y + 3, c['label'], 12, MUTED_COLOR, anchor='middle')
+
+
+@component('radio_card')
+def radio_card(c, page):
+    """Selectable option card with a radio dot, title and description"""
+    x, y, width, height = c['x'], c['y'], c['width'], c['height']
+    selected = c.get('selected', False)
+    if selected:
+        yield Rect(x, y, width, height, '#f9fafb', LINK_COLOR, 2, rx=8)
+        yield Circle(x + 20, y + 20, 6, LINK_COLOR)
+        yield Circle(x + 20, y + 20, 3, '#ffffff')
+    else:
+        yield Rect(x, y, width, height, '#f9fafb', '#d1d5db', 1, rx=8)
+        yield Circle(x + 20, y + 20, 6, 'none', '#d1d5db', 2)
+    yield text_op(x + 40, y + 25, truncate(c['title'], width - 50, size=14), 14,
+                  HEADING_COLOR if selected else BODY_COLOR)
+    yield text_op(x + 40, y + 45, truncate(c.get('text', ''), width - 50), 12, MUTED_COLOR)
+
+
+def instance_shapes(tagged_ops, min_uses=2):
+    """Move repeated shapes into <defs> and replace them with <use> refs
+
+    ``tagged_ops`` holds (component type, shape) pairs. A rect or circle is
+    a candidate when at least ``min_uses`` shapes on the page are the same
+    apart from position and fill. Whether sharing one pays off depends on
+    the classes the stylesheet then hoists, so candidates are tried one at
+    a time, most used first, and each is kept only if the serialized page
+    gets smaller. Each shared shape becomes one <defs> entry named after
+    the component that first produced it, and every occurrence is emitted
+    as ``<use href x y fill>``.
+    """
+    keys = [_shape_key(op) for kind, op in tagged_ops]
+    counts = {}
+    samples = {}
+    for (kind, op), key in zip(tagged_ops, keys):
+        if key is not None:
+            counts[key] = counts.get(key, 0) + 1
+            samples.setdefault(key, op)
+
+    candidates = [key for key, n in counts.items() if n >= min_uses and _may_save(samples[key], n)]
+    if not candidates:
+        return (), tuple(op for kind, op in tagged_ops)
+
+    lengths = {id(op): len(op.markup('')) for kind, op in tagged_ops}
+    shared = set()
+    best = _plan_size(_instance(tagged_ops, keys, shared), lengths)
+    for key in sorted(candidates, key=counts.get, reverse=True):
+        size = _plan_size(_instance(tagged_ops, keys, shared | {key}), lengths)
+        if size < best:
+            shared.add(key)
+            best = size
+    return _instance(tagged_ops, keys, shared)
+
+
+def _instance(tagged_ops, keys, shared):
+    """(defs, ops) with every shape whose key is in ``shared`` replaced by a <use>"""
+    if not shared:
+        return (), tuple(op for kind, op in tagged_ops)
+    defs = []
+    ids = {}
+    counters = {}
+    ops = []
+    for (kind, op), key in zip(tagged_ops, keys):
+        if key not in shared:
+            ops.append(op)
+            continue
+        shape_id = ids.get(key)
+        if shape_id is None:
+            n = counters.get(kind, 0)
+            counters[kind] = n + 1
+            shape_id = ids[key] = f'{kind}-{n}'.replace('_', '-')
+            defs.append(op.definition(shape_id))
+        x, y = op.position()
+        ops.append(Use(shape_id, x, y, op.fill))
+    return tuple(defs), tuple(ops)
+
+
+def _may_save(sample, uses, id_length=16):
+    """Whether sharing could pay off if every shape kept inline attributes
+
+    An upper bound used to skip hopeless candidates: classes only make
+    the inline shapes shorter and so the saving smaller.
+    """
+    shape_id = 'x' * id_length
+    x, y = sample.position()
+    inline = format_attrs(dict(sample.presentation()))
+    per_use = len(sample.markup(inline)) - len(Use(shape_id, x, y, sample.fill).markup(''))
+    return uses * per_use > len(sample.definition(shape_id).markup(''))
+
+
+def _plan_size(instanced, lengths):
+    """Length of what write_plan emits for (defs, ops) inside the <svg> tag
+
+    A shape's markup is its own text plus its style markup, so shapes
+    whose id is in ``lengths`` (markup length with no style) are not
+    serialized again; only the stylesheet is worked out per trial.
+    """
+    defs, ops = instanced
+    shapes = defs + ops
+    usage = style_usage(shapes)
+    css, style = stylesheet(usage)
+    size = sum(n * len(style[key]) for key, n in usage[0].items())
+    for shape in shapes:
+        n = lengths.get(id(shape))
+        size += len(shape.markup('')) if n is None else n
+    if css:
+        size += len(css) + len('<style></style>')
+    if defs:
+        size += len('<defs></defs>')
+    return size
+
+
+def _shape_key(op):
+    instance_key = getattr(op, 'instance_key', None)
+    return instance_key() if instance_key else None
+
+
+def chrome_fragment(c, page, build):
+    """The cached Fragment of a chrome component, building it on first use
+
+    Chrome builders only read their own parameters and the page size, so
+    those are the key; a header with another title is another fragment.
+    """
+    key = (c['type'], json.dumps(c, sort_keys=True), page['width'], page['height'])
+    fragment = _FRAGMENTS.get(key)
+    if fragment is None:
+        if len(_FRAGMENTS) >= _FRAGMENTS_SIZE:
+            _FRAGMENTS.clear()
+        fragment = _FRAGMENTS[key] = Fragment(key, tuple(build(c, page)))
+    return fragment
+
+
+def _component_ops(c, page, build, instanced):
+    if c['type'] not in CHROME:
+        return build(c, page)
+    fragment = chrome_fragment(c, page, build)
+    # Instancing needs the individual shapes; it still skips the builder
+    return fragment.shapes if instanced else (fragment,)
+
+
+def compile_layout(page, instanced=False):
+    """Compile a page spec into (root attrs, style usage, defs, ops)
+
+    ``defs`` and ``ops`` are tuples of shape records and the style usage
+    feeds svg_writer.stylesheet. Nothing here depends on the theme, so one
+    layout serves every colour scheme of a page. A page's layout tree is
+    solved into positioned components first (see layout.resolve).
+    """
+    tracer = profiling.tracer
+    if tracer is None:
+        page = resolve(page)
+    else:
+        with tracer.span('layout', 'page', page=page.get('name')):
+            page = resolve(page)
+    root = {
+        'width': str(page['width']),
+        'height': str(page['height']),
+        'xmlns': SVG_NS
+    }
+    tagged_ops = []
+    for c in page['components']:
+        try:
+            build = COMPONENTS[c['type']]
+        except KeyError:
+            raise ValueError(f"Unknown component type {c['type']!r} in page {page.get('name')!r}")
+        if tracer is None:
+            tagged_ops.extend((c['type'], op) for op in _component_ops(c, page, build, instanced))
+            continue
+        with tracer.span(c['type'], 'component', page=page.get('name')) as args:
+            ops = list(_component_ops(c, page, build, instanced))
+            args['elements'] = sum(len(op.shapes) if isinstance(op, Fragment) else 1 for op in ops)
+            label = c.get('title') or c.get('label') or c.get('text')
+            if isinstance(label, str):
+                args['label'] = label
+        tagged_ops.extend((c['type'], op) for op in ops)
+    if tracer is None:
+        return _finish_layout(root, tagged_ops, instanced)
+    with tracer.span('instancing and styles', 'page', page=page.get('name')):
+        return _finish_layout(root, tagged_ops, instanced)
+
+
+def _finish_layout(root, tagged_ops, instanced):
+    if instanced:
+        defs, ops = instance_shapes(tagged_ops)
+    else:
+        defs, ops = (), tuple(op for kind, op in tagged_ops)
+    return root, style_usage(defs + ops), defs, ops
+
+
+def compile_page(page, instanced=False, theme=None):
+    """Compile a page spec into (root attrs, stylesheet, defs, ops)"""
+    root, usage, defs, ops = compile_layout(page, instanced)
+    return root, stylesheet(usage, theme), defs, ops
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(key, instanced):
+    return compile_layout(json.loads(key), instanced)
+
+
+def compile_spec(page, instanced=False, theme=None):
+    """Return the render plan for a page spec, reusing its cached layout
+
+    Layouts are keyed on the spec's JSON text, so an unchanged spec is
+    only ever laid out once per process however many themes it is drawn
+    in. Key order is kept because it is significant: it is the order in
+    which charts draw their series.
+    """
+    root, usage, defs, ops = _compile_cached(json.dumps(page), instanced)
+    return root, stylesheet(usage, theme), defs, ops
+
+
+def render_page(page, out=None, instanced=None, cached=True, theme=None):
+    """Replay a page's render plan into ``out`` (or return it as a string)
+
+    Shared shapes are written once into <defs> and referenced with <use>
+    when ``instanced`` is true; by default the page spec's own
+    ``instanced`` flag decides. One-off pages such as table windows pass
+    ``cached=False`` so they don't evict reusable plans. ``theme`` maps
+    the page's colours (see svg_writer.recolor).
+    """
+    if instanced is None:
+        instanced = page.get('instanced', False)
+    tracer = profiling.tracer
+    if tracer is not None:
+        return _traced_render(tracer, page, out, instanced, cached, theme)
+    if cached:
+        plan = compile_spec(page, instanced, theme)
+    else:
+        plan = compile_page(page, instanced, theme)
+    return write_plan(plan, out)
+
+
+def _traced_render(tracer, page, out, instanced, cached, theme):
+    name = page.get('name')
+    with tracer.span(name or 'page', 'render', width=page.get('width')):
+        with tracer.span('compile', 'page', page=name):
+            if cached:
+                plan = compile_spec(page, instanced, theme)
+            else:
+                plan = compile_page(page, instanced, theme)
+        with tracer.span('serialize', 'page', page=name) as args:
+            args['elements'] = len(plan[2]) + len(plan[3])
+            return write_plan(plan, out)
+
+
+def write_plan(plan, out=None):
+    """Serialize a compiled plan: stylesheet, then <defs>, then the shapes"""
+    root, (css, style), defs, ops = plan
+    svg = SvgWriter(out, root)
+    if css:
+        svg.element('style', {}, css)
+    if defs:
+        svg.start('defs', {})
+        svg.shapes(defs, style)
+        svg.end()
+    svg.shapes(ops, style)
+    return svg.close()
+
+
+def spool_page(page, name, directory, minify_output=False, compress=(), **options):
+    """Render a page into spool files in ``directory``; return [(name, path, size)]
+
+    The page streams straight into its file. Only ``minify_output`` and
+    ``compress`` need the whole document, which is then rendered to a
+    string; ``compress`` adds a precompressed sibling per format. The
+    files are meant for a writer's ``commit`` (see output_writer).
+    """
+    files = []
+    try:
+        if not (minify_output or compress):
+            path, f = spool(name, directory)
+            files.append((name, path, 0))
+            with io.TextIOWrapper(f, 'utf-8', newline='') as out:
+                render_page(page, out, **options)
+                out.flush()
+                files[0] = (name, path, f.tell())
+            return files
+        text = render_page(page, None, **options)
+        if minify_output:
+            text = minify(text)
+        data = text.encode('utf-8')
+        _spool_bytes(files, name, directory, data)
+        for fmt in compress:
+            _spool_bytes(files, sibling_name(name, fmt), directory, compress_data(data, fmt))
+        return files
+    except BaseException:
+        discard(files)
+        raise
+
+
+def _spool_bytes(files, name, directory, data):
+    path, f = spool(name, directory)
+    files.append((name, path, len(data)))
+    with f:
+        f.write(data)
+
+
+def load_spec(path):
+    """Load a page spec from a JSON or YAML file"""
+    with open(path, encoding='utf-8') as f:
+        if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise RuntimeError('PyYAML is required to load YAML page specs')
+            return yaml.safe_load(f)
+        return json.load(f)
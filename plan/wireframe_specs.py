@@ -0,0 +1,666 @@
+"""Page specs for the generated wireframes
+
+Each spec is plain JSON-compatible data: a canvas size, an ordered list
+of components understood by wireframe_engine and, for pages that reflow
+with the canvas, a layout tree of boxes solved by layout.py. Cards and buttons carrying a
+``metric`` are filled from dashboard_data statistics when a data source is
+given; charts bound to a metric are only drawn then.
+"""
+import copy
+
+from wireframe_engine import ERROR_HEIGHT
+
+# Canvases narrower than this drop the sidebar
+MOBILE_BREAKPOINT = 600
+
+
+def dashboard_layout(items, sections):
+    """Layout tree of a role dashboard: sidebar, breadcrumb, then sections
+
+    Each section is a list of boxes stacked in the main area; the section
+    title is their first box.
+    """
+    return {'direction': 'row', 'padding': [60, 0, 0, 0], 'children': [
+        {'width': 250, 'hide_below': MOBILE_BREAKPOINT, 'component': {'type': 'sidebar', 'items': items}},
+        {'grow': 1, 'padding': 20, 'gap': 20, 'component': {'type': 'main_area'}, 'children': [
+            {'height': 30, 'component': {'type': 'breadcrumb', 'text': 'Home > Dashboard'}},
+            {'grow': 1, 'padding': [0, 20, 0, 10], 'gap': 30, 'children': [
+                {'gap': 10, 'grow': section[-1].get('grow', 0), 'children': section}
+                for section in sections
+            ]}
+        ]}
+    ]}
+
+
+def section_title(text):
+    return {'height': 20, 'component': {'type': 'section_title', 'text': text}}
+
+
+def stat_cards(cards, min_width=240):
+    return {'direction': 'row', 'wrap': True, 'gap': 20,
+            'each': {'grow': 1, 'min_width': min_width, 'height': 120},
+            'component': {'type': 'stat_cards', 'cards': cards}}
+
+
+def actions_panel(buttons, height=200, fill='#f8f9fa', gap=80, button_width=200, button_height=50):
+    """Panel of equally sized buttons, centred and wrapping on narrow canvases"""
+    return {'height': height, 'padding': 40, 'component': {'type': 'rect', 'fill': fill, 'stroke_width': 2},
+            'justify': 'center', 'children': [
+                {'direction': 'row', 'wrap': True, 'gap': gap, 'line_gap': 20, 'justify': 'center',
+                 'each': {'width': button_width, 'height': button_height},
+                 'component': {'type': 'button_row', 'buttons': buttons}}
+            ]}
+
+
+ADMIN_DASHBOARD = {
+    'name': 'admin-dashboard',
+    'width': 1200,
+    'height': 800,
+    'components': [
+        {'type': 'background'},
+        {'type': 'header', 'title': 'Bug Tracker - Admin Dashboard'},
+        {'type': 'user_menu'}
+    ],
+    'layout': dashboard_layout(['Dashboard', 'Bug Management', 'User Management', 'Project Management'], [
+        [section_title('Statistics Overview'), stat_cards([
+            {'title': 'Total Bugs Count', 'color': '#e3f2fd', 'metric': 'totalBugs'},
+            {'title': 'Active Users Count', 'color': '#e8f5e8', 'metric': 'activeUsers'},
+            {'title': 'Active Projects Count', 'color': '#fff3e0', 'metric': 'activeProjects'}
+        ])],
+        [section_title('Quick Actions'), actions_panel([
+            {'label': 'Create New User', 'color': '#28a745'},
+            {'label': 'Create New Project', 'color': '#17a2b8'},
+            {'label': 'View All Bugs', 'color': '#6f42c1'}
+        ])],
+        [{'direction': 'row', 'wrap': True, 'gap': 40, 'grow': 1, 'children': [
+            {'grow': 1, 'min_width': 300, 'height': 180, 'component': {
+                'type': 'bar_chart', 'title': 'Bugs by Priority', 'metric': 'priorityCounts'}},
+            {'grow': 1, 'min_width': 300, 'height': 180, 'component': {
+                'type': 'donut_chart', 'title': 'Bugs by Status', 'metric': 'statusBreakdown'}}
+        ]}]
+    ])
+}
+
+TESTER_DASHBOARD = {
+    'name': 'tester-dashboard',
+    'width': 1200,
+    'height': 800,
+    'components': [
+        {'type': 'background'},
+        {'type': 'header', 'title': 'Bug Tracker - Tester Dashboard'},
+        {'type': 'user_menu'}
+    ],
+    'layout': dashboard_layout(['Dashboard', 'Report Bug', 'My Bugs'], [
+        [section_title('Personal Statistics'), stat_cards([
+            {'title': 'Bugs Reported by Me', 'color': '#e8f5e8', 'metric': 'bugsReported'},
+            {'title': 'Bug Status Breakdown', 'color': '#fff3e0', 'metric': 'statusBreakdown'}
+        ])],
+        [section_title('Quick Actions'), actions_panel([
+            {'label': 'Report New Bug', 'color': '#28a745'},
+            {'label': 'View My Bugs', 'color': '#17a2b8'}
+        ], gap=100)]
+    ])
+}
+
+DEVELOPER_DASHBOARD = {
+    'name': 'developer-dashboard',
+    'width': 1200,
+    'height': 800,
+    'components': [
+        {'type': 'background'},
+        {'type': 'header', 'title': 'Bug Tracker - Developer Dashboard'},
+        {'type': 'user_menu'}
+    ],
+    'layout': dashboard_layout(['Dashboard', 'Assigned Bugs', 'Work History'], [
+        [section_title('Work Queue Statistics'), stat_cards([
+            {'title': 'Assigned Bugs Count', 'color': '#ffe6e6', 'metric': 'assignedBugs'},
+            {'title': 'Priority Breakdown', 'color': '#e6f3ff', 'metric': 'priorityBreakdown'}
+        ])],
+        [section_title('Quick Actions'), actions_panel([
+            {'label': 'View Assigned Bugs', 'color': '#fd7e14'},
+            {'label': 'Update Bug Status', 'color': '#6f42c1'}
+        ], gap=100)],
+        [section_title('Current Work'),
+         {'height': 180, 'padding': [30, 40, 10, 40], 'gap': 10,
+          'component': {'type': 'rect', 'fill': '#f0f8ff', 'stroke_width': 2}, 'children': [
+              {'direction': 'row', 'wrap': True, 'gap': 50, 'line_gap': 10,
+               'each': {'width': 150, 'height': 30},
+               'component': {'type': 'button_row', 'buttons': [
+                   {'label': 'Critical Priority', 'color': '#dc3545', 'metric': 'priorityBreakdown.critical'},
+                   {'label': 'High Priority', 'color': '#fd7e14', 'metric': 'priorityBreakdown.high'},
+                   {'label': 'Medium Priority', 'color': '#ffc107', 'metric': 'priorityBreakdown.medium'},
+                   {'label': 'Low Priority', 'color': '#007bff', 'metric': 'priorityBreakdown.low'}
+               ]}},
+              {'direction': 'row', 'gap': 40, 'children': [
+                  {'grow': 1, 'height': 100, 'component': {
+                      'type': 'bar_chart', 'title': 'Bugs by Project', 'metric': 'bugsByProject'}},
+                  {'grow': 1, 'height': 100, 'component': {
+                      'type': 'bar_chart', 'title': 'Bugs Reported per Month', 'metric': 'bugsPerMonth',
+                      'limit': 6, 'latest': True}}
+              ]}
+          ]}]
+    ])
+}
+
+
+def form_row(*fields):
+    """Form fields side by side, sharing the width by their grow weights"""
+    return {'direction': 'row', 'wrap': True, 'gap': 40, 'line_gap': 15, 'children': list(fields)}
+
+
+def form_field(label, placeholder, grow=1, height=59):
+    return {'grow': grow, 'min_width': 250, 'height': height,
+            'component': {'type': 'form_field', 'label': label, 'placeholder': placeholder}}
+
+
+def text_box(text, size=12, height=None, **style):
+    return {'height': height or size + 4, 'component': dict({'type': 'text', 'text': text, 'size': size}, **style)}
+
+
+PUBLIC_BUG_REPORT = {
+    'name': 'public-bug-report',
+    'width': 1200,
+    'height': 900,
+    'components': [
+        {'type': 'background'}
+    ],
+    'layout': {'children': [
+        {'height': 80, 'direction': 'row', 'justify': 'end', 'padding': [25, 30, 25, 20],
+         'component': {'type': 'header', 'title': 'XYZ Corp Bug Tracker', 'title_size': 20,
+                       'subtitle': 'Public Bug Report Form'},
+         'children': [
+             {'width': 120, 'height': 30, 'component': {
+                 'type': 'button', 'fill': '#6c757d', 'label': 'Back to Home'}}
+         ]},
+        {'direction': 'row', 'justify': 'center', 'padding': [40, 20, 60, 20], 'children': [
+            {'grow': 1, 'max_width': 1000, 'padding': 20, 'gap': 10, 'component': {'type': 'rect', 'fill': '#ffffff', 'stroke_width': 2},
+             'children': [
+                 text_box('Report a Bug', 24, height=30, bold=True),
+                 text_box('Help us improve our software by reporting bugs you encounter', 14, fill='#666'),
+                 {'padding': [30, 20, 20, 20], 'gap': 15, 'height': 500,
+                  'component': {'type': 'rect', 'fill': '#f8f9fa', 'stroke': '#ddd'}, 'children': [
+                      form_row(form_field('Project *', 'Select a project...', 400),
+                               form_field('Bug Title *', 'Brief description of the bug...', 480)),
+                      form_field('Bug Description *', 'Detailed description of the bug, steps to reproduce, '
+                                 'expected vs actual behavior...', height=124),
+                      text_box('Priority Level', 14, height=24, bold=True),
+                      {'direction': 'row', 'wrap': True, 'gap': 20,
+                       'each': {'width': 200, 'height': 20},
+                       'component': {'type': 'radio_group', 'options': [
+                           {'label': 'Low', 'color': '#007bff'},
+                           {'label': 'Medium', 'color': '#ffc107'},
+                           {'label': 'High', 'color': '#fd7e14'},
+                           {'label': 'Critical', 'color': '#dc3545'}
+                       ]}},
+                      text_box('Reporter Information (Optional)', 16, height=30, bold=True),
+                      form_row(form_field('Your Name', 'Enter your name (optional)...', 400),
+                               form_field('Your Email', 'Enter your email for updates (optional)...', 480)),
+                      {'gap': 10, 'children': [
+                          text_box('* Required fields', fill='#dc3545'),
+                          {'direction': 'row', 'wrap': True, 'gap': 20, 'children': [
+                              {'width': 150, 'height': 45, 'component': {
+                                  'type': 'button', 'fill': '#28a745', 'label': 'Submit Bug Report',
+                                  'size': 14, 'text_dy': 26}},
+                              {'width': 120, 'height': 45, 'component': {
+                                  'type': 'button', 'fill': '#6c757d', 'label': 'Clear Form',
+                                  'size': 14, 'text_dy': 26}}
+                          ]}
+                      ]}
+                  ]},
+                 {'height': 60, 'component': {
+                     'type': 'banner', 'fill': '#d4edda', 'stroke': '#c3e6cb', 'dasharray': '5,5',
+                     'color': '#155724', 'title': 'Success Confirmation Area',
+                     'text': 'Bug report submitted successfully! Bug ID: #12345 | Option to report another bug'}}
+             ]}
+        ]}
+    ]}
+}
+
+# Public site pages: homepage, login and signup share the navbar and footer
+
+MENU_ICON = '\u2630'
+EYE_ICON = '\U0001f441'
+CHECK_ICON = '\u2713'
+OPEN_ICON = '\u25cb'
+
+def site_layout(main, footer):
+    """Layout tree of a public site page: content, then the footer at the bottom"""
+    return {'padding': [80, 0, 0, 0], 'children': [dict(main, grow=1), footer]}
+
+
+def site_footer(text):
+    return {'height': 80, 'padding': [31, 20, 0, 20],
+            'component': {'type': 'rect', 'fill': '#f9fafb', 'stroke': '#e5e7eb'},
+            'children': [text_box(text, 14, height=14, fill='#6b7280', anchor='middle')]}
+
+
+def paragraph(text, size=14, fill='#6b7280', **style):
+    return {'component': dict({'type': 'paragraph', 'text': text, 'size': size, 'fill': fill}, **style)}
+
+
+def heading(text, size=32, fill='#111827'):
+    return text_box(text, size, height=size, bold=True, fill=fill)
+
+
+def pill(label, width=None, height=50, fill=None, size=16):
+    box = {'height': height, 'component': {'type': 'pill_button', 'label': label, 'fill': fill, 'size': size}}
+    if width:
+        box['width'] = width
+    return box
+
+
+def text_input(label, placeholder, icon=None, icon_fill=None, **box):
+    component = {'type': 'input', 'label': label, 'placeholder': placeholder}
+    if icon:
+        component['icon'] = icon
+    if icon_fill:
+        component['icon_fill'] = icon_fill
+    return dict({'height': 65, 'component': component}, **box)
+
+
+def info_card(title, text, color, icon=24, fill='#ffffff', stroke='#e5e7eb', rx=12, title_size=16,
+              text_size=14, title_fill='#111827', text_fill='#6b7280', glyph=None, glyph_size=12, **box):
+    """Rounded card with a coloured icon dot, showing ``glyph``, beside a title and description"""
+    dot = {'type': 'circle', 'fill': color}
+    if glyph:
+        dot.update(glyph=glyph, glyph_size=glyph_size)
+    return dict({'direction': 'row', 'align': 'start', 'gap': 15, 'padding': 18,
+                 'component': {'type': 'rect', 'fill': fill, 'stroke': stroke, 'rx': rx},
+                 'children': [
+                     {'width': icon, 'height': icon, 'component': dot},
+                     {'grow': 1, 'gap': 8, 'children': [
+                         text_box(title, title_size, height=title_size, bold=title_size >= 16, fill=title_fill),
+                         paragraph(text, text_size, text_fill, line_height=round(text_size * 1.45))
+                     ]}
+                 ]}, **box)
+
+
+def stat_tile(value, label, note, color):
+    return {'width': 200, 'height': 100, 'padding': [20, 10, 12, 10], 'gap': 8,
+            'component': {'type': 'rect', 'fill': '#ffffff', 'stroke': '#e5e7eb', 'rx': 12},
+            'children': [
+                text_box(value, 28, height=28, bold=True, fill=color, anchor='middle'),
+                text_box(label, 14, height=14, fill='#6b7280', anchor='middle'),
+                text_box(note, 12, height=12, fill='#6b7280', anchor='middle')
+            ]}
+
+
+def mini_stat(label, value, fill, color):
+    return {'width': 100, 'height': 50, 'padding': [10, 4, 10, 4], 'gap': 10,
+            'component': {'type': 'rect', 'fill': fill, 'stroke': None, 'rx': 8},
+            'children': [
+                text_box(label, 10, height=10, fill=color, anchor='middle'),
+                text_box(value, 16, height=12, bold=True, fill=color, anchor='middle')
+            ]}
+
+
+def section(title, *boxes):
+    return {'gap': 24, 'children': [heading(title)] + list(boxes)}
+
+
+def footer_links(title, links):
+    return {'width': 130, 'gap': 10, 'children': [text_box(title, 16, height=16, fill='#ffffff')] + [
+        text_box(link, 14, height=14, fill='#9ca3af') for link in links]}
+
+
+HOMEPAGE = {
+    'name': 'homepage',
+    'width': 1200,
+    'height': 1400,
+    'components': [
+        {'type': 'background', 'fill': '#fafafa'},
+        {'type': 'navbar', 'links': ['Home', 'About', 'Blog', 'Contact'], 'menu_icon': MENU_ICON},
+        {'type': 'circle', 'cx': 950, 'cy': 200, 'r': 60, 'fill': '#f3f4f6', 'opacity': 0.4},
+        {'type': 'circle', 'cx': 1050, 'cy': 300, 'r': 30, 'fill': '#dbeafe', 'opacity': 0.6},
+        {'type': 'circle', 'cx': 150, 'cy': 1200, 'r': 40, 'fill': '#fef3c7', 'opacity': 0.5}
+    ],
+    'layout': site_layout(
+        {'padding': [40, 60, 40, 60], 'gap': 40, 'children': [
+            {'direction': 'row', 'wrap': True, 'align': 'start', 'gap': 60, 'line_gap': 30, 'children': [
+                {'grow': 1, 'min_width': 320, 'gap': 30, 'children': [
+                    {'gap': 12, 'children': [
+                        heading('Welcome to XYZ Corp', 42),
+                        heading('Bug Tracker', 42, '#2563eb'),
+                        text_box('Streamline Development, Eliminate Bugs', 24, height=30, fill='#6b7280'),
+                        paragraph('Transform your development workflow with our intuitive bug tracking '
+                                  'system designed for modern teams.', 16, line_height=25)
+                    ]},
+                    {'direction': 'row', 'wrap': True, 'gap': 20, 'children': [
+                        pill('Report a Bug', 180, 60, '#2563eb', 18),
+                        pill('Login', 140, 60, size=18),
+                        pill('Register', 140, 60, size=18)
+                    ]}
+                ]},
+                {'width': 480, 'height': 200,
+                 'component': {'type': 'rect', 'fill': '#ffffff', 'stroke': '#e5e7eb', 'rx': 16},
+                 'children': [
+                     {'height': 50, 'padding': [0, 24, 20, 24],
+                      'component': {'type': 'rect', 'fill': '#f9fafb', 'stroke': None, 'rx': 16},
+                      'children': [text_box('Live Dashboard Preview', 14, height=30, fill='#374151')]},
+                     {'padding': [20, 24, 20, 24], 'gap': 20, 'children': [
+                         {'direction': 'row', 'gap': 16, 'children': [
+                             mini_stat('Active Bugs', '23', '#dbeafe', '#1e40af'),
+                             mini_stat('Resolved', '189', '#dcfce7', '#166534'),
+                             mini_stat('In Progress', '12', '#fef3c7', '#92400e')
+                         ]},
+                         {'height': 40, 'direction': 'row', 'align': 'center', 'gap': 9, 'padding': [0, 16, 0, 13],
+                          'component': {'type': 'rect', 'fill': '#f8fafc', 'stroke': None, 'rx': 4},
+                          'children': [
+                              {'width': 6, 'height': 6, 'component': {'type': 'circle', 'fill': '#ef4444'}},
+                              {'grow': 1, 'height': 13, 'component': {
+                                  'type': 'text', 'text': 'Critical: Login validation error', 'size': 10,
+                                  'fill': '#374151'}}
+                          ]}
+                     ]}
+                 ]}
+            ]},
+            section('Why Choose Our Platform?', {'direction': 'row', 'wrap': True, 'gap': 20, 'children': [
+                info_card('Easy Bug Reporting', 'Submit bugs quickly with our intuitive forms. Attach files, '
+                          'screenshots, and detailed descriptions. Automatic priority assignment and routing.',
+                          '#3b82f6', icon=40, title_size=18, glyph='\U0001f41e', glyph_size=16, grow=1,
+                          min_width=300, height=140),
+                info_card('Team Collaboration', 'Real-time collaboration between teams. Assign bugs to '
+                          'developers instantly. Track progress with live updates.',
+                          '#10b981', icon=40, title_size=18, glyph='\U0001f465', glyph_size=16, grow=1,
+                          min_width=300, height=140),
+                info_card('Advanced Analytics', 'Comprehensive reporting and insights. Track resolution '
+                          'times and patterns. Performance metrics and trends.',
+                          '#f59e0b', icon=40, title_size=18, glyph='\U0001f4ca', glyph_size=16, grow=1,
+                          min_width=300, height=140)
+            ]}),
+            section('Platform Statistics', {'direction': 'row', 'wrap': True, 'gap': 20, 'children': [
+                stat_tile('10,000+', 'Bugs Resolved', 'This Year', '#2563eb'),
+                stat_tile('500+', 'Active Users', 'Daily', '#10b981'),
+                stat_tile('99.9%', 'Uptime', 'Reliability', '#f59e0b'),
+                stat_tile('24/7', 'Support', 'Available', '#8b5cf6')
+            ]}),
+            section('What Our Users Say', {'direction': 'row', 'wrap': True, 'gap': 40, 'children': [
+                {'grow': 1, 'min_width': 320, 'height': 120, 'padding': 20, 'gap': 14,
+                 'component': {'type': 'rect', 'fill': '#ffffff', 'stroke': '#e5e7eb', 'rx': 12},
+                 'children': [
+                     paragraph('"XYZ Corp Bug Tracker has revolutionized our development workflow. The '
+                               'intuitive interface and powerful features have reduced our bug resolution '
+                               'time by 60%. Highly recommended!"', 14, '#374151', line_height=20),
+                     text_box('- Sarah Johnson, Lead Developer', 12, height=12, bold=True, fill='#2563eb')
+                 ]},
+                {'grow': 1, 'min_width': 320, 'height': 120, 'padding': 20, 'gap': 14,
+                 'component': {'type': 'rect', 'fill': '#ffffff', 'stroke': '#e5e7eb', 'rx': 12},
+                 'children': [
+                     paragraph('"The collaboration features are outstanding. Our QA and development teams '
+                               'can now work seamlessly together. The real-time updates keep everyone in '
+                               'the loop."', 14, '#374151', line_height=20),
+                     text_box('- Mike Chen, QA Manager', 12, height=12, bold=True, fill='#10b981')
+                 ]}
+            ]}),
+            section('About XYZ Corp', {
+                'padding': [22, 30, 22, 30],
+                'component': {'type': 'rect', 'fill': '#f8fafc', 'stroke': '#e2e8f0', 'rx': 12},
+                'children': [paragraph(
+                    'Founded in 2020, XYZ Corp has been at the forefront of development tools innovation. '
+                    'Our mission is to streamline software development processes and eliminate the friction '
+                    'in bug tracking and resolution. Trusted by over 1000+ companies worldwide.',
+                    16, '#374151', line_height=25)]
+            })
+        ]},
+        {'padding': [30, 60, 30, 60], 'gap': 30, 'component': {'type': 'rect', 'fill': '#1f2937', 'stroke': None},
+         'children': [
+             {'direction': 'row', 'wrap': True, 'gap': 30, 'children': [
+                 {'width': 300, 'gap': 12, 'children': [
+                     heading('XYZ Corp Bug Tracker', 18, '#ffffff'),
+                     paragraph('Streamlining development workflows worldwide', 14, '#9ca3af')
+                 ]},
+                 footer_links('Quick Links', ['About Us', 'Blog', 'Contact']),
+                 footer_links('Support', ['Documentation', 'Help Center', 'Contact Support']),
+                 footer_links('Connect', ['Twitter', 'LinkedIn', 'GitHub'])
+             ]},
+             paragraph('\u00a9 2025 XYZ Corp. All rights reserved. | Privacy Policy | Terms of Service', 12)
+         ]})
+}
+
+LOGIN = {
+    'name': 'login',
+    'width': 1200,
+    'height': 800,
+    'components': [
+        {'type': 'background', 'fill': '#fafafa'},
+        {'type': 'navbar', 'links': ['\u2190 Back to Home'], 'active': None, 'menu_icon': MENU_ICON},
+        {'type': 'circle', 'cx': 200, 'cy': 600, 'r': 40, 'fill': '#dbeafe', 'opacity': 0.5},
+        {'type': 'circle', 'cx': 1000, 'cy': 200, 'r': 60, 'fill': '#f3f4f6', 'opacity': 0.4},
+        {'type': 'circle', 'cx': 1100, 'cy': 600, 'r': 30, 'fill': '#fef3c7', 'opacity': 0.6}
+    ],
+    'layout': site_layout(
+        {'direction': 'row', 'wrap': True, 'align': 'start', 'gap': 120, 'line_gap': 40,
+         'padding': [70, 100, 40, 80], 'children': [
+             {'grow': 1, 'min_width': 300, 'gap': 16, 'children': [
+                 heading('Welcome Back', 36),
+                 text_box('Sign in to your account', 24, height=34, fill='#6b7280'),
+                 paragraph('Access your dashboard and manage bugs efficiently with our powerful tracking tools.',
+                           16, line_height=25),
+                 {'padding': [24, 0, 0, 0], 'children': [
+                     {'component': {'type': 'bullets', 'items': [
+                         'Real-time bug tracking', 'Team collaboration tools',
+                         'Advanced analytics dashboard', 'Priority-based workflow'
+                     ]}}
+                 ]}
+             ]},
+             {'width': 450, 'padding': 40, 'gap': 20,
+              'component': {'type': 'rect', 'fill': '#ffffff', 'stroke': '#e5e7eb', 'rx': 16},
+              'children': [
+                  text_box('Sign In', 24, height=24, bold=True, fill='#111827', anchor='middle'),
+                  text_box('Enter your credentials to access your account', 14, height=14, fill='#6b7280',
+                           anchor='middle'),
+                  text_input('Username or Email', 'Enter your username or email'),
+                  text_input('Password', 'Enter your password', EYE_ICON),
+                  {'direction': 'row', 'height': 15, 'children': [
+                      {'grow': 1, 'component': {'type': 'checkbox', 'label': 'Remember me'}},
+                      {'width': 130, 'height': 12, 'component': {
+                          'type': 'text', 'text': 'Forgot password?', 'size': 14, 'fill': '#2563eb',
+                          'anchor': 'end'}}
+                  ]},
+                  pill('Sign In', fill='#2563eb'),
+                  {'height': 16, 'component': {'type': 'divider', 'label': 'OR'}},
+                  {'gap': 8, 'children': [
+                      text_box("Don't have an account?", 14, height=14, fill='#6b7280', anchor='middle'),
+                      text_box('Create new account', 14, height=14, fill='#2563eb', anchor='middle')
+                  ]}
+              ]}
+         ]},
+        site_footer('\u00a9 2025 XYZ Corp. Secure login for development teams.'))
+}
+
+SIGNUP = {
+    'name': 'signup',
+    'width': 1200,
+    'height': 900,
+    'components': [
+        {'type': 'background', 'fill': '#fafafa'},
+        {'type': 'navbar', 'links': ['\u2190 Back to Home'], 'active': None, 'menu_icon': MENU_ICON},
+        {'type': 'circle', 'cx': 150, 'cy': 750, 'r': 30, 'fill': '#dbeafe', 'opacity': 0.5},
+        {'type': 'circle', 'cx': 1050, 'cy': 200, 'r': 50, 'fill': '#f3f4f6', 'opacity': 0.4},
+        {'type': 'circle', 'cx': 1150, 'cy': 700, 'r': 25, 'fill': '#fef3c7', 'opacity': 0.6}
+    ],
+    'layout': site_layout(
+        {'direction': 'row', 'wrap': True, 'align': 'start', 'gap': 100, 'line_gap': 40,
+         'padding': [40, 100, 40, 80], 'children': [
+             {'grow': 1, 'min_width': 300, 'gap': 16, 'children': [
+                 heading('Join Our Team', 36),
+                 text_box('Create your account', 24, height=34, fill='#6b7280'),
+                 paragraph('Get started with XYZ Corp Bug Tracker and streamline your development workflow.',
+                           16, line_height=25),
+                 {'padding': [24, 0, 0, 0], 'gap': 16, 'children': [
+                     heading('Available Roles:', 18),
+                     info_card('Tester', 'Report bugs, track issues, and collaborate with developers to '
+                               'ensure quality software delivery.', '#3b82f6', glyph='\U0001f50d'),
+                     info_card('Developer', 'Resolve assigned bugs, update status, and manage your '
+                               'development workflow efficiently.', '#10b981', glyph='\U0001f4bb')
+                 ]},
+                 info_card('Secure Registration', 'Your data is protected with enterprise-grade security',
+                           '#0ea5e9', icon=16, fill='#f0f9ff', stroke='#bae6fd', rx=8, title_size=14,
+                           text_size=12, title_fill='#0c4a6e', text_fill='#075985', glyph='\U0001f512',
+                           glyph_size=10)
+             ]},
+             {'width': 520, 'gap': 20, 'children': [
+                 {'padding': 40, 'gap': 18,
+                  'component': {'type': 'rect', 'fill': '#ffffff', 'stroke': '#e5e7eb', 'rx': 16},
+                  'children': [
+                      text_box('Create Account', 24, height=24, bold=True, fill='#111827', anchor='middle'),
+                      text_box('Fill in your details to get started', 14, height=14, fill='#6b7280',
+                               anchor='middle'),
+                      {'direction': 'row', 'wrap': True, 'gap': 20, 'line_gap': 18, 'children': [
+                          text_input('First Name *', 'Enter first name', grow=1, min_width=180),
+                          text_input('Last Name *', 'Enter last name', grow=1, min_width=180)
+                      ]},
+                      text_input('Username *', 'Choose a unique username', CHECK_ICON, '#10b981'),
+                      text_input('Email Address *', 'Enter your email address'),
+                      {'direction': 'row', 'wrap': True, 'gap': 20, 'line_gap': 18, 'children': [
+                          text_input('Password *', 'Create password', EYE_ICON, grow=1, min_width=180),
+                          text_input('Confirm Password *', 'Confirm password', EYE_ICON, grow=1, min_width=180)
+                      ]},
+                      {'gap': 8, 'children': [
+                          text_box('Password must contain:', 12, height=12, fill='#6b7280'),
+                          {'direction': 'row', 'wrap': True, 'gap': 20, 'line_gap': 8, 'children': [
+                              {'width': 130, 'height': 11, 'component': {
+                                  'type': 'text', 'text': CHECK_ICON + ' At least 8 characters', 'size': 11, 'fill': '#10b981'}},
+                              {'width': 130, 'height': 11, 'component': {
+                                  'type': 'text', 'text': OPEN_ICON + ' One uppercase letter', 'size': 11, 'fill': '#6b7280'}},
+                              {'width': 130, 'height': 11, 'component': {
+                                  'type': 'text', 'text': OPEN_ICON + ' One number', 'size': 11, 'fill': '#6b7280'}}
+                          ]}
+                      ]},
+                      {'gap': 10, 'children': [
+                          text_box('Select Role *', 14, height=14, fill='#374151'),
+                          {'direction': 'row', 'wrap': True, 'gap': 20, 'line_gap': 10, 'children': [
+                              {'grow': 1, 'min_width': 180, 'height': 60, 'component': {
+                                  'type': 'radio_card', 'title': 'Tester', 'text': 'QA and testing role',
+                                  'selected': True}},
+                              {'grow': 1, 'min_width': 180, 'height': 60, 'component': {
+                                  'type': 'radio_card', 'title': 'Developer', 'text': 'Development role'}}
+                          ]}
+                      ]},
+                      {'height': 15, 'component': {'type': 'checkbox', 'checked': True, 'label': [
+                          'I agree to the', {'link': 'Terms of Service'}, 'and', {'link': 'Privacy Policy'}
+                      ]}},
+                      pill('Create Account', fill='#2563eb')
+                  ]},
+                 {'gap': 8, 'children': [
+                     text_box('Already have an account?', 14, height=14, fill='#6b7280', anchor='middle'),
+                     text_box('Sign in here', 14, height=14, fill='#2563eb', anchor='middle')
+                 ]}
+             ]}
+         ]},
+        site_footer('\u00a9 2025 XYZ Corp. Join thousands of developers using our platform.'))
+}
+
+
+
+def error_state(page, errors):
+    """A form page showing validation errors, as its own page
+
+    ``errors`` maps input labels to the message shown under that input;
+    each input's box grows to make room for it.
+    """
+    page = copy.deepcopy(page)
+    page['name'] += '-error'
+
+    def visit(box):
+        component = box.get('component') or {}
+        if component.get('type') == 'input' and component['label'] in errors:
+            component['error'] = errors[component['label']]
+            box['height'] = box.get('height', 65) + ERROR_HEIGHT
+        for child in box.get('children', ()):
+            visit(child)
+    visit(page['layout'])
+    return page
+
+
+LOGIN_ERROR = error_state(LOGIN, {'Password': 'Invalid username or password'})
+SIGNUP_ERROR = error_state(SIGNUP, {'Email Address *': 'Email address is already registered'})
+
+SITE_SPECS = [HOMEPAGE, LOGIN, SIGNUP, LOGIN_ERROR, SIGNUP_ERROR]
+
+# Bug list pages; bug_table.write_table_pages fills the table one window
+# of rows per page
+BUG_MANAGEMENT = {
+    'name': 'bug-management',
+    'width': 1200,
+    'height': 800,
+    'components': [
+        {'type': 'background'},
+        {'type': 'header', 'title': 'Bug Tracker - Bug Management'},
+        {'type': 'user_menu'},
+        {'type': 'sidebar', 'active': 1,
+         'items': ['Dashboard', 'Bug Management', 'User Management', 'Project Management']},
+        {'type': 'main_area'},
+        {'type': 'breadcrumb', 'text': 'Home > Bug Management'},
+        {'type': 'section_title', 'x': 280, 'y': 140, 'text': 'All Bugs'},
+        {'type': 'bug_table', 'x': 270, 'y': 160, 'columns': [
+            {'key': 'id', 'label': 'ID', 'width': 80},
+            {'key': 'title', 'label': 'Title', 'width': 320},
+            {'key': 'status', 'label': 'Status', 'width': 110, 'badge': True},
+            {'key': 'priority', 'label': 'Priority', 'width': 110, 'badge': True},
+            {'key': 'assignedTo', 'label': 'Assigned To', 'width': 170},
+            {'key': 'created', 'label': 'Created', 'width': 120}
+        ]}
+    ]
+}
+
+ASSIGNED_BUGS = {
+    'name': 'assigned-bugs',
+    'width': 1200,
+    'height': 800,
+    'components': [
+        {'type': 'background'},
+        {'type': 'header', 'title': 'Bug Tracker - Assigned Bugs'},
+        {'type': 'user_menu'},
+        {'type': 'sidebar', 'active': 1, 'items': ['Dashboard', 'Assigned Bugs', 'Work History']},
+        {'type': 'main_area'},
+        {'type': 'breadcrumb', 'text': 'Home > Assigned Bugs'},
+        {'type': 'section_title', 'x': 280, 'y': 140, 'text': 'Assigned Bugs'},
+        {'type': 'bug_table', 'x': 270, 'y': 160, 'assigned_only': True, 'columns': [
+            {'key': 'id', 'label': 'ID', 'width': 80},
+            {'key': 'title', 'label': 'Title', 'width': 390},
+            {'key': 'status', 'label': 'Status', 'width': 120, 'badge': True},
+            {'key': 'priority', 'label': 'Priority', 'width': 120, 'badge': True},
+            {'key': 'created', 'label': 'Created', 'width': 200}
+        ]}
+    ]
+}
+
+TABLE_SPECS = [BUG_MANAGEMENT, ASSIGNED_BUGS]
+
+PAGE_SPECS = [ADMIN_DASHBOARD, TESTER_DASHBOARD, DEVELOPER_DASHBOARD, PUBLIC_BUG_REPORT] + SITE_SPECS
+
+# Role pages of the variant matrix (see variants.py)
+ROLE_SPECS = {
+    'admin': ADMIN_DASHBOARD,
+    'tester': TESTER_DASHBOARD,
+    'developer': DEVELOPER_DASHBOARD,
+    'public': PUBLIC_BUG_REPORT,
+}
+
+# Viewport name -> canvas width; the page height is kept
+VIEWPORTS = {
+    'mobile': 375,
+    'tablet': 768,
+    'desktop': 1200,
+}
+
+# Colour maps per theme, kept separate for shape fills, strokes and text
+THEMES = {
+    'light': {},
+    'dark': {
+        'fill': {
+            'white': '#1e1e1e', '#ffffff': '#1e1e1e', '#f8f9fa': '#2b2f33', '#f1f3f4': '#25282b',
+            '#e9ecef': '#343a40', '#343a40': '#121212', '#ddd': '#444',
+            '#e3f2fd': '#1c2b3a', '#e8f5e8': '#1e2e1e', '#fff3e0': '#33291a',
+            '#ffe6e6': '#3a1f1f', '#e6f3ff': '#1a2a3a', '#f0f8ff': '#1b232b', '#d4edda': '#1e3323',
+        },
+        'stroke': {
+            'black': '#6c757d', '#ccc': '#495057', '#ddd': '#495057', '#dee2e6': '#343a40',
+            '#eee': '#343a40', '#c3e6cb': '#2f5a3a',
+        },
+        'text': {
+            'black': '#e9ecef', '#666': '#adb5bd', '#999': '#868e96', '#155724': '#a3d9b1',
+        },
+    },
+}